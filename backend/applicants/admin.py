@@ -1,15 +1,99 @@
 from django.contrib import admin
-from .models import Applicant, Academic
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
+
+from .models import (
+    Applicant, Academic, PendingDocumentDeletion, ApplicantDocument, DuplicateCandidate, ArchivedApplicant,
+    AuditEntry
+)
+from .cache import get_filter_choices
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses PostgreSQL's planner estimate for unfiltered
+    changelists instead of an exact COUNT(*) over the whole table.
+    Small tables and filtered querysets are still counted exactly.
+    """
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = self.object_list.query
+        if connection.vendor == 'postgresql' and not query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.exact_count_threshold:
+                return row[0]
+        return super().count
+
+
+class CachedValuesListFilter(admin.SimpleListFilter):
+    """
+    List filter whose choices come from the cached distinct values of a
+    field rather than a DISTINCT query on every changelist load.
+    """
+    field_name = None
+
+    def lookups(self, request, model_admin):
+        return [(value, value) for value in get_filter_choices(self.field_name)]
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(**{self.field_name: self.value()})
+        return queryset
+
+
+class CountryListFilter(CachedValuesListFilter):
+    title = 'country'
+    parameter_name = 'country'
+    field_name = 'country'
+
+
+class TestTypeListFilter(CachedValuesListFilter):
+    title = 'test type'
+    parameter_name = 'test_type'
+    field_name = 'test_type'
 
 
 class AcademicInline(admin.TabularInline):
+    """
+    Academic records are shown `per_page` at a time; the page is picked with
+    the `academics_page` query parameter (see ApplicantAdmin.academic_pages).
+    """
     model = Academic
     extra = 1
+    per_page = 20
+    show_change_link = True
     fields = (
         'degree_level', 'degree_title', 'institution', 
         'passed_year', 'course_start_date', 'course_end_date', 'obtained_mark'
     )
 
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        object_id = request.resolver_match.kwargs.get('object_id') if request.resolver_match else None
+        if not object_id:
+            return qs
+
+        try:
+            page = max(int(request.GET.get('academics_page', 1)), 1)
+        except ValueError:
+            page = 1
+        start = (page - 1) * self.per_page
+
+        page_ids = list(
+            qs.filter(applicant_id=object_id)
+            .values_list('pk', flat=True)[start:start + self.per_page]
+        )
+        return qs.filter(pk__in=page_ids)
+
 
 @admin.register(Applicant)
 class ApplicantAdmin(admin.ModelAdmin):
@@ -17,9 +101,13 @@ class ApplicantAdmin(admin.ModelAdmin):
         'full_name', 'email', 'interested_course', 
         'test_type', 'overall_score', 'created_by', 'created_at'
     )
-    list_filter = ('interested_course', 'test_type', 'country', 'created_at')
-    search_fields = ('full_name', 'email', 'phone_number', 'created_by__full_name')
-    readonly_fields = ('created_at', 'updated_at')
+    list_filter = ('interested_course', TestTypeListFilter, CountryListFilter, 'created_at')
+    # exact / prefix lookups only, so the expression indexes on the
+    # upper-cased columns can be used instead of full-table LIKE scans
+    search_fields = ('=email', '^full_name', '^phone_number')
+    readonly_fields = ('created_at', 'updated_at', 'academic_pages')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     
     fieldsets = (
         ('Created By', {
@@ -40,6 +128,9 @@ class ApplicantAdmin(admin.ModelAdmin):
         ('Document', {
             'fields': ('document',)
         }),
+        ('Academic Records', {
+            'fields': ('academic_pages',)
+        }),
         ('Timestamps', {
             'fields': ('created_at', 'updated_at')
         }),
@@ -51,6 +142,20 @@ class ApplicantAdmin(admin.ModelAdmin):
         qs = super().get_queryset(request)
         return qs.select_related('created_by')
 
+    @admin.display(description='Pages')
+    def academic_pages(self, obj):
+        if not obj.pk:
+            return '-'
+        per_page = AcademicInline.per_page
+        total = obj.academics.count()
+        if total <= per_page:
+            return f'{total} record(s)'
+        pages = range(1, (total + per_page - 1) // per_page + 1)
+        links = format_html_join(
+            ' ', '<a href="?academics_page={0}">{0}</a>', ((page,) for page in pages)
+        )
+        return format_html('{} records, {} per page: {}', total, per_page, links)
+
 
 @admin.register(Academic)
 class AcademicAdmin(admin.ModelAdmin):
@@ -82,4 +187,56 @@ class AcademicAdmin(admin.ModelAdmin):
     
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.select_related('applicant')
\ No newline at end of file
+        return qs.select_related('applicant')
+
+
+@admin.register(PendingDocumentDeletion)
+class PendingDocumentDeletionAdmin(admin.ModelAdmin):
+    list_display = ('name', 'attempts', 'created_at')
+    readonly_fields = ('name', 'attempts', 'last_error', 'created_at')
+
+
+@admin.register(ApplicantDocument)
+class ApplicantDocumentAdmin(admin.ModelAdmin):
+    list_display = ('applicant', 'status', 'page_count', 'is_encrypted', 'attempts', 'processed_at')
+    list_filter = ('status', 'is_encrypted')
+    readonly_fields = (
+        'applicant', 'document_name', 'status', 'attempts', 'error',
+        'is_encrypted', 'page_count', 'text', 'created_at', 'updated_at', 'processed_at'
+    )
+    list_select_related = ('applicant',)
+
+
+@admin.register(DuplicateCandidate)
+class DuplicateCandidateAdmin(admin.ModelAdmin):
+    list_display = ('applicant', 'duplicate', 'score', 'created_at')
+    readonly_fields = ('applicant', 'duplicate', 'score', 'reasons', 'created_at')
+    list_select_related = ('applicant', 'duplicate')
+    ordering = ('-score',)
+
+
+@admin.register(ArchivedApplicant)
+class ArchivedApplicantAdmin(admin.ModelAdmin):
+    list_display = ('full_name', 'email', 'interested_course', 'created_at', 'archived_at')
+    search_fields = ('=email', '^full_name')
+    list_select_related = ('created_by',)
+    show_full_result_count = False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(AuditEntry)
+class AuditEntryAdmin(admin.ModelAdmin):
+    list_display = ('applicant_id', 'object_type', 'object_id', 'action', 'actor_id', 'created_at')
+    list_filter = ('object_type', 'action')
+    search_fields = ('=applicant_id',)
+    readonly_fields = ('applicant_id', 'object_type', 'object_id', 'action', 'changes', 'actor_id', 'created_at')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,66 @@
+"""
+Dashboard counters, shared by the analytics endpoint and the event stream.
+"""
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Applicant, ArchivedApplicant
+from .permissions import scope_applicants
+
+
+def _start_of_month():
+    now = timezone.now()
+    return now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _counters(total, this_month):
+    completed = 0
+    pending = total - completed
+
+    return {
+        "total_applicants": total,
+        "this_month": this_month,
+        "completed_applications": completed,
+        "pending_applications": pending,
+    }
+
+
+def empty_analytics():
+    return _counters(0, 0)
+
+
+def get_analytics(include_archived=False, user=None):
+    start_this_month = _start_of_month()
+
+    models = [Applicant, ArchivedApplicant] if include_archived else [Applicant]
+    querysets = [
+        model.objects.all() if user is None else scope_applicants(model.objects.all(), user)
+        for model in models
+    ]
+    total = sum(queryset.count() for queryset in querysets)
+    this_month = sum(queryset.filter(created_at__gte=start_this_month).count() for queryset in querysets)
+
+    return _counters(total, this_month)
+
+
+def get_analytics_by_owner():
+    """
+    Counters for the whole table and per owner, from one grouped query.
+    Owner ids are strings so the result survives a JSON round trip.
+    """
+    rows = (
+        Applicant.objects.order_by()
+        .values('created_by_id')
+        .annotate(total=Count('id'), this_month=Count('id', filter=Q(created_at__gte=_start_of_month())))
+    )
+    by_owner = {
+        str(row['created_by_id']): _counters(row['total'], row['this_month'])
+        for row in rows
+    }
+    return {
+        'all': _counters(
+            sum(counters['total_applicants'] for counters in by_owner.values()),
+            sum(counters['this_month'] for counters in by_owner.values()),
+        ),
+        'by_owner': by_owner,
+    }
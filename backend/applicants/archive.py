@@ -0,0 +1,104 @@
+"""
+Hot/cold archival of applicants.
+
+Applicants not updated for `ARCHIVE_AFTER_DAYS` are moved, with their
+academic records, into `archived_applicants` / `archived_academics` in
+batched transactions, so the hot `applicants` table (and every list, count
+and search over it) only holds active applications. Archived rows keep
+their ids and can be restored unchanged.
+
+Leaving the hot table goes through the normal delete signals, so change
+feed and event stream clients see an archived applicant as deleted. The
+stored document is kept. Restoring drops that tombstone, so the feed reports
+the applicant as changed only, and queues the document for reprocessing.
+"""
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .documents import queue_document_processing
+from .models import Applicant, Academic, ApplicantTombstone, ArchivedApplicant, ArchivedAcademic
+
+logger = logging.getLogger(__name__)
+
+APPLICANT_FIELDS = [field.attname for field in Applicant._meta.concrete_fields]
+ACADEMIC_FIELDS = [field.attname for field in Academic._meta.concrete_fields]
+
+
+def include_archived(params):
+    return params.get('include_archived') in ('1', 'true')
+
+
+def archive_cutoff(days=None):
+    return timezone.now() - timedelta(days=settings.ARCHIVE_AFTER_DAYS if days is None else days)
+
+
+def _archive_ids(ids):
+    now = timezone.now()
+    ArchivedApplicant.objects.bulk_create(
+        ArchivedApplicant(**values, archived_at=now)
+        for values in Applicant.objects.filter(id__in=ids).values(*APPLICANT_FIELDS)
+    )
+    ArchivedAcademic.objects.bulk_create(
+        ArchivedAcademic(**values)
+        for values in Academic.objects.filter(applicant_id__in=ids).values(*ACADEMIC_FIELDS)
+    )
+    Applicant.objects.filter(id__in=ids).delete()
+
+
+def archive_applicants(cutoff, batch_size=500):
+    """
+    Move applicants last updated before `cutoff` to the archive tables, one
+    transaction per batch. Returns the number archived.
+    """
+    archived = 0
+    while True:
+        with transaction.atomic():
+            ids = list(
+                Applicant.objects.filter(updated_at__lt=cutoff)
+                .select_for_update(skip_locked=True)
+                .order_by('id')
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            _archive_ids(ids)
+        archived += len(ids)
+        logger.info("Archived %d applicants", archived)
+    return archived
+
+
+def archive_applicant(applicant):
+    with transaction.atomic():
+        _archive_ids([applicant.pk])
+
+
+def restore_applicant(archived):
+    """Move an archived applicant back to the hot table and return it."""
+    with transaction.atomic():
+        archived = ArchivedApplicant.objects.select_for_update().get(pk=archived.pk)
+        if Applicant.objects.filter(email=archived.email).exists():
+            raise ValidationError({'email': 'An active applicant with this email already exists.'})
+
+        values = {name: getattr(archived, name) for name in APPLICANT_FIELDS}
+        values['document'] = archived.document.name
+        applicant = Applicant(**values)
+        # save() rather than bulk_create so the usual post_save work (scoring,
+        # duplicate detection, events) runs; updated_at becomes now
+        applicant.save(force_insert=True)
+
+        Academic.objects.bulk_create(
+            Academic(**{name: getattr(academic, name) for name in ACADEMIC_FIELDS})
+            for academic in archived.academics.all()
+        )
+        archived.delete()
+        # the feed applies `changed` before `deleted`: a tombstone left from
+        # archiving would delete the restored applicant on clients
+        ApplicantTombstone.objects.filter(applicant_id=applicant.pk).delete()
+        # archiving removed the extracted text with the applicant
+        queue_document_processing(applicant)
+    return applicant
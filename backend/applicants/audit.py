@@ -0,0 +1,170 @@
+"""
+Field-level audit log for applicants and their academic records.
+
+Saves and deletes are diffed against the values the instance was loaded
+with (`LoadedValuesMixin`), so recording a change costs no extra query.
+Entries are only queued once their transaction commits, then written with
+one `bulk_create` per batch: when `AUDIT_BATCH_SIZE` entries are waiting or
+`AUDIT_FLUSH_SECONDS` after the first one, whichever comes first, and at
+process exit. With `AUDIT_FLUSH_SECONDS = 0` every commit writes its own
+entries before the request returns.
+
+Queued entries are held per process, so a hard crash can lose up to
+`AUDIT_FLUSH_SECONDS` of history.
+
+The acting user is taken from the request handled by an `AuditActorMixin`
+view; changes made elsewhere (admin, management commands) have no actor.
+"""
+import atexit
+import logging
+import threading
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from backend import metrics
+from .models import Applicant, Academic, AuditEntry
+
+logger = logging.getLogger(__name__)
+
+# derived or bookkeeping columns that are not worth a history entry
+UNTRACKED_FIELDS = {'id', 'applicant', 'created_at', 'updated_at', 'eligibility_score'}
+
+TRACKED_FIELDS = {
+    model: [field for field in model._meta.concrete_fields if field.name not in UNTRACKED_FIELDS]
+    for model in (Applicant, Academic)
+}
+
+_actor = ContextVar('audit_actor', default=None)
+
+
+class AuditActorMixin:
+    """APIView mixin: attribute audit entries written by the request to its user."""
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._actor_token = _actor.set(request.user.pk)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_actor_token', None)
+        if token is not None:
+            _actor.reset(token)
+            self._actor_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class AuditBuffer:
+
+    def __init__(self):
+        self._entries = []
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def add(self, entries):
+        with self._lock:
+            self._entries.extend(entries)
+            flush_now = len(self._entries) >= settings.AUDIT_BATCH_SIZE or settings.AUDIT_FLUSH_SECONDS <= 0
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(settings.AUDIT_FLUSH_SECONDS, self._flush_in_thread)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+
+    def flush(self):
+        """Write every queued entry. Returns the number written."""
+        with self._lock:
+            entries, self._entries = self._entries, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if not entries:
+            return 0
+        try:
+            AuditEntry.objects.bulk_create(entries, batch_size=settings.AUDIT_BATCH_SIZE)
+        except Exception:  # noqa: BLE001
+            # the audited writes have already committed; never fail them
+            logger.exception("Could not write %d audit entries", len(entries))
+            metrics.incr('audit.dropped', len(entries))
+            return 0
+        metrics.incr('audit.written', len(entries))
+        return len(entries)
+
+    def _flush_in_thread(self):
+        try:
+            self.flush()
+        finally:
+            connection.close()
+
+
+_buffer = AuditBuffer()
+atexit.register(_buffer.flush)
+
+
+def flush():
+    return _buffer.flush()
+
+
+def _current_values(instance):
+    """Prepared values of the tracked fields loaded on `instance`."""
+    deferred = instance.get_deferred_fields()
+    return {
+        field.attname: field.get_prep_value(getattr(instance, field.attname))
+        for field in TRACKED_FIELDS[type(instance)]
+        if field.attname not in deferred
+    }
+
+
+def _queue(instance, action, changes):
+    applicant_id = instance.pk if isinstance(instance, Applicant) else instance.applicant_id
+    entry = AuditEntry(
+        applicant_id=applicant_id,
+        object_type=AuditEntry.APPLICANT if isinstance(instance, Applicant) else AuditEntry.ACADEMIC,
+        object_id=instance.pk,
+        action=action,
+        changes=changes,
+        actor_id=_actor.get(),
+        created_at=timezone.now(),
+    )
+    transaction.on_commit(lambda: _buffer.add([entry]))
+
+
+def record_save(instance, created=False):
+    """
+    Queue the changes made by saving `instance` since it was loaded (or
+    last recorded). Deferred fields were not saved and are skipped; an
+    instance that was never loaded is recorded in full.
+    """
+    loaded = getattr(instance, '_loaded_values', None)
+    current = _current_values(instance)
+    changes = {}
+    for field in TRACKED_FIELDS[type(instance)]:
+        if field.attname not in current:
+            continue
+        new = current[field.attname]
+        if created or loaded is None:
+            if new not in (None, ''):
+                changes[field.name] = [None, new]
+            continue
+        if field.attname not in loaded:
+            continue
+        old = field.get_prep_value(loaded[field.attname])
+        if old != new:
+            changes[field.name] = [old, new]
+
+    # the next save of this instance diffs against what was just saved
+    instance._loaded_values = {**(loaded or {}), **current}
+    if created or changes:
+        _queue(instance, AuditEntry.CREATE if created else AuditEntry.UPDATE, changes)
+
+
+def record_delete(instance):
+    current = _current_values(instance)
+    changes = {
+        field.name: [current[field.attname], None]
+        for field in TRACKED_FIELDS[type(instance)]
+        if current.get(field.attname) not in (None, '')
+    }
+    _queue(instance, AuditEntry.DELETE, changes)
@@ -0,0 +1,77 @@
+"""
+Sample applicant list payloads for the benchmark commands.
+"""
+import random
+from datetime import date, timedelta
+
+from django.utils import timezone
+
+from .models import Applicant
+from .serializers import ApplicantSerializer
+
+COUNTRIES = ['Nepal', 'India', 'Bangladesh', 'Sri Lanka', 'Pakistan', 'Vietnam', 'Nigeria', 'Philippines']
+CITIES = ['Kathmandu', 'Pokhara', 'Delhi', 'Mumbai', 'Dhaka', 'Colombo', 'Lahore', 'Hanoi', 'Lagos', 'Manila']
+COURSES = [choice for choice, _ in Applicant.COURSE_CHOICES]
+TESTS = ['IELTS', 'TOEFL', 'PTE']
+
+
+def synthetic_rows(count, seed=0):
+    """`count` rows shaped like ApplicantSerializer output."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    rows = []
+    for pk in range(1, count + 1):
+        created = now - timedelta(minutes=rng.randint(0, 500000))
+        band = rng.randint(50, 85) / 10
+        rows.append({
+            'id': pk,
+            'created_by': rng.randint(1, 20),
+            'created_by_email': f'officer{rng.randint(1, 20)}@example.com',
+            'created_by_name': 'Documentation Officer',
+            'full_name': f'Applicant {pk}',
+            'email': f'applicant{pk}@example.com',
+            'phone_number': f'+977 98{rng.randint(10000000, 99999999)}',
+            'interested_course': rng.choice(COURSES),
+            'country': rng.choice(COUNTRIES),
+            'city': rng.choice(CITIES),
+            'state': 'Bagmati',
+            'zipcode': str(rng.randint(10000, 99999)),
+            'street': f'{rng.randint(1, 200)} Main Street',
+            'test_type': rng.choice(TESTS),
+            'overall_score': f'{band:.2f}',
+            'reading_score': f'{band:.2f}',
+            'listening_score': f'{band + 0.5:.2f}',
+            'writing_score': f'{band - 0.5:.2f}',
+            'speaking_score': f'{band:.2f}',
+            'attended_date': (date(2024, 1, 1) + timedelta(days=rng.randint(0, 600))).isoformat(),
+            'eligibility_score': round(rng.random(), 4),
+            'document': f'applicant_documents/document_{pk}.pdf',
+            'document_url': f'/api/applicants/{pk}/document/',
+            'academics': [
+                {
+                    'id': pk * 2 + offset,
+                    'degree_level': level,
+                    'degree_title': title,
+                    'institution': 'Tribhuvan University',
+                    'passed_year': str(rng.randint(2010, 2023)),
+                    'course_start_date': '2016-09-01',
+                    'course_end_date': '2020-06-30',
+                    'obtained_mark': f'{rng.randint(5000, 9500) / 100:.2f}',
+                    'created_at': created.isoformat(),
+                }
+                for offset, (level, title) in enumerate([('+2', 'Science'), ('bachelors', 'BSc Computer Science')])
+            ],
+            'created_at': created.isoformat(),
+            'updated_at': created.isoformat(),
+        })
+    return rows
+
+
+def database_rows(count):
+    """Up to `count` real applicants, serialized as the list endpoint does."""
+    queryset = Applicant.objects.select_related('created_by').prefetch_related('academics').order_by('-id')[:count]
+    return ApplicantSerializer(queryset, many=True).data
+
+
+def sample_rows(count, source='synthetic'):
+    return database_rows(count) if source == 'db' else synthetic_rows(count)
@@ -0,0 +1,46 @@
+"""
+Cached lookups shared by the admin and the API.
+
+Distinct value lists (countries, test types) are expensive to build over the
+full applicants table and change rarely, so they are cached and invalidated
+from the model signals in `applicants/signals.py`.
+"""
+from django.core.cache import cache
+
+from .models import Applicant
+
+FILTER_CHOICES_TIMEOUT = 60 * 60
+FILTER_CHOICES_FIELDS = ('country', 'test_type')
+
+
+def _choices_key(field):
+    return f'applicants:filter_choices:{field}'
+
+
+def get_filter_choices(field):
+    """Return the sorted distinct non-empty values of `field`."""
+    key = _choices_key(field)
+    choices = cache.get(key)
+    if choices is None:
+        choices = list(
+            Applicant.objects.order_by(field)
+            .values_list(field, flat=True)
+            .distinct()
+            .exclude(**{field: ''})
+        )
+        cache.set(key, choices, FILTER_CHOICES_TIMEOUT)
+    return choices
+
+
+def invalidate_filter_choices(instance=None):
+    """
+    Drop cached choice lists. With an instance, only lists that do not
+    already contain the instance's value are dropped.
+    """
+    for field in FILTER_CHOICES_FIELDS:
+        key = _choices_key(field)
+        if instance is not None:
+            cached = cache.get(key)
+            if cached is None or getattr(instance, field) in cached:
+                continue
+        cache.delete(key)
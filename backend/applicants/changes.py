@@ -0,0 +1,126 @@
+"""
+Incremental change feed for applicant sync clients.
+
+Changed applicants are read in (updated_at, id) order through the
+`applicants_updated_at_idx` index and deletions from `ApplicantTombstone`
+in (deleted_at, id) order. The position in both streams is returned as an
+opaque cursor; passing it back returns only what changed since.
+
+    GET applicants/changes/                        full sync from the start
+    GET applicants/changes/?updated_since=<iso>    changes after a timestamp
+    GET applicants/changes/?cursor=<next_cursor>   continue
+
+Clients should apply `changed` before `deleted`, and keep paging while
+`has_more` is true.
+"""
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from .models import Applicant, ApplicantTombstone
+from .permissions import scope_applicants
+
+
+class CursorExpired(Exception):
+    """The cursor is older than the retained tombstones; a full resync is needed."""
+
+
+def encode_cursor(position):
+    data = {
+        key: [value[0].isoformat(), value[1]] if value else None
+        for key, value in position.items()
+    }
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(',', ':')).encode()).decode()
+
+
+def decode_cursor(cursor):
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        position = {
+            key: (parse_datetime(data[key][0]), int(data[key][1])) if data[key] else None
+            for key in ('changed', 'deleted')
+        }
+        # parse_datetime returns None for a string that is not a timestamp
+        if any(value and value[0] is None for value in position.values()):
+            raise ValueError('Invalid timestamp')
+        return position
+    except (ValueError, TypeError, KeyError, IndexError):
+        raise ValidationError({'cursor': 'Invalid cursor.'})
+
+
+def get_position(params):
+    """Return the starting position from `?cursor=` or `?updated_since=`."""
+    cursor = params.get('cursor')
+    if cursor:
+        return decode_cursor(cursor)
+
+    updated_since = params.get('updated_since')
+    if not updated_since:
+        return {'changed': None, 'deleted': None}
+
+    try:
+        since = parse_datetime(updated_since)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError({'updated_since': 'Enter a valid datetime.'})
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    # id 0 sorts before every row at exactly `since`
+    return {'changed': (since, 0), 'deleted': (since, 0)}
+
+
+def _after(field, position):
+    if position is None:
+        return Q()
+    timestamp, row_id = position
+    return Q(**{f'{field}__gt': timestamp}) | Q(**{field: timestamp, 'id__gt': row_id})
+
+
+def read_changes(position, limit, user):
+    """
+    Return (changed applicant ids, deleted applicant ids, next position,
+    has_more) for up to `limit` rows of each stream after `position`, as
+    visible to `user`.
+    """
+    now = timezone.now()
+    retention_start = now - timedelta(days=settings.CHANGE_FEED_TOMBSTONE_DAYS)
+    if position['deleted'] is not None and position['deleted'][0] < retention_start:
+        raise CursorExpired()
+
+    settled = now - timedelta(seconds=settings.CHANGE_FEED_SETTLE_SECONDS)
+    if position['deleted'] is None:
+        # a client starting from scratch holds nothing deleted before now
+        position = {**position, 'deleted': (settled, 0)}
+
+    changed = list(
+        scope_applicants(Applicant.objects.all(), user).filter(_after('updated_at', position['changed']), updated_at__lt=settled)
+        .order_by('updated_at', 'id')
+        .values_list('updated_at', 'id')[:limit + 1]
+    )
+    deleted = list(
+        scope_applicants(ApplicantTombstone.objects.all(), user).filter(_after('deleted_at', position['deleted']), deleted_at__lt=settled)
+        .order_by('deleted_at', 'id')
+        .values_list('deleted_at', 'id', 'applicant_id')[:limit + 1]
+    )
+
+    has_more = len(changed) > limit or len(deleted) > limit
+    changed, deleted = changed[:limit], deleted[:limit]
+
+    next_position = {
+        'changed': changed[-1] if changed else position['changed'],
+        'deleted': deleted[-1][:2] if deleted else position['deleted'],
+    }
+
+    return (
+        [row_id for _, row_id in changed],
+        [applicant_id for _, _, applicant_id in deleted],
+        next_position,
+        has_more,
+    )
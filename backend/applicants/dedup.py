@@ -0,0 +1,303 @@
+"""
+Duplicate applicant detection.
+
+Comparing every pair of applicants is O(n^2), so each applicant gets a small
+set of blocking keys and only applicants that share a key are compared:
+
+    phone:<last 10 digits>          normalized phone number
+    mail:<local part>               email local part without dots / +tags
+    name:<soundex>:<soundex>        phonetic codes of first and last name
+    lsh:<band>:<hash>               MinHash LSH bands over name + address
+
+Candidate pairs are then scored on name, phone, email and address
+similarity, and pairs above `DUPLICATE_SCORE_THRESHOLD` are stored.
+"""
+import hashlib
+import logging
+import random
+import re
+from itertools import combinations, groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import Applicant, ApplicantBlockingKey, DuplicateCandidate
+
+logger = logging.getLogger(__name__)
+
+# MinHash signature of 32 values split into 8 bands of 4 rows: pairs with a
+# 3-gram Jaccard similarity of ~0.6 share a band with high probability
+NUM_PERMUTATIONS = 32
+BANDS = 8
+ROWS_PER_BAND = NUM_PERMUTATIONS // BANDS
+MERSENNE_PRIME = (1 << 61) - 1
+
+_rng = random.Random(4321)
+PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+# keys shared by more applicants than this (e.g. a placeholder phone number)
+# carry no signal and would blow up the comparison count
+MAX_BLOCK_SIZE = 200
+
+FIELDS = ('id', 'full_name', 'email', 'phone_number', 'street', 'city', 'country')
+
+SOUNDEX_CODES = {
+    **dict.fromkeys('bfpv', '1'),
+    **dict.fromkeys('cgjkqsxz', '2'),
+    **dict.fromkeys('dt', '3'),
+    'l': '4',
+    **dict.fromkeys('mn', '5'),
+    'r': '6',
+}
+
+
+def normalize_phone(phone):
+    digits = re.sub(r'\D', '', phone or '')
+    return digits[-10:] if len(digits) >= 7 else ''
+
+
+def normalize_email_local(email):
+    local = (email or '').lower().split('@')[0]
+    return local.split('+')[0].replace('.', '')
+
+
+def name_tokens(name):
+    return re.findall(r'[a-z]+', (name or '').lower())
+
+
+def soundex(word):
+    if not word:
+        return ''
+    code = word[0].upper()
+    previous = SOUNDEX_CODES.get(word[0], '')
+    for char in word[1:]:
+        digit = SOUNDEX_CODES.get(char, '')
+        if digit and digit != previous:
+            code += digit
+        if char not in 'hw':
+            previous = digit
+    return (code + '000')[:4]
+
+
+def shingles(text, size=3):
+    text = re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9 ]', '', (text or '').lower())).strip()
+    if len(text) < size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def _hash(value):
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), 'little')
+
+
+def minhash(tokens):
+    hashes = [_hash(token) for token in tokens]
+    return [
+        min((a * h + b) % MERSENNE_PRIME for h in hashes)
+        for a, b in PERMUTATIONS
+    ]
+
+
+def jaccard(left, right):
+    if not left or not right:
+        return 0.0
+    return len(left & right) / len(left | right)
+
+
+def address_text(applicant):
+    return f"{applicant['street']} {applicant['city']} {applicant['country']}"
+
+
+def blocking_keys(applicant):
+    """Return the blocking keys for an applicant values() dict."""
+    keys = set()
+
+    phone = normalize_phone(applicant['phone_number'])
+    if phone:
+        keys.add(f'phone:{phone}')
+
+    local = normalize_email_local(applicant['email'])
+    if local:
+        keys.add(f'mail:{local[:50]}')
+
+    tokens = name_tokens(applicant['full_name'])
+    if tokens:
+        keys.add(f'name:{soundex(tokens[0])}:{soundex(tokens[-1])}')
+
+    grams = shingles(f"{applicant['full_name']} {address_text(applicant)}")
+    if grams:
+        signature = minhash(grams)
+        for band in range(BANDS):
+            rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+            digest = hashlib.blake2b(repr(rows).encode(), digest_size=8).hexdigest()
+            keys.add(f'lsh:{band}:{digest}')
+
+    return keys
+
+
+def score_pair(left, right):
+    """Return (score between 0 and 1, per-signal breakdown)."""
+    reasons = {
+        'name': round(jaccard(shingles(left['full_name']), shingles(right['full_name'])), 3),
+        'address': round(jaccard(shingles(address_text(left)), shingles(address_text(right))), 3),
+        'phone': float(
+            bool(normalize_phone(left['phone_number']))
+            and normalize_phone(left['phone_number']) == normalize_phone(right['phone_number'])
+        ),
+        'email': float(
+            bool(normalize_email_local(left['email']))
+            and normalize_email_local(left['email']) == normalize_email_local(right['email'])
+        ),
+    }
+    left_tokens, right_tokens = name_tokens(left['full_name']), name_tokens(right['full_name'])
+    reasons['phonetic'] = float(
+        bool(left_tokens and right_tokens)
+        and soundex(left_tokens[0]) == soundex(right_tokens[0])
+        and soundex(left_tokens[-1]) == soundex(right_tokens[-1])
+    )
+
+    score = (
+        0.35 * reasons['name']
+        + 0.15 * reasons['phonetic']
+        + 0.25 * reasons['phone']
+        + 0.10 * reasons['email']
+        + 0.15 * reasons['address']
+    )
+    return round(score, 4), reasons
+
+
+def save_candidates(pairs):
+    """Score `pairs` of values() dicts and upsert those above the threshold."""
+    threshold = settings.DUPLICATE_SCORE_THRESHOLD
+    candidates = []
+    for left, right in pairs:
+        if left['id'] > right['id']:
+            left, right = right, left
+        score, reasons = score_pair(left, right)
+        if score >= threshold:
+            candidates.append(DuplicateCandidate(
+                applicant_id=left['id'], duplicate_id=right['id'], score=score, reasons=reasons
+            ))
+
+    DuplicateCandidate.objects.bulk_create(
+        candidates,
+        update_conflicts=True,
+        unique_fields=['applicant', 'duplicate'],
+        update_fields=['score', 'reasons'],
+    )
+    return len(candidates)
+
+
+def index_applicants(applicants):
+    """Replace the blocking keys of the given values() dicts."""
+    ids = [applicant['id'] for applicant in applicants]
+    with transaction.atomic():
+        ApplicantBlockingKey.objects.filter(applicant_id__in=ids).delete()
+        ApplicantBlockingKey.objects.bulk_create(
+            ApplicantBlockingKey(applicant_id=applicant['id'], key=key)
+            for applicant in applicants
+            for key in blocking_keys(applicant)
+        )
+
+
+def update_duplicates(applicant_ids, batch_size=500):
+    """
+    Re-index the given applicants and compare each with the applicants it
+    shares a blocking key with. Used incrementally after applicants are
+    saved; the number of queries does not grow with the batch size.
+    Returns the number of candidate pairs stored.
+    """
+    applicant_ids = sorted(set(applicant_ids))
+    stored = 0
+    for start in range(0, len(applicant_ids), batch_size):
+        stored += _update_batch(applicant_ids[start:start + batch_size])
+    return stored
+
+
+def _update_batch(applicant_ids):
+    rows = {row['id']: row for row in Applicant.objects.filter(id__in=applicant_ids).values(*FIELDS)}
+    if not rows:
+        return 0
+
+    index_applicants(list(rows.values()))
+    keys_by_id = {applicant_id: set(blocking_keys(row)) for applicant_id, row in rows.items()}
+    keys = set().union(*keys_by_id.values())
+
+    crowded = set(
+        ApplicantBlockingKey.objects.filter(key__in=keys)
+        .values('key').annotate(size=Count('id'))
+        .filter(size__gt=MAX_BLOCK_SIZE).values_list('key', flat=True)
+    )
+    members = {}
+    for key, member_id in (
+        ApplicantBlockingKey.objects.filter(key__in=keys - crowded).values_list('key', 'applicant_id')
+    ):
+        members.setdefault(key, set()).add(member_id)
+
+    pairs = {
+        (min(applicant_id, other_id), max(applicant_id, other_id))
+        for applicant_id, applicant_keys in keys_by_id.items()
+        for key in applicant_keys - crowded
+        for other_id in members.get(key, ())
+        if other_id != applicant_id
+    }
+    missing = {applicant_id for pair in pairs for applicant_id in pair} - rows.keys()
+    rows.update((row['id'], row) for row in Applicant.objects.filter(id__in=missing).values(*FIELDS))
+
+    DuplicateCandidate.objects.filter(
+        Q(applicant_id__in=applicant_ids) | Q(duplicate_id__in=applicant_ids)
+    ).delete()
+    return save_candidates(
+        (rows[left], rows[right]) for left, right in pairs if left in rows and right in rows
+    )
+
+
+def scan_all(batch_size=1000):
+    """
+    Rebuild blocking keys for every applicant, then score every pair that
+    shares a key. Returns (applicants indexed, candidate pairs stored).
+    """
+    indexed = 0
+    queryset = Applicant.objects.order_by('id').values(*FIELDS)
+    last_id = 0
+    while True:
+        batch = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+        index_applicants(batch)
+        indexed += len(batch)
+        last_id = batch[-1]['id']
+
+    blocks = (
+        ApplicantBlockingKey.objects.values('key')
+        .annotate(size=Count('id'))
+        .filter(size__gt=1, size__lte=MAX_BLOCK_SIZE)
+        .values('key')
+    )
+    members = (
+        ApplicantBlockingKey.objects.filter(key__in=blocks)
+        .order_by('key', 'applicant_id')
+        .values_list('key', 'applicant_id')
+    )
+    pairs = set()
+    for _, group in groupby(members.iterator(chunk_size=5000), key=itemgetter(0)):
+        pairs.update(combinations([applicant_id for _, applicant_id in group], 2))
+
+    DuplicateCandidate.objects.all().delete()
+    stored = 0
+    pairs = sorted(pairs)
+    for start in range(0, len(pairs), batch_size):
+        chunk = pairs[start:start + batch_size]
+        ids = {applicant_id for pair in chunk for applicant_id in pair}
+        rows = {row['id']: row for row in Applicant.objects.filter(id__in=ids).values(*FIELDS)}
+        stored += save_candidates(
+            (rows[left], rows[right]) for left, right in chunk if left in rows and right in rows
+        )
+
+    logger.info("Duplicate scan: %d applicants, %d pairs compared, %d stored", indexed, len(pairs), stored)
+    return indexed, stored
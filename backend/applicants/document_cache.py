@@ -0,0 +1,100 @@
+"""
+Size-bounded on-disk LRU cache of applicant documents.
+
+Documents are fetched from storage once and then served from local disk.
+Stored document names never change content (`AWS_S3_FILE_OVERWRITE` is off,
+so a replacement upload always gets a new name), so cached files never need
+revalidating. Recency is tracked with the file's mtime, which is bumped on
+every hit; when the cache grows past `DOCUMENT_CACHE_MAX_BYTES` the least
+recently used files are removed.
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+from django.conf import settings
+
+from backend import metrics
+from .storage import document_storage
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class DocumentCache:
+
+    def __init__(self, directory, max_bytes):
+        self.directory = str(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def etag(name):
+        return hashlib.sha256(name.encode()).hexdigest()[:32]
+
+    def path_for(self, name):
+        return os.path.join(self.directory, f'{self.etag(name)}.pdf')
+
+    def get(self, name):
+        """Return the local path of document `name`, fetching it if needed."""
+        path = self.path_for(name)
+        try:
+            os.utime(path)
+            metrics.incr('document_cache.hit')
+            return path
+        except FileNotFoundError:
+            pass
+
+        metrics.incr('document_cache.miss')
+        os.makedirs(self.directory, exist_ok=True)
+
+        # download to a temp file and rename, so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as out, document_storage().open(name, 'rb') as source:
+                for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+                    out.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+        return path
+
+    def evict(self):
+        """Remove least recently used files until the cache fits its budget."""
+        with self._lock:
+            entries = []
+            total = 0
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if not entry.name.endswith('.pdf'):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+
+            if total <= self.max_bytes:
+                return
+
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
+                metrics.incr('document_cache.evicted')
+
+
+document_cache = DocumentCache(settings.DOCUMENT_CACHE_DIR, settings.DOCUMENT_CACHE_MAX_BYTES)
@@ -0,0 +1,25 @@
+"""
+Queueing for background document processing (see `process_documents`).
+"""
+from .models import ApplicantDocument
+
+
+def queue_document_processing(applicant):
+    """
+    Mark the applicant's current document for (re)processing. Called when a
+    document is uploaded or replaced; the work itself happens off the
+    request path in the `process_documents` command.
+    """
+    ApplicantDocument.objects.update_or_create(
+        applicant=applicant,
+        defaults={
+            'document_name': applicant.document.name,
+            'status': ApplicantDocument.PENDING,
+            'attempts': 0,
+            'error': '',
+            'is_encrypted': False,
+            'page_count': None,
+            'text': '',
+            'processed_at': None,
+        },
+    )
@@ -0,0 +1,143 @@
+"""
+Live applicant events for the dashboard, streamed as server-sent events.
+
+    event: applicant.created | applicant.updated | applicant.deleted
+    data: {"id": 12}        documentation officers only get their own applicants
+
+    event: analytics
+    data: {"total_applicants": ..., "this_month": ..., ...}
+
+    event: resync
+    data: {}            the client fell behind and should refetch
+
+Writes publish after their transaction commits. Analytics counters are
+recomputed at most once per `EVENT_ANALYTICS_DEBOUNCE` seconds per process,
+however many applicants changed, and only while someone is listening.
+
+The stream needs an ASGI server (see render.yaml); under WSGI a stream would
+hold a worker thread for its whole lifetime.
+"""
+import asyncio
+import json
+import logging
+import threading
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, transaction
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import APIException
+from users.authentication import CachedJWTAuthentication
+
+from backend import metrics
+from backend.events import get_broker
+from users.models import User
+from .analytics import get_analytics, get_analytics_by_owner, empty_analytics
+
+logger = logging.getLogger(__name__)
+
+_analytics_timer = None
+_analytics_lock = threading.Lock()
+
+
+def publish_applicant_event(action, applicant_id, owner_id):
+    """Publish `applicant.<action>` once the current transaction commits."""
+    def publish():
+        get_broker().publish(f'applicant.{action}', {'id': applicant_id, 'owner': owner_id})
+        schedule_analytics_refresh()
+
+    transaction.on_commit(publish)
+
+
+def schedule_analytics_refresh():
+    global _analytics_timer
+    if not get_broker().has_subscribers():
+        return
+    with _analytics_lock:
+        if _analytics_timer is not None:
+            return
+        _analytics_timer = threading.Timer(settings.EVENT_ANALYTICS_DEBOUNCE, _publish_analytics)
+        _analytics_timer.daemon = True
+        _analytics_timer.start()
+
+
+def _publish_analytics():
+    global _analytics_timer
+    with _analytics_lock:
+        _analytics_timer = None
+    try:
+        get_broker().publish('analytics', get_analytics_by_owner())
+    except Exception:  # noqa: BLE001
+        logger.exception("Could not publish analytics")
+    finally:
+        connection.close()
+
+
+def format_event(message):
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+
+
+def visible_event(message, user):
+    """Return the message as `user` should see it, or None to skip it."""
+    if message['event'] == 'analytics':
+        # counters are published per owner; officers get their own slice
+        counters = message['data']['all'] if user.role == User.ADMIN else message['data']['by_owner'].get(str(user.pk))
+        return {**message, 'data': counters or empty_analytics()}
+    if message['event'].startswith('applicant.'):
+        data = message['data']
+        if user.role != User.ADMIN and data['owner'] != user.pk:
+            return None
+        return {**message, 'data': {'id': data['id']}}
+    return message
+
+
+async def _stream(user):
+    broker = get_broker()
+    subscription = broker.subscribe()
+    loop = asyncio.get_running_loop()
+    # streams end after EVENT_STREAM_MAX_SECONDS and the client reconnects,
+    # so streams whose client went away are always reclaimed
+    deadline = loop.time() + settings.EVENT_STREAM_MAX_SECONDS
+    metrics.incr('events.streams_opened')
+    try:
+        yield f"retry: {settings.EVENT_RETRY_MS}\n\n"
+        analytics = await sync_to_async(get_analytics)(user=user)
+        yield format_event({'id': 0, 'event': 'analytics', 'data': analytics})
+
+        while True:
+            timeout = min(settings.EVENT_HEARTBEAT_SECONDS, deadline - loop.time())
+            if timeout <= 0:
+                break
+            try:
+                message = await asyncio.wait_for(subscription.get(), timeout)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            message = visible_event(message, user)
+            if message is not None:
+                yield format_event(message)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+async def applicant_events(request):
+    """
+    GET: Server-sent event stream of applicant changes and analytics
+
+    Authenticated with the usual `Authorization: Bearer <access token>`.
+    """
+    if request.method != 'GET':
+        return JsonResponse({'error': 'Method not allowed'}, status=405)
+
+    try:
+        auth = await sync_to_async(CachedJWTAuthentication().authenticate)(request)
+    except APIException as exc:
+        return JsonResponse({'error': str(exc.detail)}, status=401)
+    if auth is None:
+        return JsonResponse({'error': 'Authentication credentials were not provided.'}, status=401)
+
+    response = StreamingHttpResponse(_stream(auth[0]), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # stop nginx-style proxies from buffering the stream
+    response['X-Accel-Buffering'] = 'no'
+    return response
@@ -0,0 +1,82 @@
+"""
+Facet counts for the applicant list sidebar.
+
+All facets are computed from one GROUP BY over the facet columns together,
+then folded per facet in Python. When the request is filtered only by
+facet values (no search term), the unfiltered grouping is served from a
+cached rollup instead of querying.
+"""
+from collections import Counter
+
+from django.core.cache import cache
+from django.db.models import Count
+
+from .models import Applicant
+from .filters import EXACT_FILTERS, active_filters
+
+FACET_FIELDS = ('interested_course', 'test_type', 'country')
+DEFAULT_FACET_LIMIT = 10
+MAX_FACET_LIMIT = 50
+
+ROLLUP_KEY = 'applicants:facet_rollup'
+ROLLUP_TIMEOUT = 60 * 10
+
+
+def _grouped_counts(queryset):
+    rows = (
+        queryset.order_by()
+        .values_list(*FACET_FIELDS)
+        .annotate(count=Count('id'))
+    )
+    return [tuple(row) for row in rows]
+
+
+def get_rollup():
+    """Counts per (course, test type, country) over the whole table."""
+    rows = cache.get(ROLLUP_KEY)
+    if rows is None:
+        rows = _grouped_counts(Applicant.objects.all())
+        cache.set(ROLLUP_KEY, rows, ROLLUP_TIMEOUT)
+    return rows
+
+
+def invalidate_rollup():
+    cache.delete(ROLLUP_KEY)
+
+
+def _fold(rows, limit):
+    counters = {field: Counter() for field in FACET_FIELDS}
+    for row in rows:
+        count = row[-1]
+        for field, value in zip(FACET_FIELDS, row):
+            counters[field][value] += count
+    return {
+        field: [
+            {'value': value, 'count': count}
+            for value, count in counter.most_common(limit)
+        ]
+        for field, counter in counters.items()
+    }
+
+
+def compute_facets(queryset, params, limit=DEFAULT_FACET_LIMIT, use_rollup=True):
+    """
+    Return the top `limit` values per facet for the filtered `queryset`.
+    Pass `use_rollup=False` when `queryset` is scoped to part of the table.
+    """
+    limit = max(1, min(limit, MAX_FACET_LIMIT))
+    filters = active_filters(params)
+
+    if use_rollup and all(name in EXACT_FILTERS for name in filters):
+        wanted = {
+            FACET_FIELDS.index(name): params.get(name)
+            for name in filters
+        }
+        rows = [
+            row for row in get_rollup()
+            if all(row[idx] == value for idx, value in wanted.items())
+        ]
+    else:
+        rows = _grouped_counts(queryset)
+
+    return _fold(rows, limit)
@@ -0,0 +1,155 @@
+"""
+Query parameter filtering for the applicant list endpoint.
+"""
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from rest_framework.exceptions import ValidationError
+
+# exact-match filters on facet fields: ?interested_course=Masters&country=Nepal
+EXACT_FILTERS = ('interested_course', 'test_type', 'country')
+
+# ?overall_score_min=6.5&overall_score_max=8
+SCORE_RANGE_FIELDS = (
+    'overall_score',
+    'reading_score',
+    'listening_score',
+    'writing_score',
+    'speaking_score',
+)
+
+# ?attended_date_after=2024-01-01&created_at_before=2024-06-30 (inclusive)
+DATE_RANGE_FIELDS = ('attended_date', 'created_at')
+
+# matches the expression index built by migration 0013 on PostgreSQL; the
+# 'simple' configuration does no stemming, as CVs come in many languages
+DOCUMENT_SEARCH_CONFIG = 'simple'
+
+# only columns with a b-tree index may be sorted on
+ORDERING_FIELDS = ('created_at', 'attended_date', 'overall_score', 'eligibility_score')
+DEFAULT_ORDERING = '-created_at'
+
+
+def _parse_decimal(param, value):
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        raise ValidationError({param: 'Enter a valid number.'})
+    # nan/inf parse, but the DecimalField lookup then fails with a 500
+    if not number.is_finite():
+        raise ValidationError({param: 'Enter a valid number.'})
+    return number
+
+
+def _parse_date_bound(param, field, value, upper):
+    """
+    Parse a date range bound. For `created_at`, a plain date is widened to
+    the whole day in the current timezone.
+    """
+    if field == 'attended_date':
+        parsed = parse_date(value)
+        if parsed is None:
+            raise ValidationError({param: 'Enter a valid date (YYYY-MM-DD).'})
+        return ('lte' if upper else 'gte'), parsed
+
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        parsed = None
+    if parsed is not None:
+        if timezone.is_naive(parsed):
+            parsed = timezone.make_aware(parsed)
+        return ('lte' if upper else 'gte'), parsed
+
+    day = parse_date(value)
+    if day is None:
+        raise ValidationError({param: 'Enter a valid date or datetime.'})
+    if upper:
+        return 'lt', timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+    return 'gte', timezone.make_aware(datetime.combine(day, time.min))
+
+
+def range_params():
+    for field in SCORE_RANGE_FIELDS:
+        yield f'{field}_min', field, False
+        yield f'{field}_max', field, True
+    for field in DATE_RANGE_FIELDS:
+        yield f'{field}_after', field, False
+        yield f'{field}_before', field, True
+
+
+def filter_applicants(queryset, params):
+    """Apply the list endpoint's query parameters to `queryset`."""
+    for field in EXACT_FILTERS:
+        value = params.get(field)
+        if value:
+            queryset = queryset.filter(**{field: value})
+
+    for param, field, upper in range_params():
+        value = params.get(param)
+        if not value:
+            continue
+        if field in SCORE_RANGE_FIELDS:
+            lookup = 'lte' if upper else 'gte'
+            bound = _parse_decimal(param, value)
+        else:
+            lookup, bound = _parse_date_bound(param, field, value, upper)
+        queryset = queryset.filter(**{f'{field}__{lookup}': bound})
+
+    search = params.get('search')
+    if search:
+        queryset = queryset.filter(
+            Q(full_name__icontains=search) | Q(email__icontains=search)
+        )
+
+    # text extracted from the uploaded PDF by process_documents
+    document_search = params.get('document_search')
+    if document_search:
+        if hasattr(queryset.model, 'document_info'):
+            queryset = search_documents(queryset, document_search)
+        else:
+            # archived applicants keep no extracted text
+            queryset = queryset.none()
+
+    return queryset.order_by(*get_ordering(params))
+
+
+def search_documents(queryset, terms):
+    """
+    Applicants whose extracted document text contains every word of
+    `terms` (web search syntax: "quoted phrases", -excluded). Uses the GIN
+    full-text index on PostgreSQL; other databases fall back to a substring
+    match.
+    """
+    if connection.vendor != 'postgresql':
+        return queryset.filter(document_info__text__icontains=terms)
+    # alias, not annotate: the vector is only needed in WHERE
+    return queryset.alias(
+        document_vector=SearchVector('document_info__text', config=DOCUMENT_SEARCH_CONFIG)
+    ).filter(
+        document_vector=SearchQuery(terms, config=DOCUMENT_SEARCH_CONFIG, search_type='websearch')
+    )
+
+
+def get_ordering(params):
+    """
+    Validate `?ordering=` and add an id tie-breaker in the same direction,
+    matching the (field, id) indexes.
+    """
+    ordering = params.get('ordering') or DEFAULT_ORDERING
+    if ordering.lstrip('-') not in ORDERING_FIELDS:
+        raise ValidationError({
+            'ordering': f"Must be one of {', '.join(ORDERING_FIELDS)} (prefix with '-' for descending)."
+        })
+    return ordering, '-id' if ordering.startswith('-') else 'id'
+
+
+def active_filters(params):
+    """Return the names of the filter parameters present in `params`."""
+    names = list(EXACT_FILTERS) + [param for param, _, _ in range_params()] + ['search', 'document_search']
+    return [name for name in names if params.get(name)]
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from applicants.archive import archive_applicants, archive_cutoff
+from applicants.models import Applicant
+
+
+class Command(BaseCommand):
+    help = "Move applicants not updated within the retention window to the archive tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.ARCHIVE_AFTER_DAYS)
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument('--dry-run', action='store_true', help="Only count matching applicants")
+
+    def handle(self, *args, **options):
+        cutoff = archive_cutoff(options['days'])
+
+        if options['dry_run']:
+            count = Applicant.objects.filter(updated_at__lt=cutoff).count()
+            self.stdout.write(self.style.SUCCESS(f"{count} applicants would be archived"))
+            return
+
+        archived = archive_applicants(cutoff, options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} applicants"))
@@ -0,0 +1,53 @@
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from applicants.benchmark import sample_rows
+from backend import compression
+
+
+class Command(BaseCommand):
+    help = "Compare compression CPU time against bytes saved on an applicant list payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--source', choices=['synthetic', 'db'], default='synthetic')
+        parser.add_argument('--repeat', type=int, default=3)
+        parser.add_argument('--chunk-size', type=int, default=0,
+                            help="Compress in chunks of this many bytes, flushing after each, as streaming responses are")
+
+    def handle(self, *args, **options):
+        rows = sample_rows(options['rows'], options['source'])
+        payload = JSONRenderer().render({'count': len(rows), 'results': rows})
+        self.stdout.write(f"Payload: {len(rows)} rows, {len(payload):,} bytes")
+
+        candidates = [('gzip', level) for level in (1, 6, 9)]
+        if compression.brotli is not None:
+            candidates += [('br', quality) for quality in (1, 4, 6, 9)]
+        else:
+            self.stdout.write(self.style.WARNING("brotli is not installed; only gzip is measured"))
+
+        self.stdout.write(f"{'encoding':<10}{'level':>6}{'bytes':>12}{'ratio':>8}{'ms':>10}{'MB/s':>9}")
+        for encoding, level in candidates:
+            elapsed, size = self._measure(payload, encoding, level, options['repeat'], options['chunk_size'])
+            self.stdout.write(
+                f"{encoding:<10}{level:>6}{size:>12,}{len(payload) / size:>8.1f}"
+                f"{elapsed * 1000:>10.1f}{len(payload) / elapsed / 1e6:>9.1f}"
+            )
+
+    def _measure(self, payload, encoding, level, repeat, chunk_size):
+        best = None
+        for _ in range(repeat):
+            compressor = compression.Compressor(encoding, level)
+            start = time.perf_counter()
+            if chunk_size:
+                size = 0
+                for offset in range(0, len(payload), chunk_size):
+                    size += len(compressor.compress(payload[offset:offset + chunk_size]) + compressor.flush())
+                size += len(compressor.finish())
+            else:
+                size = len(compressor.compress(payload) + compressor.finish())
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, size
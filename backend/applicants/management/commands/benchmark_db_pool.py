@@ -0,0 +1,83 @@
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connection, connections
+
+from applicants.models import Applicant
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test database connection handling: worker threads run request-sized "
+        "ORM work and release connections as Django does at the end of a request"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=32)
+        parser.add_argument('--requests', type=int, default=200, help="Requests per thread")
+
+    def handle(self, *args, **options):
+        engine = connection.settings_dict['ENGINE']
+        self.stdout.write(f"Engine: {engine}, CONN_MAX_AGE={connection.settings_dict['CONN_MAX_AGE']}")
+
+        latencies = []
+        errors = []
+        peak_backends = [0]
+        done = threading.Event()
+        lock = threading.Lock()
+
+        def worker():
+            local = []
+            for _ in range(options['requests']):
+                start = time.perf_counter()
+                # what request_started / request_finished do around a request
+                close_old_connections()
+                try:
+                    Applicant.objects.count()
+                    list(Applicant.objects.order_by('-id').values('id', 'email')[:20])
+                except Exception as exc:  # noqa: BLE001
+                    with lock:
+                        errors.append(repr(exc))
+                finally:
+                    close_old_connections()
+                local.append(time.perf_counter() - start)
+            connections.close_all()
+            with lock:
+                latencies.extend(local)
+
+        def monitor():
+            # its own connection, outside whatever is being measured
+            conn = connection.Database.connect(**connection.get_connection_params())
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                while not done.is_set():
+                    cursor.execute("SELECT count(*) - 1 FROM pg_stat_activity WHERE datname = current_database()")
+                    peak_backends[0] = max(peak_backends[0], cursor.fetchone()[0])
+                    time.sleep(0.05)
+            conn.close()
+
+        watcher = threading.Thread(target=monitor)
+        watcher.start()
+        threads = [threading.Thread(target=worker) for _ in range(options['threads'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        done.set()
+        watcher.join()
+
+        latencies.sort()
+        self.stdout.write(f"Requests: {len(latencies)} in {elapsed:.2f}s ({len(latencies) / elapsed:.0f}/s), errors: {len(errors)}")
+        self.stdout.write(
+            f"Latency ms: p50 {statistics.median(latencies) * 1000:.1f}, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}, max {latencies[-1] * 1000:.1f}"
+        )
+        self.stdout.write(f"Peak PostgreSQL backends: {peak_backends[0]}")
+        if hasattr(connection, 'pool'):
+            self.stdout.write(f"Pool: {connection.pool.stats()}")
+        for error in errors[:5]:
+            self.stdout.write(self.style.ERROR(error))
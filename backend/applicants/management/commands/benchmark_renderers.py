@@ -0,0 +1,54 @@
+import json
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import msgpack
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from applicants.benchmark import sample_rows
+from backend.renderers import ORJSONRenderer, MessagePackRenderer
+
+
+class Command(BaseCommand):
+    help = "Compare renderer CPU time and size on an applicant list payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000)
+        parser.add_argument('--source', choices=['synthetic', 'db'], default='synthetic')
+        parser.add_argument('--repeat', type=int, default=5)
+
+    def handle(self, *args, **options):
+        rows = sample_rows(options['rows'], options['source'])
+        # raw Decimals and aware datetimes, as views that skip serializers return
+        rows.append({
+            'score': Decimal('7.50'),
+            'created_at': datetime(2024, 5, 1, 9, 30, 15, 123456, tzinfo=timezone.utc),
+        })
+        data = {'count': len(rows), 'results': rows}
+
+        baseline = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != baseline:
+            raise CommandError("ORJSONRenderer output differs from JSONRenderer")
+        if msgpack.unpackb(MessagePackRenderer().render(data)) != json.loads(baseline):
+            raise CommandError("MessagePackRenderer output differs from JSONRenderer")
+        self.stdout.write(f"Payload: {len(rows)} rows; output matches JSONRenderer")
+
+        self.stdout.write(f"{'renderer':<22}{'bytes':>12}{'ms':>10}{'speedup':>9}")
+        base_time = None
+        for renderer in (JSONRenderer(), ORJSONRenderer(), MessagePackRenderer()):
+            elapsed, size = self._measure(renderer, data, options['repeat'])
+            base_time = base_time or elapsed
+            self.stdout.write(
+                f"{type(renderer).__name__:<22}{size:>12,}{elapsed * 1000:>10.1f}{base_time / elapsed:>8.1f}x"
+            )
+
+    def _measure(self, renderer, data, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            size = len(renderer.render(data))
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best, size
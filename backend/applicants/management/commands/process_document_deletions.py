@@ -0,0 +1,66 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+
+from applicants.models import Applicant, ArchivedApplicant, PendingDocumentDeletion
+from applicants.storage import delete_documents
+
+
+class Command(BaseCommand):
+    help = "Delete queued applicant documents from storage in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument('--max-attempts', type=int, default=5)
+        parser.add_argument(
+            '--loop', action='store_true',
+            help="Keep polling the queue instead of exiting when it is empty",
+        )
+        parser.add_argument('--interval', type=float, default=10, help="Seconds between polls with --loop")
+
+    def handle(self, *args, **options):
+        while True:
+            processed = self.process_batch(options['batch_size'], options['max_attempts'])
+            if processed:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
+
+    def process_batch(self, batch_size, max_attempts):
+        with transaction.atomic():
+            # skip_locked lets several workers drain the queue side by side
+            pending = list(
+                PendingDocumentDeletion.objects
+                .select_for_update(skip_locked=True)
+                .filter(attempts__lt=max_attempts)
+                .order_by('id')[:batch_size]
+            )
+            if not pending:
+                return 0
+
+            # never delete a file that a row points at again; archived rows
+            # keep their document for a later restore
+            names = {item.name for item in pending}
+            in_use = set(
+                Applicant.objects.filter(document__in=names).values_list('document', flat=True)
+            ) | set(
+                ArchivedApplicant.objects.filter(document__in=names).values_list('document', flat=True)
+            )
+            failed = delete_documents(names - in_use)
+
+            done = [item.id for item in pending if item.name not in failed]
+            PendingDocumentDeletion.objects.filter(id__in=done).delete()
+            for item in pending:
+                if item.name in failed:
+                    PendingDocumentDeletion.objects.filter(id=item.id).update(
+                        attempts=F('attempts') + 1,
+                        last_error=failed[item.name][:1000],
+                    )
+
+        self.stdout.write(
+            f"Deleted {len(done)} documents ({len(in_use)} still in use), {len(pending) - len(done)} failed"
+        )
+        return len(pending)
@@ -0,0 +1,142 @@
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from backend import metrics
+from applicants.models import ApplicantDocument
+from applicants.pdf import inspect_pdf
+from applicants.storage import document_storage
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Verify queued applicant PDFs and extract their text, in a process pool"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency', type=int, default=os.cpu_count() or 1,
+            help="Number of worker processes parsing PDFs",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=0,
+            help="Documents claimed at a time (default: twice the concurrency)",
+        )
+        parser.add_argument('--max-attempts', type=int, default=3)
+        parser.add_argument(
+            '--stale-minutes', type=int, default=30,
+            help="Reclaim documents stuck in processing for longer than this",
+        )
+        parser.add_argument(
+            '--loop', action='store_true',
+            help="Keep polling the queue instead of exiting when it is empty",
+        )
+        parser.add_argument('--interval', type=float, default=10, help="Seconds between polls with --loop")
+
+    def handle(self, *args, **options):
+        concurrency = max(options['concurrency'], 1)
+        batch_size = options['batch_size'] or concurrency * 2
+
+        with ProcessPoolExecutor(max_workers=concurrency) as pool:
+            while True:
+                processed = self.process_batch(pool, batch_size, options)
+                if processed:
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+
+    def claim(self, batch_size, stale_minutes):
+        stale = timezone.now() - timedelta(minutes=stale_minutes)
+        with transaction.atomic():
+            rows = list(
+                ApplicantDocument.objects
+                .select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=ApplicantDocument.PENDING)
+                    | Q(status=ApplicantDocument.PROCESSING, updated_at__lt=stale)
+                )
+                .order_by('updated_at')[:batch_size]
+            )
+            ApplicantDocument.objects.filter(id__in=[row.id for row in rows]).update(
+                status=ApplicantDocument.PROCESSING,
+                attempts=F('attempts') + 1,
+                updated_at=timezone.now(),
+            )
+        for row in rows:
+            row.attempts += 1
+        return rows
+
+    def process_batch(self, pool, batch_size, options):
+        rows = self.claim(batch_size, options['stale_minutes'])
+        if not rows:
+            return 0
+
+        started = time.monotonic()
+        storage = document_storage()
+        futures = {}
+        total_bytes = 0
+
+        for row in rows:
+            try:
+                with storage.open(row.document_name, 'rb') as handle:
+                    data = handle.read()
+            except Exception as exc:  # noqa: BLE001
+                self.record_failure(row, f'Could not read document: {exc}', options['max_attempts'])
+                continue
+            total_bytes += len(data)
+            futures[pool.submit(inspect_pdf, data)] = row
+
+        for future in as_completed(futures):
+            row = futures[future]
+            try:
+                result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                self.record_failure(row, f'Processing error: {exc}', options['max_attempts'])
+                continue
+            self.record_result(row, result)
+
+        elapsed = time.monotonic() - started
+        metrics.incr('documents.bytes', total_bytes)
+        self.stdout.write(
+            f"Processed {len(rows)} documents ({total_bytes / 1024 / 1024:.1f} MB) in {elapsed:.1f}s, "
+            f"{len(rows) / elapsed if elapsed else 0:.1f} docs/s"
+        )
+        return len(rows)
+
+    def _update(self, row, **fields):
+        # a document replaced mid-processing is queued again; leave that row alone
+        return ApplicantDocument.objects.filter(
+            id=row.id,
+            document_name=row.document_name,
+            status=ApplicantDocument.PROCESSING,
+        ).update(updated_at=timezone.now(), **fields)
+
+    def record_result(self, row, result):
+        self._update(
+            row,
+            status=ApplicantDocument.DONE if result['valid'] else ApplicantDocument.INVALID,
+            is_encrypted=result['encrypted'],
+            page_count=result['page_count'],
+            text=result['text'],
+            error=result['error'],
+            processed_at=timezone.now(),
+        )
+        metrics.incr('documents.processed' if result['valid'] else 'documents.invalid')
+
+    def record_failure(self, row, error, max_attempts):
+        retry = row.attempts < max_attempts
+        logger.warning("Document %s failed (attempt %d): %s", row.document_name, row.attempts, error)
+        self._update(
+            row,
+            status=ApplicantDocument.PENDING if retry else ApplicantDocument.FAILED,
+            error=error[:1000],
+        )
+        metrics.incr('documents.retried' if retry else 'documents.failed')
@@ -0,0 +1,32 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from applicants.models import ApplicantTombstone
+
+
+class Command(BaseCommand):
+    help = "Delete applicant tombstones older than the change feed retention window"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=settings.CHANGE_FEED_TOMBSTONE_DAYS)
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        total = 0
+
+        while True:
+            ids = list(
+                ApplicantTombstone.objects.filter(deleted_at__lt=cutoff)
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted, _ = ApplicantTombstone.objects.filter(id__in=ids).delete()
+            total += deleted
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {total} tombstones"))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from applicants.dedup import scan_all
+
+
+class Command(BaseCommand):
+    help = "Rebuild duplicate blocking keys for all applicants and rescore candidate pairs"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        indexed, stored = scan_all(options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {indexed} applicants, stored {stored} duplicate candidates"
+        ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from applicants.scoring import score_applicants
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored eligibility score of every applicant"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        scored = score_applicants(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"Scored {scored} applicants"))
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from applicants.models import Applicant, ArchivedApplicant, PendingDocumentDeletion
+from applicants.storage import iter_document_names, enqueue_document_deletions
+
+
+class Command(BaseCommand):
+    help = "Find stored documents no applicant refers to and queue them for deletion"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--prefix', default=Applicant._meta.get_field('document').upload_to,
+            help="Storage prefix to scan",
+        )
+        parser.add_argument(
+            '--min-age-hours', type=float, default=24,
+            help="Ignore objects newer than this, so in-flight uploads are not swept",
+        )
+        parser.add_argument('--dry-run', action='store_true', help="Only report orphans")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(hours=options['min_age_hours'])
+        scanned = orphaned = 0
+
+        for page in iter_document_names(options['prefix']):
+            scanned += len(page)
+            candidates = {name for name, modified in page if modified <= cutoff}
+            if not candidates:
+                continue
+
+            referenced = set(
+                Applicant.objects.filter(document__in=candidates).values_list('document', flat=True)
+            ) | set(
+                ArchivedApplicant.objects.filter(document__in=candidates).values_list('document', flat=True)
+            )
+            queued = set(
+                PendingDocumentDeletion.objects.filter(name__in=candidates).values_list('name', flat=True)
+            )
+            orphans = sorted(candidates - referenced - queued)
+            orphaned += len(orphans)
+
+            if options['dry_run']:
+                for name in orphans:
+                    self.stdout.write(name)
+            else:
+                enqueue_document_deletions(orphans)
+
+        action = "Found" if options['dry_run'] else "Queued"
+        self.stdout.write(self.style.SUCCESS(f"Scanned {scanned} objects. {action} {orphaned} orphans"))
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:06
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+# Prefix searches (istartswith) compile to UPPER(col) LIKE 'X%' on PostgreSQL,
+# which can only use an index built with the pattern operator class.
+PATTERN_INDEXES = (
+    ('applicants_full_name_upper_like', 'full_name'),
+    ('applicants_phone_number_upper_like', 'phone_number'),
+)
+
+
+def create_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, column in PATTERN_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON applicants (UPPER({column}) varchar_pattern_ops)'
+        )
+
+
+def drop_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _ in PATTERN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='applicant',
+            name='email',
+            field=models.EmailField(max_length=254, unique=True),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(django.db.models.functions.text.Upper('email'), name='applicants_email_upper_idx'),
+        ),
+        migrations.RunPython(create_pattern_indexes, drop_pattern_indexes),
+    ]
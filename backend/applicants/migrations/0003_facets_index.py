@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0002_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['interested_course', 'test_type', 'country'], name='applicants_facets_idx'),
+        ),
+    ]
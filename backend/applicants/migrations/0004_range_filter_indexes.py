@@ -0,0 +1,41 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0003_facets_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['created_at', 'id'], name='applicants_created_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['attended_date', 'id'], name='applicants_attended_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['overall_score', 'id'], name='applicants_overall_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['reading_score'], name='applicants_reading_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['listening_score'], name='applicants_listening_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['writing_score'], name='applicants_writing_score_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['speaking_score'], name='applicants_speaking_score_idx'),
+        ),
+    ]
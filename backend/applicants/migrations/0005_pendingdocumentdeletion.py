@@ -0,0 +1,30 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:10
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0004_range_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingDocumentDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=500)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('last_error', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Pending Document Deletion',
+                'verbose_name_plural': 'Pending Document Deletions',
+                'db_table': 'pending_document_deletions',
+                'ordering': ['id'],
+            },
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:11
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0005_pendingdocumentdeletion'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicantDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('document_name', models.CharField(max_length=500)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('done', 'Done'), ('invalid', 'Invalid'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('is_encrypted', models.BooleanField(default=False)),
+                ('page_count', models.PositiveIntegerField(blank=True, null=True)),
+                ('text', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                ('applicant', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='document_info', to='applicants.applicant')),
+            ],
+            options={
+                'verbose_name': 'Applicant Document',
+                'verbose_name_plural': 'Applicant Documents',
+                'db_table': 'applicant_documents',
+                'indexes': [models.Index(fields=['status', 'updated_at'], name='applicant_documents_queue_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0006_applicantdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicantBlockingKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=64)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='blocking_keys', to='applicants.applicant')),
+            ],
+            options={
+                'db_table': 'applicant_blocking_keys',
+            },
+        ),
+        migrations.CreateModel(
+            name='DuplicateCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('reasons', models.JSONField(default=dict)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_candidates', to='applicants.applicant')),
+                ('duplicate', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='applicants.applicant')),
+            ],
+            options={
+                'verbose_name': 'Duplicate Candidate',
+                'verbose_name_plural': 'Duplicate Candidates',
+                'db_table': 'duplicate_candidates',
+                'ordering': ['-score'],
+                'indexes': [models.Index(fields=['-score'], name='duplicate_candidates_score_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='duplicatecandidate',
+            constraint=models.UniqueConstraint(fields=('applicant', 'duplicate'), name='unique_duplicate_pair'),
+        ),
+        migrations.AddConstraint(
+            model_name='applicantblockingkey',
+            constraint=models.UniqueConstraint(fields=('applicant', 'key'), name='unique_applicant_blocking_key'),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0007_duplicate_detection'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicant',
+            name='eligibility_score',
+            field=models.FloatField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['eligibility_score', 'id'], name='applicants_eligibility_idx'),
+        ),
+    ]
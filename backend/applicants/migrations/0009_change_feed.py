@@ -0,0 +1,34 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:17
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0008_eligibility_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicantTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('applicant_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'applicant_tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['updated_at', 'id'], name='applicants_updated_at_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='applicanttombstone',
+            index=models.Index(fields=['deleted_at', 'id'], name='applicant_tombstones_idx'),
+        ),
+    ]
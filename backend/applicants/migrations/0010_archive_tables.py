@@ -0,0 +1,74 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:21
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('applicants', '0009_change_feed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedApplicant',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('full_name', models.CharField(max_length=255)),
+                ('email', models.EmailField(db_index=True, max_length=254)),
+                ('phone_number', models.CharField(max_length=20)),
+                ('interested_course', models.CharField(choices=[('Bachelors', 'Bachelors'), ('Masters', 'Masters'), ('Phd', 'PhD')], max_length=20)),
+                ('country', models.CharField(max_length=100)),
+                ('city', models.CharField(max_length=100)),
+                ('state', models.CharField(max_length=100)),
+                ('zipcode', models.CharField(max_length=20)),
+                ('street', models.TextField()),
+                ('test_type', models.CharField(max_length=10)),
+                ('overall_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('reading_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('listening_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('writing_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('speaking_score', models.DecimalField(decimal_places=2, max_digits=4)),
+                ('attended_date', models.DateField()),
+                ('eligibility_score', models.FloatField(blank=True, null=True)),
+                ('document', models.FileField(max_length=500, upload_to='applicant_documents/')),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_applicants', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Archived Applicant',
+                'verbose_name_plural': 'Archived Applicants',
+                'db_table': 'archived_applicants',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedAcademic',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('degree_level', models.CharField(choices=[('Intermediate', 'Intermediate'), ('Bachelors', 'Bachelors'), ('Masters', 'Masters')], max_length=20)),
+                ('degree_title', models.CharField(max_length=255)),
+                ('institution', models.CharField(max_length=255)),
+                ('passed_year', models.CharField(max_length=4)),
+                ('course_start_date', models.DateField()),
+                ('course_end_date', models.DateField()),
+                ('obtained_mark', models.DecimalField(decimal_places=2, max_digits=5)),
+                ('created_at', models.DateTimeField()),
+                ('applicant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='academics', to='applicants.archivedapplicant')),
+            ],
+            options={
+                'db_table': 'archived_academics',
+                'ordering': ['degree_level', '-passed_year'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='archivedapplicant',
+            index=models.Index(fields=['created_at', 'id'], name='archived_created_at_idx'),
+        ),
+    ]
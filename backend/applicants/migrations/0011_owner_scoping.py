@@ -0,0 +1,22 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0010_archive_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicanttombstone',
+            name='created_by_id',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='applicant',
+            index=models.Index(fields=['created_by', 'created_at'], name='applicants_owner_created_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:38
+
+import django.core.serializers.json
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0011_owner_scoping'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuditEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('applicant_id', models.BigIntegerField()),
+                ('object_type', models.CharField(choices=[('applicant', 'Applicant'), ('academic', 'Academic')], max_length=10)),
+                ('object_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')], max_length=6)),
+                ('changes', models.JSONField(default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('actor_id', models.BigIntegerField(null=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'verbose_name': 'Audit Entry',
+                'verbose_name_plural': 'Audit Log',
+                'db_table': 'applicant_audit_log',
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['applicant_id', 'created_at'], name='applicant_audit_history_idx'), models.Index(fields=['created_at'], name='applicant_audit_created_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+# The expression must match SearchVector('document_info__text', config='simple')
+# in filters.search_documents for PostgreSQL to use the index.
+INDEX_SQL = (
+    "CREATE INDEX IF NOT EXISTS applicant_documents_text_search_idx ON applicant_documents "
+    "USING gin (to_tsvector('simple'::regconfig, COALESCE(text, '')))"
+)
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(INDEX_SQL)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS applicant_documents_text_search_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applicants', '0012_audit_log'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -1,8 +1,25 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.utils import timezone
 
-class Applicant(models.Model):
+
+class LoadedValuesMixin:
+    """
+    Keeps the column values an instance was loaded with in
+    `_loaded_values`, so the audit log can diff a save against them without
+    re-reading the row.
+    """
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+
+class Applicant(LoadedValuesMixin, models.Model):
     BACHELORS = 'Bachelors'
     MASTERS = 'Masters'
     PHD = 'Phd'
@@ -41,6 +58,9 @@ class Applicant(models.Model):
     writing_score = models.DecimalField(max_digits=4, decimal_places=2)
     speaking_score = models.DecimalField(max_digits=4, decimal_places=2)
     attended_date = models.DateField()
+
+    # Weighted ranking score (0-100), maintained by applicants.scoring
+    eligibility_score = models.FloatField(null=True, blank=True, editable=False)
     
     # Document (stored locally for now, will move to S3 later)
     document = models.FileField(upload_to='applicant_documents/', max_length=500)
@@ -54,12 +74,35 @@ class Applicant(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Applicant'
         verbose_name_plural = 'Applicants'
+        indexes = [
+            # backs case-insensitive exact email search (email__iexact)
+            models.Index(Upper('email'), name='applicants_email_upper_idx'),
+            # covers the facet GROUP BY and exact facet filters
+            models.Index(
+                fields=['interested_course', 'test_type', 'country'],
+                name='applicants_facets_idx',
+            ),
+            # sortable columns, with id as the tie-breaker (see filters.ORDERING_FIELDS)
+            models.Index(fields=['created_at', 'id'], name='applicants_created_at_idx'),
+            models.Index(fields=['attended_date', 'id'], name='applicants_attended_date_idx'),
+            models.Index(fields=['overall_score', 'id'], name='applicants_overall_score_idx'),
+            models.Index(fields=['eligibility_score', 'id'], name='applicants_eligibility_idx'),
+            # documentation officers' scoped lists (see permissions.scope_applicants)
+            models.Index(fields=['created_by', 'created_at'], name='applicants_owner_created_idx'),
+            # change feed cursor (see applicants.changes)
+            models.Index(fields=['updated_at', 'id'], name='applicants_updated_at_idx'),
+            # section score range filters
+            models.Index(fields=['reading_score'], name='applicants_reading_score_idx'),
+            models.Index(fields=['listening_score'], name='applicants_listening_score_idx'),
+            models.Index(fields=['writing_score'], name='applicants_writing_score_idx'),
+            models.Index(fields=['speaking_score'], name='applicants_speaking_score_idx'),
+        ]
     
     def __str__(self):
         return f"{self.full_name} - {self.interested_course}"
 
 
-class Academic(models.Model):
+class Academic(LoadedValuesMixin, models.Model):
     INTERMEDIATE = 'Intermediate'
     BACHELORS = 'Bachelors'
     MASTERS = 'Masters'
@@ -93,4 +136,282 @@ class Academic(models.Model):
         verbose_name_plural = 'Academic Records'
     
     def __str__(self):
-        return f"{self.applicant.full_name} - {self.degree_level}"
\ No newline at end of file
+        return f"{self.applicant.full_name} - {self.degree_level}"
+
+class PendingDocumentDeletion(models.Model):
+    """
+    A stored document waiting to be removed from storage.
+
+    Rows are written in the same transaction that drops the reference to the
+    file and processed in batches by `process_document_deletions`, so
+    requests never wait on a storage round trip.
+    """
+    name = models.CharField(max_length=500)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'pending_document_deletions'
+        ordering = ['id']
+        verbose_name = 'Pending Document Deletion'
+        verbose_name_plural = 'Pending Document Deletions'
+
+    def __str__(self):
+        return self.name
+
+
+class ApplicantDocument(models.Model):
+    """
+    Result of background processing of an applicant's uploaded PDF:
+    structure checks, page count and the extracted text used for search.
+    """
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    DONE = 'done'
+    INVALID = 'invalid'
+    FAILED = 'failed'
+
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (PROCESSING, 'Processing'),
+        (DONE, 'Done'),
+        (INVALID, 'Invalid'),
+        (FAILED, 'Failed'),
+    ]
+
+    applicant = models.OneToOneField(
+        Applicant,
+        on_delete=models.CASCADE,
+        related_name='document_info'
+    )
+    # the Applicant.document name this row describes
+    document_name = models.CharField(max_length=500)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+
+    is_encrypted = models.BooleanField(default=False)
+    page_count = models.PositiveIntegerField(null=True, blank=True)
+    text = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'applicant_documents'
+        verbose_name = 'Applicant Document'
+        verbose_name_plural = 'Applicant Documents'
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='applicant_documents_queue_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.document_name} ({self.status})"
+
+
+class ApplicantBlockingKey(models.Model):
+    """
+    A blocking key (normalized phone, phonetic name code, MinHash LSH band)
+    for duplicate detection. Applicants sharing a key are compared.
+    """
+    applicant = models.ForeignKey(
+        Applicant,
+        on_delete=models.CASCADE,
+        related_name='blocking_keys'
+    )
+    key = models.CharField(max_length=64, db_index=True)
+
+    class Meta:
+        db_table = 'applicant_blocking_keys'
+        constraints = [
+            models.UniqueConstraint(fields=['applicant', 'key'], name='unique_applicant_blocking_key'),
+        ]
+
+    def __str__(self):
+        return self.key
+
+
+class DuplicateCandidate(models.Model):
+    """
+    A scored pair of applicants that may be the same person. The pair is
+    stored once, with `applicant_id < duplicate_id`.
+    """
+    applicant = models.ForeignKey(
+        Applicant,
+        on_delete=models.CASCADE,
+        related_name='duplicate_candidates'
+    )
+    duplicate = models.ForeignKey(
+        Applicant,
+        on_delete=models.CASCADE,
+        related_name='+'
+    )
+    score = models.FloatField()
+    reasons = models.JSONField(default=dict)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'duplicate_candidates'
+        ordering = ['-score']
+        verbose_name = 'Duplicate Candidate'
+        verbose_name_plural = 'Duplicate Candidates'
+        constraints = [
+            models.UniqueConstraint(fields=['applicant', 'duplicate'], name='unique_duplicate_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['-score'], name='duplicate_candidates_score_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.applicant_id} ~ {self.duplicate_id} ({self.score:.2f})"
+
+
+class ApplicantTombstone(models.Model):
+    """
+    Records a deleted applicant so change feed clients can drop it.
+    Pruned after `CHANGE_FEED_TOMBSTONE_DAYS` by `prune_tombstones`.
+    """
+    applicant_id = models.BigIntegerField()
+    # owner of the deleted applicant, so officers only see their own deletions
+    created_by_id = models.BigIntegerField(null=True)
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'applicant_tombstones'
+        ordering = ['deleted_at', 'id']
+        indexes = [
+            models.Index(fields=['deleted_at', 'id'], name='applicant_tombstones_idx'),
+        ]
+
+    def __str__(self):
+        return f"Applicant {self.applicant_id} deleted at {self.deleted_at}"
+
+
+class ArchivedApplicant(models.Model):
+    """
+    Cold copy of an applicant moved out of `applicants` by
+    `applicants.archive`. Keeps the original id and columns so it can be
+    restored unchanged; the hot-table indexes are not repeated here.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='archived_applicants'
+    )
+
+    full_name = models.CharField(max_length=255)
+    email = models.EmailField(db_index=True)
+    phone_number = models.CharField(max_length=20)
+    interested_course = models.CharField(max_length=20, choices=Applicant.COURSE_CHOICES)
+
+    country = models.CharField(max_length=100)
+    city = models.CharField(max_length=100)
+    state = models.CharField(max_length=100)
+    zipcode = models.CharField(max_length=20)
+    street = models.TextField()
+
+    test_type = models.CharField(max_length=10)
+    overall_score = models.DecimalField(max_digits=4, decimal_places=2)
+    reading_score = models.DecimalField(max_digits=4, decimal_places=2)
+    listening_score = models.DecimalField(max_digits=4, decimal_places=2)
+    writing_score = models.DecimalField(max_digits=4, decimal_places=2)
+    speaking_score = models.DecimalField(max_digits=4, decimal_places=2)
+    attended_date = models.DateField()
+    eligibility_score = models.FloatField(null=True, blank=True)
+
+    document = models.FileField(upload_to='applicant_documents/', max_length=500)
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'archived_applicants'
+        ordering = ['-created_at']
+        verbose_name = 'Archived Applicant'
+        verbose_name_plural = 'Archived Applicants'
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='archived_created_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.full_name} - {self.interested_course} (archived)"
+
+
+class ArchivedAcademic(models.Model):
+    id = models.BigIntegerField(primary_key=True)
+    applicant = models.ForeignKey(
+        ArchivedApplicant,
+        on_delete=models.CASCADE,
+        related_name='academics'
+    )
+
+    degree_level = models.CharField(max_length=20, choices=Academic.DEGREE_LEVEL_CHOICES)
+    degree_title = models.CharField(max_length=255)
+    institution = models.CharField(max_length=255)
+    passed_year = models.CharField(max_length=4)
+    course_start_date = models.DateField()
+    course_end_date = models.DateField()
+    obtained_mark = models.DecimalField(max_digits=5, decimal_places=2)
+
+    created_at = models.DateTimeField()
+
+    class Meta:
+        db_table = 'archived_academics'
+        ordering = ['degree_level', '-passed_year']
+
+    def __str__(self):
+        return f"{self.applicant.full_name} - {self.degree_level} (archived)"
+
+
+class AuditEntry(models.Model):
+    """
+    A create, update or delete of an applicant or one of its academic
+    records, with the changed fields as {field: [old, new]}. Written in
+    batches by `applicants.audit`; pruned after `AUDIT_RETENTION_DAYS` by
+    `prune_audit_log`.
+    """
+    CREATE = 'create'
+    UPDATE = 'update'
+    DELETE = 'delete'
+
+    ACTION_CHOICES = [
+        (CREATE, 'Create'),
+        (UPDATE, 'Update'),
+        (DELETE, 'Delete'),
+    ]
+
+    APPLICANT = 'applicant'
+    ACADEMIC = 'academic'
+
+    OBJECT_TYPE_CHOICES = [
+        (APPLICANT, 'Applicant'),
+        (ACADEMIC, 'Academic'),
+    ]
+
+    # plain ids, like tombstones: entries outlive the applicant and the user
+    applicant_id = models.BigIntegerField()
+    object_type = models.CharField(max_length=10, choices=OBJECT_TYPE_CHOICES)
+    object_id = models.BigIntegerField()
+    action = models.CharField(max_length=6, choices=ACTION_CHOICES)
+    changes = models.JSONField(default=dict, encoder=DjangoJSONEncoder)
+    actor_id = models.BigIntegerField(null=True)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'applicant_audit_log'
+        ordering = ['-created_at', '-id']
+        verbose_name = 'Audit Entry'
+        verbose_name_plural = 'Audit Log'
+        indexes = [
+            # per-applicant history, newest first
+            models.Index(fields=['applicant_id', 'created_at'], name='applicant_audit_history_idx'),
+            # retention pruning
+            models.Index(fields=['created_at'], name='applicant_audit_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.object_type} {self.object_id} {self.action} at {self.created_at}"
@@ -0,0 +1,57 @@
+"""
+PDF inspection, run inside the `process_documents` worker pool.
+
+Everything here is plain Python on bytes (no Django access), so it can be
+pickled to and run in a child process.
+"""
+import io
+
+from pypdf import PdfReader
+from pypdf.errors import PdfReadError
+
+# keep pathological documents from producing huge index rows
+MAX_PAGES = 200
+MAX_TEXT_LENGTH = 500000
+
+
+def inspect_pdf(data):
+    """
+    Verify the structure of a PDF and extract its text.
+
+    Returns a dict with `valid`, `encrypted`, `page_count`, `text` and
+    `error`. Invalid input is reported, not raised; only unexpected
+    failures raise (and are retried by the caller).
+    """
+    result = {'valid': False, 'encrypted': False, 'page_count': None, 'text': '', 'error': ''}
+
+    if not data.startswith(b'%PDF-'):
+        result['error'] = 'Not a PDF file (missing %PDF- header)'
+        return result
+
+    try:
+        reader = PdfReader(io.BytesIO(data), strict=False)
+
+        if reader.is_encrypted:
+            result['encrypted'] = True
+            # documents with only an owner password still open with ''
+            if not reader.decrypt(''):
+                result['error'] = 'PDF is password protected'
+                return result
+
+        result['page_count'] = len(reader.pages)
+
+        chunks = []
+        length = 0
+        for page in reader.pages[:MAX_PAGES]:
+            text = page.extract_text() or ''
+            chunks.append(text)
+            length += len(text)
+            if length >= MAX_TEXT_LENGTH:
+                break
+    except (PdfReadError, ValueError, KeyError, TypeError) as exc:
+        result['error'] = f'Corrupt PDF: {exc}'
+        return result
+
+    result['valid'] = True
+    result['text'] = '\n'.join(chunks)[:MAX_TEXT_LENGTH].replace('\x00', '')
+    return result
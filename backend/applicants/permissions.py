@@ -4,6 +4,17 @@ from django.contrib.auth import get_user_model
 User = get_user_model()
 
 
+def scope_applicants(queryset, user):
+    """
+    Restrict an applicant queryset to what `user` may see: everything for
+    admins, only their own applicants for documentation officers. Served by
+    the (created_by, created_at) index.
+    """
+    if user.role == User.ADMIN:
+        return queryset
+    return queryset.filter(created_by_id=user.pk)
+
+
 class IsAdminOrDocumentationOfficer(permissions.BasePermission):
     """
     Permission to allow both admin and documentation officer to access
@@ -38,7 +49,8 @@ class IsAdminOrOwner(permissions.BasePermission):
         if request.method == 'DELETE':
             return False
         
-        return obj.created_by == request.user
+        # compare ids so the related user is never loaded
+        return obj.created_by_id == request.user.pk
 
 
 class IsAdmin(permissions.BasePermission):
@@ -51,4 +63,4 @@ class IsAdmin(permissions.BasePermission):
             request.user.is_authenticated and 
             request.user.is_verified and
             request.user.role == User.ADMIN
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,76 @@
+"""
+Sparse fieldsets for applicant responses.
+
+    ?fields=id,full_name,email     only these fields
+    ?exclude=street,zipcode        everything except these
+    ?expand=academics              add the nested academic records
+
+The queryset is projected to match, so unrequested columns are not loaded,
+and the academics prefetch / created_by join only happen when needed.
+"""
+from rest_framework.exceptions import ValidationError
+
+from .serializers import ApplicantSerializer
+
+EXPANDABLE_FIELDS = ('academics',)
+
+# serializer fields that read something other than the column of the same name
+FIELD_SOURCES = {
+    'created_by_email': 'created_by__email',
+    'created_by_name': 'created_by__full_name',
+    'document_url': 'document',
+}
+
+
+def _split(params, name):
+    value = params.get(name)
+    if not value:
+        return []
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def get_field_selection(params):
+    """
+    Return the set of serializer field names requested by `params`, or None
+    when no selection was made (the full representation).
+    """
+    available = ApplicantSerializer.Meta.fields
+    fields = _split(params, 'fields')
+    exclude = _split(params, 'exclude')
+    expand = _split(params, 'expand')
+
+    for param, names, allowed in (
+        ('fields', fields, available),
+        ('exclude', exclude, available),
+        ('expand', expand, EXPANDABLE_FIELDS),
+    ):
+        unknown = [name for name in names if name not in allowed]
+        if unknown:
+            raise ValidationError({param: f"Unknown field(s): {', '.join(unknown)}"})
+
+    if not (fields or exclude):
+        return None
+
+    selected = set(fields or available)
+    selected.update(expand)
+    selected.difference_update(exclude)
+    return selected
+
+
+def project_applicants(queryset, selected=None):
+    """Restrict `queryset` to what serializing `selected` fields needs."""
+    if selected is None:
+        return queryset.select_related('created_by').prefetch_related('academics')
+
+    # created_by is needed for the owner check (created_by_id, no join)
+    columns = {'id', 'created_by'}
+    for name in selected:
+        if name == 'academics':
+            continue
+        columns.add(FIELD_SOURCES.get(name, name))
+
+    if any(column.startswith('created_by__') for column in columns):
+        queryset = queryset.select_related('created_by')
+    if 'academics' in selected:
+        queryset = queryset.prefetch_related('academics')
+    return queryset.only(*columns)
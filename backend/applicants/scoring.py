@@ -0,0 +1,129 @@
+"""
+Vectorized applicant eligibility scoring.
+
+Applicants are loaded in id-ordered batches into NumPy arrays and scored
+column-wise, then the scores are written back to `Applicant.eligibility_score`
+so ranking is an index scan instead of a Python sort.
+
+Every component is normalized to 0-1 before weighting:
+
+    overall         overall test score on the test's scale
+    section_mean    mean of the four section scores
+    section_min     weakest section score (universities often set a floor)
+    academic        mean Academic.obtained_mark, as a percentage
+
+The weights come from `ELIGIBILITY_WEIGHTS`; the stored score is the weighted
+sum divided by the total weight, times 100.
+"""
+import logging
+
+import numpy as np
+from django.conf import settings
+from django.db.models import Avg
+
+from .models import Applicant, Academic
+
+logger = logging.getLogger(__name__)
+
+SCORE_COLUMNS = ('overall_score', 'reading_score', 'listening_score', 'writing_score', 'speaking_score')
+
+# (min, max) of the overall score and of each section score per test type
+TEST_SCALES = {
+    'IELTS': ((0, 9), (0, 9)),
+    'TOEFL': ((0, 120), (0, 30)),
+    'PTE': ((10, 90), (10, 90)),
+}
+
+COMPONENTS = ('overall', 'section_mean', 'section_min', 'academic')
+
+
+def _scale_arrays(test_types):
+    """Return (overall_low, overall_high, section_low, section_high) per row."""
+    keys = np.char.upper(np.char.strip(test_types.astype(str)))
+    scales = np.full((len(keys), 4), np.nan)
+    for test_type, ((low, high), (section_low, section_high)) in TEST_SCALES.items():
+        scales[keys == test_type] = (low, high, section_low, section_high)
+    return scales.T
+
+
+def compute_scores(test_types, scores, academic_marks, weights=None):
+    """
+    Score a batch of applicants.
+
+    `test_types` is an array of test type strings, `scores` an (n, 5) array
+    in SCORE_COLUMNS order and `academic_marks` an array of mean obtained
+    marks (NaN when an applicant has no academic records). Returns an array
+    of scores between 0 and 100; applicants with an unknown test type only
+    get credit for their academics.
+    """
+    weights = weights or settings.ELIGIBILITY_WEIGHTS
+    overall_low, overall_high, section_low, section_high = _scale_arrays(test_types)
+
+    overall = (scores[:, 0] - overall_low) / (overall_high - overall_low)
+    sections = (scores[:, 1:] - section_low[:, None]) / (section_high - section_low)[:, None]
+
+    components = {
+        'overall': overall,
+        'section_mean': sections.mean(axis=1),
+        'section_min': sections.min(axis=1),
+        'academic': academic_marks / 100,
+    }
+
+    total = np.zeros(len(scores))
+    for name in COMPONENTS:
+        total += weights.get(name, 0) * np.nan_to_num(np.clip(components[name], 0, 1))
+
+    weight_sum = sum(weights.get(name, 0) for name in COMPONENTS) or 1
+    return np.round(total / weight_sum * 100, 2)
+
+
+def _load_batch(rows):
+    ids = np.array([row[0] for row in rows], dtype=np.int64)
+    test_types = np.array([row[1] for row in rows], dtype=object)
+    scores = np.array([row[2:] for row in rows], dtype=float)
+
+    marks = dict(
+        Academic.objects.filter(applicant_id__in=ids.tolist())
+        .values('applicant_id').annotate(mark=Avg('obtained_mark'))
+        .values_list('applicant_id', 'mark')
+    )
+    academic_marks = np.array([
+        np.nan if marks.get(i) is None else float(marks[i]) for i in ids.tolist()
+    ])
+    return ids, test_types, scores, academic_marks
+
+
+def score_applicants(ids=None, batch_size=5000):
+    """
+    Compute and store eligibility scores, for `ids` or for every applicant.
+    Returns the number of applicants scored.
+    """
+    queryset = Applicant.objects.order_by('id')
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    queryset = queryset.values_list('id', 'test_type', *SCORE_COLUMNS)
+
+    scored = 0
+    last_id = 0
+    while True:
+        rows = list(queryset.filter(id__gt=last_id)[:batch_size])
+        if not rows:
+            break
+        last_id = rows[-1][0]
+
+        batch_ids, test_types, scores, academic_marks = _load_batch(rows)
+        results = compute_scores(test_types, scores, academic_marks)
+
+        # bulk_update leaves updated_at alone: a rescore is not an edit
+        Applicant.objects.bulk_update(
+            [
+                Applicant(id=applicant_id, eligibility_score=score)
+                for applicant_id, score in zip(batch_ids.tolist(), results.tolist())
+            ],
+            ['eligibility_score'],
+            batch_size=1000,
+        )
+        scored += len(rows)
+
+    logger.info("Scored %d applicants", scored)
+    return scored
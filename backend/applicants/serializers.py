@@ -1,7 +1,14 @@
 from rest_framework import serializers
-from .models import Applicant, Academic
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.urls import reverse
+from .models import Applicant, Academic, ArchivedApplicant, ArchivedAcademic
+from .storage import enqueue_document_deletions
+from .documents import queue_document_processing
 import json
 
+User = get_user_model()
+
 
 class AcademicSerializer(serializers.ModelSerializer):
     class Meta:
@@ -20,7 +27,22 @@ class AcademicSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class ApplicantSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """
+    Accepts a `fields` kwarg (an iterable of field names) and drops every
+    other declared field, so unrequested fields are never computed.
+    """
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ApplicantSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     academics = AcademicSerializer(many=True, read_only=True)
 
     created_by_email = serializers.EmailField(source='created_by.email', read_only=True)
@@ -57,6 +79,7 @@ class ApplicantSerializer(serializers.ModelSerializer):
             'writing_score',
             'speaking_score',
             'attended_date',
+            'eligibility_score',
             
             # Document
             'document',
@@ -69,21 +92,44 @@ class ApplicantSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at'
         ]
-        read_only_fields = ['id', 'created_by', 'created_at', 'updated_at', 'document_url']
+        read_only_fields = ['id', 'created_by', 'created_at', 'updated_at', 'document_url', 'eligibility_score']
+        # the storage name/URL is never returned; files are read through document_url
+        extra_kwargs = {'document': {'write_only': True}}
     
     def get_document_url(self, obj):
-        
+        # served through the API instead of exposing the bucket URL
         if obj.document:
+            url = reverse('applicant-document', args=[obj.pk])
             request = self.context.get('request')
             if request:
-                return request.build_absolute_uri(obj.document.url)
-            return obj.document.url
+                return request.build_absolute_uri(url)
+            return url
         return None
 
 
+class ArchivedAcademicSerializer(AcademicSerializer):
+    class Meta(AcademicSerializer.Meta):
+        model = ArchivedAcademic
+
+
+class ArchivedApplicantSerializer(ApplicantSerializer):
+    """Read-only representation of an archived applicant"""
+    academics = ArchivedAcademicSerializer(many=True, read_only=True)
+
+    class Meta(ApplicantSerializer.Meta):
+        model = ArchivedApplicant
+        fields = ApplicantSerializer.Meta.fields + ['archived_at']
+        # document stays write-only (a field cannot be both)
+        read_only_fields = [name for name in fields if name != 'document']
+
+    def get_document_url(self, obj):
+        url = super().get_document_url(obj)
+        return f'{url}?include_archived=true' if url else None
+
+
 class ApplicantCreateSerializer(serializers.ModelSerializer):
     academics = serializers.JSONField(write_only=True)
-    document = serializers.FileField(required=True)
+    document = serializers.FileField(required=True, write_only=True)
     
     class Meta:
         model = Applicant
@@ -169,6 +215,7 @@ class ApplicantCreateSerializer(serializers.ModelSerializer):
         return attrs
 
 
+    @transaction.atomic
     def create(self, validated_data):
 
         # check if email already exists in Applicant model
@@ -193,13 +240,16 @@ class ApplicantCreateSerializer(serializers.ModelSerializer):
                 applicant=applicant,
                 **academic_data
             )
+
+        # PDF checks and text extraction run in the background
+        queue_document_processing(applicant)
         
         return applicant
 
 
 class ApplicantUpdateSerializer(serializers.ModelSerializer):
     academics = serializers.JSONField(write_only=True, required=False)
-    document = serializers.FileField(required=False)
+    document = serializers.FileField(required=False, write_only=True)
     
     class Meta:
         model = Applicant
@@ -265,13 +315,21 @@ class ApplicantUpdateSerializer(serializers.ModelSerializer):
         
         return value
     
+    @transaction.atomic
     def update(self, instance, validated_data):
         academics_data = validated_data.pop('academics', None)
+        old_document = instance.document.name
         
         # Update applicant fields
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
+
+        # The replaced file is removed later by process_document_deletions
+        if 'document' in validated_data:
+            if instance.document.name != old_document:
+                enqueue_document_deletions([old_document])
+            queue_document_processing(instance)
         
         # Update academic records if provided
         if academics_data is not None:
@@ -285,4 +343,39 @@ class ApplicantUpdateSerializer(serializers.ModelSerializer):
                     **academic_data
                 )
         
-        return instance
\ No newline at end of file
+        return instance
+
+
+class ApplicantBulkUpdateSerializer(serializers.ModelSerializer):
+    """
+    Scalar fields that may be set on many applicants at once. Unique,
+    file and nested fields (email, document, academics) are excluded.
+    """
+    created_by = serializers.PrimaryKeyRelatedField(queryset=User.objects.all(), required=False)
+
+    class Meta:
+        model = Applicant
+        fields = [
+            'created_by',
+
+            # Personal Info
+            'full_name',
+            'phone_number',
+            'interested_course',
+
+            # Address
+            'country',
+            'city',
+            'state',
+            'zipcode',
+            'street',
+
+            # Test Score
+            'test_type',
+            'overall_score',
+            'reading_score',
+            'listening_score',
+            'writing_score',
+            'speaking_score',
+            'attended_date',
+        ]
@@ -0,0 +1,130 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.db import transaction
+from django.utils import timezone
+import logging
+
+from .models import Applicant, Academic, ApplicantTombstone
+from .cache import FILTER_CHOICES_FIELDS, invalidate_filter_choices
+from .facets import FACET_FIELDS, invalidate_rollup
+from .dedup import FIELDS as DEDUP_FIELDS, update_duplicates
+from .scoring import SCORE_COLUMNS, score_applicants
+from .events import publish_applicant_event
+from . import audit
+
+logger = logging.getLogger(__name__)
+
+
+SCORING_FIELDS = {'test_type', *SCORE_COLUMNS}
+
+
+def _update_duplicates(applicant_ids):
+    try:
+        update_duplicates(applicant_ids)
+    except Exception:  # noqa: BLE001
+        # duplicate detection must never fail the write; scan_duplicates catches up
+        logger.exception("Duplicate detection failed for applicants %s", applicant_ids)
+
+
+def _score_applicants(applicant_ids):
+    try:
+        score_applicants(ids=applicant_ids)
+    except Exception:  # noqa: BLE001
+        # like duplicate detection, a failed rescore is caught up by score_applicants
+        logger.exception("Eligibility scoring failed for applicants %s", applicant_ids)
+
+
+def applicants_saved(applicants, created=False, fields=None):
+    """
+    Refresh everything derived from saved applicants: cached choice lists,
+    the facet rollup, duplicate candidates, eligibility scores, change
+    events and the audit log. Runs from post_save, and must be called by
+    hand after `bulk_update`, which sends no signals. With `fields`, only
+    work depending on those fields is done.
+    """
+    if not applicants:
+        return
+    fields = None if fields is None else set(fields)
+    ids = [applicant.pk for applicant in applicants]
+    if fields is None or fields & set(FILTER_CHOICES_FIELDS):
+        # a new country/test type only needs adding to the cached choice lists
+        invalidate_filter_choices(applicants[0] if len(applicants) == 1 else None)
+    if fields is None or fields & set(FACET_FIELDS):
+        invalidate_rollup()
+    if fields is None or fields & set(DEDUP_FIELDS):
+        transaction.on_commit(lambda: _update_duplicates(ids))
+    if fields is None or fields & SCORING_FIELDS:
+        transaction.on_commit(lambda: _score_applicants(ids))
+    for applicant in applicants:
+        publish_applicant_event('created' if created else 'updated', applicant.pk, applicant.created_by_id)
+        audit.record_save(applicant, created)
+
+
+@receiver(post_save, sender=Applicant)
+def applicant_saved(sender, instance, created, update_fields=None, **kwargs):
+    applicants_saved([instance], created, update_fields)
+
+
+@receiver(post_delete, sender=Applicant)
+def applicant_deleted(sender, instance, **kwargs):
+    invalidate_filter_choices()
+    invalidate_rollup()
+    # lets change feed clients drop the applicant
+    ApplicantTombstone.objects.create(applicant_id=instance.pk, created_by_id=instance.created_by_id)
+    publish_applicant_event('deleted', instance.pk, instance.created_by_id)
+    audit.record_delete(instance)
+
+
+class AcademicChanges:
+    """
+    Applicants whose academics changed in one transaction. Each gets one
+    updated_at bump and one change event, and is rescored once on commit,
+    however many of its academics were written.
+    """
+
+    def __init__(self):
+        self.applicant_ids = set()
+
+    def add(self, academic):
+        applicant_id = academic.applicant_id
+        if applicant_id in self.applicant_ids:
+            return
+        self.applicant_ids.add(applicant_id)
+        if Academic.applicant.is_cached(academic):
+            owner_id = academic.applicant.created_by_id
+        else:
+            owner_id = Applicant.objects.filter(pk=applicant_id).values_list('created_by_id', flat=True).first()
+        # academics are part of the applicant for change feed clients
+        Applicant.objects.filter(pk=applicant_id).update(updated_at=timezone.now())
+        publish_applicant_event('updated', applicant_id, owner_id)
+
+    def __call__(self):
+        # obtained_mark feeds the parent applicant's eligibility score
+        _score_applicants(sorted(self.applicant_ids))
+
+
+def _record_academic_change(academic, using):
+    connection = transaction.get_connection(using)
+    changes = getattr(connection, 'academic_changes', None)
+    # still pending unless the transaction committed or rolled back since
+    if changes is not None and any(entry[1] is changes for entry in connection.run_on_commit):
+        changes.add(academic)
+        return
+    changes = connection.academic_changes = AcademicChanges()
+    changes.add(academic)
+    # outside a transaction this runs right away
+    transaction.on_commit(changes, using=using)
+
+
+@receiver(post_save, sender=Academic)
+@receiver(post_delete, sender=Academic)
+def academic_changed(sender, instance, using, **kwargs):
+    # nothing to refresh when the academics go with their applicant
+    origin = kwargs.get('origin')
+    if isinstance(origin, Applicant) or getattr(origin, 'model', None) is Applicant:
+        return
+    if 'created' in kwargs:
+        audit.record_save(instance, kwargs['created'])
+    else:
+        audit.record_delete(instance)
+    _record_academic_change(instance, using)
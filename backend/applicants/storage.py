@@ -0,0 +1,93 @@
+"""
+Helpers for the storage behind `Applicant.document`.
+"""
+import logging
+
+from storages.backends.s3 import S3Storage
+from storages.utils import clean_name
+
+from .models import Applicant, PendingDocumentDeletion
+
+logger = logging.getLogger(__name__)
+
+# S3 DeleteObjects accepts at most 1000 keys per call
+DELETE_BATCH_SIZE = 1000
+
+
+def document_storage():
+    return Applicant._meta.get_field('document').storage
+
+
+def enqueue_document_deletions(names):
+    """
+    Queue stored documents for deletion. Call inside the transaction that
+    removes the references so the queue and the rows stay consistent.
+    """
+    PendingDocumentDeletion.objects.bulk_create(
+        PendingDocumentDeletion(name=name) for name in dict.fromkeys(names) if name
+    )
+
+
+def delete_documents(names):
+    """
+    Delete stored documents by name.
+
+    On S3 this uses batched DeleteObjects calls instead of one request per
+    object. Returns a dict mapping each name that could not be deleted to an
+    error message; missing objects are not errors.
+    """
+    names = [name for name in dict.fromkeys(names) if name]
+    storage = document_storage()
+    failed = {}
+
+    if not isinstance(storage, S3Storage):
+        for name in names:
+            try:
+                storage.delete(name)
+            except Exception as exc:  # noqa: BLE001
+                failed[name] = str(exc)
+        return failed
+
+    client = storage.connection.meta.client
+    for start in range(0, len(names), DELETE_BATCH_SIZE):
+        batch = names[start:start + DELETE_BATCH_SIZE]
+        keys = {storage._normalize_name(clean_name(name)): name for name in batch}
+        try:
+            response = client.delete_objects(
+                Bucket=storage.bucket_name,
+                Delete={'Objects': [{'Key': key} for key in keys], 'Quiet': True},
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.error("DeleteObjects failed for %d documents: %s", len(batch), exc)
+            failed.update({name: str(exc) for name in batch})
+            continue
+
+        for error in response.get('Errors', []):
+            name = keys.get(error.get('Key'), error.get('Key'))
+            failed[name] = error.get('Message') or error.get('Code', 'unknown error')
+
+    return failed
+
+
+def iter_document_names(prefix):
+    """
+    Yield lists of stored file names under `prefix`, with their last
+    modified time, one storage listing page at a time.
+    """
+    storage = document_storage()
+
+    if not isinstance(storage, S3Storage):
+        directories, files = storage.listdir(prefix)
+        yield [(f'{prefix}{name}', storage.get_modified_time(f'{prefix}{name}')) for name in files]
+        for directory in directories:
+            yield from iter_document_names(f'{prefix}{directory}/')
+        return
+
+    location = storage.location.strip('/')
+    location = f'{location}/' if location else ''
+    paginator = storage.connection.meta.client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=f'{location}{prefix}'):
+        yield [
+            (item['Key'][len(location):], item['LastModified'])
+            for item in page.get('Contents', [])
+        ]
@@ -1,5 +1,8 @@
 from django.urls import path
-from .views import ApplicantListCreateView, ApplicantDetailView, AnalyticsView
+from .events import applicant_events
+from .views import (ApplicantListCreateView, ApplicantDetailView, ApplicantBatchView, ApplicantBulkView, ApplicantTopView, ApplicantChangesView, ApplicantDocumentView, ApplicantDuplicatesView,
+                    DuplicateCandidateListView, ApplicantArchiveView,
+                    ApplicantRestoreView, ApplicantHistoryView, AnalyticsView)
 
 urlpatterns = [
     # List all applicants and create new applicant
@@ -8,5 +11,34 @@ urlpatterns = [
     # Retrieve, update, delete specific applicant
     path('<int:pk>/', ApplicantDetailView.as_view(), name='applicant-detail'),
 
+    # Stream the applicant's document (supports Range requests)
+    path('<int:pk>/document/', ApplicantDocumentView.as_view(), name='applicant-document'),
+
+    # Retrieve several applicants at once (?ids=1,2,3)
+    path('batch/', ApplicantBatchView.as_view(), name='applicant-batch'),
+
+    # Update or delete many applicants (by ids or filter)
+    path('bulk/', ApplicantBulkView.as_view(), name='applicant-bulk'),
+
+    # Hot/cold archival
+    path('<int:pk>/archive/', ApplicantArchiveView.as_view(), name='applicant-archive'),
+    path('archived/<int:pk>/restore/', ApplicantRestoreView.as_view(), name='applicant-restore'),
+
+    # Field-level change history
+    path('<int:pk>/history/', ApplicantHistoryView.as_view(), name='applicant-history'),
+
+    # Server-sent events for live dashboards
+    path('events/', applicant_events, name='applicant-events'),
+
+    # Incremental sync: rows changed / deleted since a cursor
+    path('changes/', ApplicantChangesView.as_view(), name='applicant-changes'),
+
+    # Highest eligibility scores first
+    path('top/', ApplicantTopView.as_view(), name='applicant-top'),
+
+    # Scored candidate duplicate pairs
+    path('duplicates/', DuplicateCandidateListView.as_view(), name='duplicate-list'),
+    path('<int:pk>/duplicates/', ApplicantDuplicatesView.as_view(), name='applicant-duplicates'),
+
      path('analytics/', AnalyticsView.as_view(), name='analytics'),
 ]
\ No newline at end of file
@@ -1,61 +1,134 @@
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
 from rest_framework.parsers import MultiPartParser, FormParser
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import BaseRenderer
 from django.shortcuts import get_object_or_404
+from django.http import FileResponse, Http404, HttpResponse, StreamingHttpResponse
+import heapq
+import json
+import os
+import re
 from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.db.models import Q
+from django.db import transaction
 
-from .models import Applicant, Academic
+from backend.idempotency import IdempotencyMixin
+from backend.renderers import ORJSONRenderer
+from backend.routers import ReplicaReadMixin
+from .models import Applicant, Academic, ArchivedApplicant, ApplicantTombstone, AuditEntry, DuplicateCandidate
 from .serializers import (
     ApplicantSerializer,
     ApplicantCreateSerializer,
-    ApplicantUpdateSerializer
+    ApplicantUpdateSerializer,
+    ApplicantBulkUpdateSerializer,
+    ArchivedApplicantSerializer
 )
+from .filters import filter_applicants, get_ordering
+from .facets import compute_facets, DEFAULT_FACET_LIMIT
+from .projection import get_field_selection, project_applicants
+from .storage import enqueue_document_deletions
+from .document_cache import document_cache, CHUNK_SIZE
+from .analytics import get_analytics
+from .archive import include_archived, archive_applicant, restore_applicant
+from .signals import applicants_saved
+from .changes import CursorExpired, encode_cursor, get_position, read_changes
+from .audit import AuditActorMixin
 from django.utils import timezone
 
-# from .permissions import IsAdminOrDocumentationOfficer, IsAdminOrOwner
+from .permissions import IsAdminOrOwner, scope_applicants
 
 User = get_user_model()
 
 
-class ApplicantListCreateView(APIView):
+def serialize_with_archived(request, applicants, archived, selected):
+    """
+    Serialize hot and archived applicants as one list in the requested
+    ordering, merging the two already-sorted querysets.
+    """
+    ordering, _ = get_ordering(request.query_params)
+    name = ordering.lstrip('-')
+
+    def key(applicant):
+        value = getattr(applicant, name)
+        # NULLs last ascending, first descending, like PostgreSQL
+        return (value is None, value if value is not None else 0, applicant.id)
+
+    # the sort column must be loaded even when it is not a selected field
+    loaded = None if selected is None else selected | {name}
+    archived_selected = None if selected is None else selected | {'archived_at'}
+    hot = list(project_applicants(applicants, loaded))
+    cold = list(project_applicants(archived, None if loaded is None else loaded | {'archived_at'}))
+
+    context = {'request': request}
+    hot_data = ApplicantSerializer(hot, many=True, fields=selected, context=context).data
+    cold_data = ArchivedApplicantSerializer(cold, many=True, fields=archived_selected, context=context).data
+
+    merged = heapq.merge(
+        zip(map(key, hot), hot_data),
+        zip(map(key, cold), cold_data),
+        key=lambda item: item[0],
+        reverse=ordering.startswith('-'),
+    )
+    return [data for _, data in merged]
+
+
+class ApplicantListCreateView(IdempotencyMixin, AuditActorMixin, ReplicaReadMixin, APIView):
     """
     GET: List all applicants (with filtering based on user role)
-    POST: Create a new applicant
+    POST: Create a new applicant (honours Idempotency-Key)
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAdminOrOwner]
     parser_classes = [MultiPartParser, FormParser]
     
     def get(self, request):
         """List all applicants"""
         user = request.user
 
-        applicants = Applicant.objects.all()
+        # documentation officers only see their own applicants
+        applicants = scope_applicants(Applicant.objects.all(), user)
        
         # Optional filtering by query params
-        interested_course = request.query_params.get('interested_course')
-        if interested_course:
-            applicants = applicants.filter(interested_course=interested_course)
-        
-        search = request.query_params.get('search')
-        if search:
-            applicants = applicants.filter(
-                full_name__icontains=search
-            ) | applicants.filter(
-                email__icontains=search
+        applicants = filter_applicants(applicants, request.query_params)
+
+        # Optional sparse fieldset: ?fields=... / ?exclude=... / ?expand=academics
+        selected = get_field_selection(request.query_params)
+
+        # archived applicants are only listed on request: ?include_archived=true
+        if include_archived(request.query_params):
+            archived = filter_applicants(
+                scope_applicants(ArchivedApplicant.objects.all(), user), request.query_params
+            )
+            data = {
+                'count': applicants.count() + archived.count(),
+                'results': serialize_with_archived(request, applicants, archived, selected)
+            }
+        else:
+            serializer = ApplicantSerializer(
+                project_applicants(applicants, selected),
+                many=True,
+                fields=selected,
+                context={'request': request}
+            )
+
+            data = {
+                'count': applicants.count(),
+                'results': serializer.data
+            }
+
+        # Optional facet counts for the filter sidebar: ?facets=true&facet_limit=10
+        if request.query_params.get('facets') in ('1', 'true'):
+            try:
+                limit = int(request.query_params.get('facet_limit', DEFAULT_FACET_LIMIT))
+            except ValueError:
+                limit = DEFAULT_FACET_LIMIT
+            data['facets'] = compute_facets(
+                applicants, request.query_params, limit, use_rollup=user.role == User.ADMIN
             )
         
-        serializer = ApplicantSerializer(
-            applicants,
-            many=True,
-            context={'request': request}
-        )
-        
-        return Response({
-            'count': applicants.count(),
-            'results': serializer.data
-        }, status=status.HTTP_200_OK)
+        return Response(data, status=status.HTTP_200_OK)
     
     def post(self, request):
         """Create a new applicant"""
@@ -85,26 +158,51 @@ class ApplicantListCreateView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class ApplicantDetailView(APIView):
+class ApplicantDetailView(AuditActorMixin, ReplicaReadMixin, APIView):
     """
     GET: Retrieve a single applicant
     PUT/PATCH: Update an applicant
     DELETE: Delete an applicant
     """
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAdminOrOwner]
     parser_classes = [MultiPartParser, FormParser]
     
+    def can_access(self, request, applicant):
+        return all(p.has_object_permission(request, self, applicant) for p in self.get_permissions())
+
     def get_object(self, pk, user):
         """Get applicant object with permission check"""
         applicant = get_object_or_404(Applicant, pk=pk)
+        if not self.can_access(self.request, applicant):
+            return None
         
         return applicant
     
     def get(self, request, pk):
         """Retrieve applicant details"""
-        applicant = self.get_object(pk, request.user)
+        selected = get_field_selection(request.query_params)
+        applicant = project_applicants(Applicant.objects.all(), selected).filter(pk=pk).first()
+
+        if applicant is None and include_archived(request.query_params):
+            archived_selected = None if selected is None else selected | {'archived_at'}
+            archived = get_object_or_404(
+                project_applicants(ArchivedApplicant.objects.all(), archived_selected), pk=pk
+            )
+            if not self.can_access(request, archived):
+                return Response(
+                    {'error': 'You do not have permission to view this applicant'},
+                    status=status.HTTP_403_FORBIDDEN
+                )
+            serializer = ArchivedApplicantSerializer(
+                archived,
+                fields=archived_selected,
+                context={'request': request}
+            )
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        if applicant is None:
+            raise Http404
         
-        if not applicant:
+        if not self.can_access(request, applicant):
             return Response(
                 {'error': 'You do not have permission to view this applicant'},
                 status=status.HTTP_403_FORBIDDEN
@@ -112,6 +210,7 @@ class ApplicantDetailView(APIView):
         
         serializer = ApplicantSerializer(
             applicant,
+            fields=selected,
             context={'request': request}
         )
         
@@ -191,37 +290,579 @@ class ApplicantDetailView(APIView):
         user = request.user
 
         
-        applicant = get_object_or_404(Applicant, pk=pk)
-        
-        # Delete the document file if it exists
-        if applicant.document:
-            applicant.document.delete()
+        applicant = self.get_object(pk, user)
+
+        if not applicant:
+            return Response(
+                {'error': 'You do not have permission to delete this applicant'},
+                status=status.HTTP_403_FORBIDDEN
+            )
         
-        applicant.delete()
+        # Queue the document file for deletion together with the row
+        with transaction.atomic():
+            enqueue_document_deletions([applicant.document.name])
+            applicant.delete()
         
         return Response(
             {'message': 'Applicant deleted successfully'},
             status=status.HTTP_200_OK
         )
     
-class AnalyticsView(APIView):
-    permission_classes = [IsAuthenticated]
+class ApplicantBatchView(ReplicaReadMixin, APIView):
+    """
+    GET: Retrieve several applicants in one request (?ids=1,2,3)
+
+    Results keep the order of `ids`; ids that do not exist or may not be
+    viewed are listed in `errors`. Supports the same fields/exclude/expand
+    parameters as the list endpoint.
+    """
+    permission_classes = [IsAdminOrOwner]
 
     def get(self, request):
+        raw_ids = request.query_params.get('ids', '')
+        try:
+            ids = list(dict.fromkeys(
+                int(value) for value in raw_ids.split(',') if value.strip()
+            ))
+        except ValueError:
+            return Response(
+                {'error': 'ids must be a comma separated list of integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if not ids:
+            return Response(
+                {'error': 'At least one id is required'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_ids = settings.APPLICANT_BATCH_MAX_IDS
+        if len(ids) > max_ids:
+            return Response(
+                {'error': f'At most {max_ids} ids can be requested at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        selected = get_field_selection(request.query_params)
+        applicants = project_applicants(Applicant.objects.filter(id__in=ids), selected)
+        found = {applicant.id: applicant for applicant in applicants}
+
+        permissions = self.get_permissions()
+        results = []
+        errors = []
+        for applicant_id in ids:
+            applicant = found.get(applicant_id)
+            if applicant is None:
+                errors.append({'id': applicant_id, 'error': 'not_found'})
+            elif not all(p.has_object_permission(request, self, applicant) for p in permissions):
+                errors.append({'id': applicant_id, 'error': 'forbidden'})
+            else:
+                results.append(applicant)
+
+        serializer = ApplicantSerializer(
+            results,
+            many=True,
+            fields=selected,
+            context={'request': request}
+        )
+
+        return Response({
+            'results': serializer.data,
+            'errors': errors
+        }, status=status.HTTP_200_OK)
+
+
+class ApplicantBulkView(IdempotencyMixin, AuditActorMixin, ReplicaReadMixin, APIView):
+    """
+    PATCH: Set the same scalar fields on many applicants
+    DELETE: Delete many applicants (documents are removed asynchronously)
+
+    The body selects applicants either by id or by the list endpoint's
+    filter parameters:
+
+        {"ids": [1, 2, 3], "data": {"created_by": 4}}
+        {"filter": {"country": "Nepal", "created_at_before": "2020-01-01"}}
+
+    Each id is reported in `results` or `errors`. Both methods honour
+    Idempotency-Key.
+    """
+    permission_classes = [IsAdminOrOwner]
+    idempotent_methods = ('PATCH', 'DELETE')
+
+    def get_targets(self, request):
+        """Return (applicants, errors) or raise ValidationError."""
+        ids = request.data.get('ids')
+        filters = request.data.get('filter')
+        max_items = settings.APPLICANT_BULK_MAX_ITEMS
+
+        if (ids is None) == (filters is None):
+            raise ValidationError({'error': 'Provide exactly one of "ids" or "filter"'})
+
+        if ids is not None:
+            if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+                raise ValidationError({'ids': 'Must be a list of integers'})
+            ids = list(dict.fromkeys(ids))
+            queryset = Applicant.objects.filter(id__in=ids)
+        else:
+            if not isinstance(filters, dict) or not filters:
+                raise ValidationError({'filter': 'Must be a non-empty object of list filters'})
+            queryset = filter_applicants(scope_applicants(Applicant.objects.all(), request.user), filters)
+            ids = list(queryset.values_list('id', flat=True)[:max_items + 1])
+
+        if len(ids) > max_items:
+            raise ValidationError({'error': f'At most {max_items} applicants can be changed at once'})
+
+        found = {applicant.id: applicant for applicant in queryset.filter(id__in=ids)}
+        permissions = self.get_permissions()
+        applicants = []
+        errors = []
+        for applicant_id in ids:
+            applicant = found.get(applicant_id)
+            if applicant is None:
+                errors.append({'id': applicant_id, 'error': 'not_found'})
+            elif not all(p.has_object_permission(request, self, applicant) for p in permissions):
+                errors.append({'id': applicant_id, 'error': 'forbidden'})
+            else:
+                applicants.append(applicant)
+        return applicants, errors
+
+    def patch(self, request):
+        """Bulk update scalar fields"""
+        serializer = ApplicantBulkUpdateSerializer(data=request.data.get('data') or {}, partial=True)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        if not serializer.validated_data:
+            return Response({'data': 'No fields to update'}, status=status.HTTP_400_BAD_REQUEST)
+
+        applicants, errors = self.get_targets(request)
+
+        # bulk_update bypasses auto_now, so bump updated_at explicitly
         now = timezone.now()
-        start_this_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        fields = list(serializer.validated_data) + ['updated_at']
+        for applicant in applicants:
+            for attr, value in serializer.validated_data.items():
+                setattr(applicant, attr, value)
+            applicant.updated_at = now
+        Applicant.objects.bulk_update(applicants, fields, batch_size=500)
+        # bulk_update sends no post_save signals
+        applicants_saved(applicants, fields=serializer.validated_data)
+
+        return Response({
+            'results': [{'id': applicant.id, 'status': 'updated'} for applicant in applicants],
+            'errors': errors
+        }, status=status.HTTP_200_OK)
+
+    def delete(self, request):
+        """Bulk delete"""
+        applicants, errors = self.get_targets(request)
+        documents = {applicant.id: applicant.document.name for applicant in applicants}
+
+        # documents are queued and removed in batches by process_document_deletions
+        with transaction.atomic():
+            enqueue_document_deletions(documents.values())
+            Applicant.objects.filter(id__in=list(documents)).delete()
+
+        return Response({
+            'results': [{'id': applicant_id, 'status': 'deleted'} for applicant_id in documents],
+            'errors': errors
+        }, status=status.HTTP_200_OK)
+
+
+class PDFRenderer(BaseRenderer):
+    """
+    Lets clients send `Accept: application/pdf`. Successful responses are
+    file responses built by the view; only error payloads reach `render`.
+    """
+    media_type = 'application/pdf'
+    format = 'pdf'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode() if data is not None else b''
+
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_range(header, size):
+    """
+    Parse a single-range `Range` header into (start, end) inclusive.
+
+    Returns None to serve the whole file (no header, or a form we do not
+    handle such as multiple ranges) and raises ValueError if the range
+    cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError
+    return start, end
+
+
+def iter_file_range(path, start, end):
+    with open(path, 'rb') as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+class ApplicantDocumentView(ReplicaReadMixin, APIView):
+    """
+    GET: Stream an applicant's document through the API
+
+    Supports `Range` (single byte range), `If-None-Match` and `If-Range`.
+    Files are served from a local LRU cache and fetched from storage on a miss.
+    """
+    permission_classes = [IsAdminOrOwner]
+    renderer_classes = [ORJSONRenderer, PDFRenderer]
+
+    def get(self, request, pk):
+        model = ArchivedApplicant if include_archived(request.query_params) else Applicant
+        applicant = model.objects.only('id', 'created_by', 'document').filter(pk=pk).first()
+        if applicant is None and model is ArchivedApplicant:
+            applicant = Applicant.objects.only('id', 'created_by', 'document').filter(pk=pk).first()
+        if applicant is None:
+            raise Http404
+        self.check_object_permissions(request, applicant)
+
+        name = applicant.document.name
+        if not name:
+            return Response({'error': 'No document uploaded'}, status=status.HTTP_404_NOT_FOUND)
+
+        etag = f'"{document_cache.etag(name)}"'
+        headers = {
+            'ETag': etag,
+            'Accept-Ranges': 'bytes',
+            'Cache-Control': 'private, max-age=3600',
+        }
+
+        if etag in [tag.strip() for tag in request.headers.get('If-None-Match', '').split(',')]:
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+            for header, value in headers.items():
+                response[header] = value
+            return response
+
+        path = document_cache.get(name)
+        size = os.path.getsize(path)
+
+        range_header = request.headers.get('Range')
+        if_range = request.headers.get('If-Range')
+        if if_range and if_range.strip() != etag:
+            range_header = None
+
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
 
-        total = Applicant.objects.count()
-        this_month = Applicant.objects.filter(created_at__gte=start_this_month).count()
+        filename = os.path.basename(name)
+        if byte_range is None:
+            response = FileResponse(open(path, 'rb'), content_type='application/pdf', filename=filename)
+        else:
+            start, end = byte_range
+            response = StreamingHttpResponse(
+                iter_file_range(path, start, end),
+                status=status.HTTP_206_PARTIAL_CONTENT,
+                content_type='application/pdf',
+            )
+            response['Content-Length'] = str(end - start + 1)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Content-Disposition'] = f'inline; filename="{filename}"'
+
+        for header, value in headers.items():
+            response[header] = value
+        return response
+
+
+class ApplicantChangesView(APIView):
+    """
+    GET: Applicants changed and deleted since a cursor (see applicants.changes)
+
+    Query params: cursor or updated_since, limit, plus ?fields= / ?exclude= /
+    ?expand= for the changed applicants.
+
+    Always reads the primary: replica lag could let a cursor move past rows
+    the replica has not received yet.
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', settings.CHANGE_FEED_PAGE_SIZE))
+        except ValueError:
+            return Response(
+                {'error': 'limit must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, settings.CHANGE_FEED_MAX_PAGE_SIZE))
+
+        position = get_position(request.query_params)
+        try:
+            changed_ids, deleted_ids, next_position, has_more = read_changes(position, limit, request.user)
+        except CursorExpired:
+            return Response(
+                {'error': 'Cursor has expired, a full resync is required'},
+                status=status.HTTP_410_GONE
+            )
 
-        completed = 0
-        pending = total - completed  
+        selected = get_field_selection(request.query_params)
+        applicants = project_applicants(Applicant.objects.filter(id__in=changed_ids), selected)
+        found = {applicant.id: applicant for applicant in applicants}
+
+        serializer = ApplicantSerializer(
+            [found[applicant_id] for applicant_id in changed_ids if applicant_id in found],
+            many=True,
+            fields=selected,
+            context={'request': request}
+        )
+
+        return Response({
+            'changed': serializer.data,
+            'deleted': deleted_ids,
+            'next_cursor': encode_cursor(next_position),
+            'has_more': has_more
+        }, status=status.HTTP_200_OK)
+
+
+class ApplicantTopView(ReplicaReadMixin, APIView):
+    """
+    GET: The k applicants with the highest eligibility score
+
+    Accepts ?k= (default 20) plus the list endpoint's filter and field
+    selection parameters. Reads the stored score through its index; run
+    `score_applicants` after changing ELIGIBILITY_WEIGHTS.
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def get(self, request):
+        try:
+            k = int(request.query_params.get('k', 20))
+        except ValueError:
+            return Response(
+                {'error': 'k must be an integer'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        max_k = settings.APPLICANT_TOP_MAX
+        if not 1 <= k <= max_k:
+            return Response(
+                {'error': f'k must be between 1 and {max_k}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        applicants = (
+            filter_applicants(scope_applicants(Applicant.objects.all(), request.user), request.query_params)
+            .filter(eligibility_score__isnull=False)
+            .order_by('-eligibility_score', '-id')[:k]
+        )
+
+        selected = get_field_selection(request.query_params)
+        serializer = ApplicantSerializer(
+            project_applicants(applicants, selected),
+            many=True,
+            fields=selected,
+            context={'request': request}
+        )
+
+        return Response({
+            'results': serializer.data
+        }, status=status.HTTP_200_OK)
+
+
+def scope_candidates(queryset, user):
+    """Officers only see pairs made of their own applicants."""
+    if user.role == User.ADMIN:
+        return queryset
+    return queryset.filter(applicant__created_by_id=user.pk, duplicate__created_by_id=user.pk)
+
+
+def serialize_duplicate_pairs(candidates):
+    summary = lambda applicant: {
+        'id': applicant.id,
+        'full_name': applicant.full_name,
+        'email': applicant.email,
+        'phone_number': applicant.phone_number,
+    }
+    return [
+        {
+            'applicant': summary(candidate.applicant),
+            'duplicate': summary(candidate.duplicate),
+            'score': candidate.score,
+            'reasons': candidate.reasons,
+        }
+        for candidate in candidates
+    ]
+
+
+class DuplicateCandidateListView(ReplicaReadMixin, APIView):
+    """
+    GET: Scored candidate duplicate pairs, best first
+
+    Query params: min_score (default 0), limit (default 50, max 500), offset.
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def get(self, request):
+        try:
+            min_score = float(request.query_params.get('min_score', 0))
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
+            return Response(
+                {'error': 'min_score, limit and offset must be numbers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        candidates = (
+            scope_candidates(DuplicateCandidate.objects.filter(score__gte=min_score), request.user)
+            .select_related('applicant', 'duplicate')
+            .order_by('-score', 'id')[offset:offset + limit]
+        )
+
+        return Response({
+            'results': serialize_duplicate_pairs(candidates)
+        }, status=status.HTTP_200_OK)
+
+
+class ApplicantDuplicatesView(ReplicaReadMixin, APIView):
+    """
+    GET: Candidate duplicates of one applicant
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def get(self, request, pk):
+        applicant = get_object_or_404(Applicant.objects.only('id', 'created_by'), pk=pk)
+        self.check_object_permissions(request, applicant)
+
+        candidates = (
+            scope_candidates(DuplicateCandidate.objects.filter(Q(applicant_id=pk) | Q(duplicate_id=pk)), request.user)
+            .select_related('applicant', 'duplicate')
+            .order_by('-score')
+        )
+
+        return Response({
+            'results': serialize_duplicate_pairs(candidates)
+        }, status=status.HTTP_200_OK)
+
+
+class ApplicantArchiveView(AuditActorMixin, ReplicaReadMixin, APIView):
+    """
+    POST: Move an applicant to the archive tables
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def post(self, request, pk):
+        applicant = get_object_or_404(Applicant.objects.only('id', 'created_by'), pk=pk)
+        self.check_object_permissions(request, applicant)
+        archive_applicant(applicant)
+
+        return Response(
+            {'message': 'Applicant archived successfully'},
+            status=status.HTTP_200_OK
+        )
+
+
+class ApplicantRestoreView(AuditActorMixin, ReplicaReadMixin, APIView):
+    """
+    POST: Move an archived applicant back to the active table
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def post(self, request, pk):
+        archived = get_object_or_404(ArchivedApplicant.objects.only('id', 'created_by'), pk=pk)
+        self.check_object_permissions(request, archived)
+        applicant = restore_applicant(archived)
 
         return Response(
             {
-                "total_applicants": total,
-                "this_month": this_month,
-                "completed_applications": completed,
-                "pending_applications": pending,
-            }
-        )
\ No newline at end of file
+                'message': 'Applicant restored successfully',
+                'data': ApplicantSerializer(applicant, context={'request': request}).data
+            },
+            status=status.HTTP_200_OK
+        )
+
+
+class ApplicantHistoryView(APIView):
+    """
+    GET: Field-level change history of an applicant and its academic
+    records, newest first
+
+    Query params: limit (default 50, max 500), offset. Works for archived
+    and deleted applicants too. Entries are written in batches, so a change
+    can take up to AUDIT_FLUSH_SECONDS to appear; reads go to the primary
+    so replica lag does not add to that.
+    """
+    permission_classes = [IsAdminOrOwner]
+
+    def get_owner_record(self, pk):
+        """Anything carrying the applicant's created_by_id, or None."""
+        return (
+            Applicant.objects.only('created_by').filter(pk=pk).first()
+            or ArchivedApplicant.objects.only('created_by').filter(pk=pk).first()
+            or ApplicantTombstone.objects.filter(applicant_id=pk).order_by('-deleted_at').first()
+        )
+
+    def get(self, request, pk):
+        try:
+            limit = min(int(request.query_params.get('limit', 50)), 500)
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
+            return Response(
+                {'error': 'limit and offset must be integers'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        record = self.get_owner_record(pk)
+        if record is None:
+            raise Http404
+        self.check_object_permissions(request, record)
+
+        entries = list(AuditEntry.objects.filter(applicant_id=pk).order_by('-created_at', '-id')[offset:offset + limit])
+        actors = {
+            user['id']: user
+            for user in User.objects.filter(id__in={entry.actor_id for entry in entries}).values('id', 'email', 'full_name')
+        }
+
+        return Response({
+            'results': [
+                {
+                    'id': entry.id,
+                    'object_type': entry.object_type,
+                    'object_id': entry.object_id,
+                    'action': entry.action,
+                    'changes': entry.changes,
+                    'actor': actors.get(entry.actor_id),
+                    'created_at': entry.created_at,
+                }
+                for entry in entries
+            ]
+        }, status=status.HTTP_200_OK)
+
+
+class AnalyticsView(ReplicaReadMixin, APIView):
+    permission_classes = [IsAdminOrOwner]
+
+    def get(self, request):
+        return Response(get_analytics(include_archived(request.query_params), request.user))
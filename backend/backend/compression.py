@@ -0,0 +1,203 @@
+"""
+Response compression with brotli/gzip negotiation.
+
+Replaces `GZipMiddleware`: the encoding is picked from the request's
+`Accept-Encoding` q-values, preferring brotli when the `brotli` package is
+installed. Responses smaller than `COMPRESSION_MIN_SIZE`, already encoded,
+partial (206) or of an already-compressed type (`COMPRESSION_EXCLUDED_TYPES`,
+e.g. PDFs) are passed through untouched.
+
+Streaming responses, sync or async, are compressed chunk by chunk with a
+flush after every chunk, so each chunk reaches the client as soon as it is
+produced; the event stream keeps working compressed.
+
+HTML is excluded by default: the admin and the browsable API render CSRF
+tokens next to reflected request input, which compression would expose to
+BREACH. Brotli has no filename field to pad the way `GZipMiddleware` does,
+so those pages are sent uncompressed instead. JSON API responses carry no
+such secrets; authentication is a bearer token in a request header.
+"""
+import zlib
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+from backend import metrics
+
+SUPPORTED_ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def parse_accept_encoding(header):
+    """Return {coding: q} for an Accept-Encoding header."""
+    accepted = {}
+    for part in header.split(','):
+        coding, _, params = part.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def choose_encoding(header):
+    """Pick the best supported encoding the client accepts, or None."""
+    accepted = parse_accept_encoding(header)
+    best, best_q = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        q = accepted.get(coding, accepted.get('*', 0.0))
+        # ties go to the earlier (better) coding
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+class Compressor:
+    """
+    Incremental compressor for one response body. `level` defaults to
+    `COMPRESSION_BROTLI_QUALITY` / `COMPRESSION_GZIP_LEVEL`.
+    """
+
+    def __init__(self, encoding, level=None):
+        self.encoding = encoding
+        if encoding == 'br':
+            quality = settings.COMPRESSION_BROTLI_QUALITY if level is None else level
+            self._obj = brotli.Compressor(quality=quality)
+        else:
+            level = settings.COMPRESSION_GZIP_LEVEL if level is None else level
+            # wbits 16 + MAX_WBITS writes a gzip header and trailer
+            self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data):
+        if self.encoding == 'br':
+            return self._obj.process(data)
+        return self._obj.compress(data)
+
+    def flush(self):
+        if self.encoding == 'br':
+            return self._obj.flush()
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self):
+        return self._obj.finish() if self.encoding == 'br' else self._obj.flush()
+
+
+def compress_bytes(data, encoding):
+    compressor = Compressor(encoding)
+    return compressor.compress(data) + compressor.finish()
+
+
+def _compress_chunks(chunks, encoding):
+    compressor = Compressor(encoding)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def _compress_chunks_async(chunks, encoding):
+    compressor = Compressor(encoding)
+    async for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def is_excluded_type(content_type):
+    content_type = content_type.split(';')[0].strip().lower()
+    return any(
+        content_type.startswith(excluded) if excluded.endswith('/') else content_type == excluded
+        for excluded in settings.COMPRESSION_EXCLUDED_TYPES
+    )
+
+
+class CompressionMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.get_response(request)
+        return self.process_response(request, response)
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if not response.streaming and len(response.content) >= settings.COMPRESSION_MIN_SIZE:
+            # compressing a whole body is CPU work: keep it off the event loop
+            return await sync_to_async(self.process_response, thread_sensitive=False)(request, response)
+        # streams are only wrapped here; their chunks are compressed as sent
+        return self.process_response(request, response)
+
+    def process_response(self, request, response):
+        if (
+            response.status_code < 200
+            or response.status_code in (204, 206, 304)
+            or response.has_header('Content-Encoding')
+            or is_excluded_type(response.get('Content-Type', ''))
+        ):
+            return response
+
+        if response.streaming:
+            try:
+                length = int(response.get('Content-Length'))
+            except (TypeError, ValueError):
+                length = None
+            if length is not None and length < settings.COMPRESSION_MIN_SIZE:
+                return response
+        elif len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        encoding = choose_encoding(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = _compress_chunks_async(response.streaming_content, encoding)
+            else:
+                response.streaming_content = _compress_chunks(response.streaming_content, encoding)
+            # the compressed size is only known once the stream ends
+            del response.headers['Content-Length']
+        else:
+            original_size = len(response.content)
+            compressed = compress_bytes(response.content, encoding)
+            if len(compressed) >= original_size:
+                return response
+            response.content = compressed
+            response.headers['Content-Length'] = str(len(compressed))
+            metrics.incr('compression.bytes_saved', original_size - len(compressed))
+
+        # a compressed body is no longer byte-identical to the strong ETag
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = encoding
+        metrics.incr(f'compression.{encoding}')
+        return response
@@ -0,0 +1,207 @@
+"""
+A thread-safe pool of psycopg2 connections, one per database alias per
+process (see backend.db.base).
+"""
+import collections
+import os
+import threading
+import time
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    pass
+
+
+class _Waiter:
+    """A getconn call queued for a connection or a free slot."""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.entry = None
+        self.reserved = False
+
+
+class ConnectionPool:
+    """
+    Holds between `min_size` and `max_size` connections. `getconn` waits up
+    to `timeout` seconds for one to be free; idle connections above
+    `min_size` are closed after `max_idle` seconds, and every connection is
+    replaced after `max_lifetime` seconds. A connection idle for longer than
+    `check_after` seconds is tested with `SELECT 1` before it is handed out.
+    """
+
+    def __init__(self, name, min_size=1, max_size=10, timeout=5.0,
+                 max_idle=300.0, max_lifetime=3600.0, check_after=30.0):
+        self.name = name
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.check_after = check_after
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        # (connection, returned_at); the most recently returned is reused first
+        # so surplus connections go idle and get closed
+        self._idle = collections.deque()
+        # served first come, first served: a returned connection is handed
+        # straight to the oldest waiter, so new callers cannot jump the queue
+        self._waiters = collections.deque()
+        self._opened_at = {}
+        self._size = 0
+        self._stats = collections.Counter()
+
+    def getconn(self, connect):
+        """
+        Return a free connection, opening one with `connect()` if the pool is
+        not full. Raises PoolTimeout when none frees up in time.
+        """
+        start = time.monotonic()
+        while True:
+            conn, returned_at = self._take(start + self.timeout)
+            if conn is None:
+                conn = self._open(connect)
+            elif not self._usable(conn, returned_at):
+                self._discard(conn)
+                continue
+            with self._lock:
+                self._stats['requests'] += 1
+                self._stats['wait_ms'] += int((time.monotonic() - start) * 1000)
+            return conn
+
+    def putconn(self, conn):
+        """Give a connection back, rolling back anything left open."""
+        if os.getpid() != self.pid:
+            # opened before a fork: the parent still owns the socket
+            return
+        if conn.closed:
+            self._discard(conn)
+            return
+        status = conn.get_transaction_status()
+        if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+            self._discard(conn)
+            return
+        if status != extensions.TRANSACTION_STATUS_IDLE:
+            try:
+                conn.rollback()
+            except psycopg2.Error:
+                self._discard(conn)
+                return
+
+        now = time.monotonic()
+        with self._lock:
+            if self._waiters:
+                waiter = self._waiters.popleft()
+                waiter.entry = (conn, now)
+                waiter.event.set()
+                return
+            self._idle.append((conn, now))
+            expired = self._expired_idle(now)
+        for old in expired:
+            self._discard(old)
+
+    def fill(self, connect):
+        """Open connections with `connect()` until `min_size` are held."""
+        while True:
+            with self._lock:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+            self.putconn(self._open(connect))
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'waiting': len(self._waiters),
+                'min_size': self.min_size,
+                'max_size': self.max_size,
+                **self._stats,
+            }
+
+    def _take(self, deadline):
+        """(idle connection, returned_at), or (None, None) with a slot reserved."""
+        with self._lock:
+            if self._idle and not self._waiters:
+                return self._idle.pop()
+            if self._size < self.max_size:
+                self._size += 1
+                return None, None
+            waiter = _Waiter()
+            self._waiters.append(waiter)
+
+        waiter.event.wait(max(deadline - time.monotonic(), 0))
+        with self._lock:
+            # served between the timeout and taking the lock still counts
+            if waiter.entry is not None:
+                return waiter.entry
+            if waiter.reserved:
+                return None, None
+            self._waiters.remove(waiter)
+            self._stats['timeouts'] += 1
+        raise PoolTimeout(
+            f"No connection available in pool '{self.name}' within {self.timeout}s "
+            f"({self.max_size} in use)"
+        )
+
+    def _release_slot(self):
+        """A connection went away: let the oldest waiter open a new one."""
+        if self._waiters:
+            waiter = self._waiters.popleft()
+            waiter.reserved = True
+            waiter.event.set()
+        else:
+            self._size -= 1
+
+    def _open(self, connect):
+        try:
+            conn = connect()
+        except Exception:
+            with self._lock:
+                self._release_slot()
+            raise
+        with self._lock:
+            self._opened_at[conn] = time.monotonic()
+            self._stats['connections_opened'] += 1
+        return conn
+
+    def _usable(self, conn, returned_at):
+        now = time.monotonic()
+        if conn.closed or now - self._opened_at.get(conn, now) > self.max_lifetime:
+            return False
+        if now - returned_at > self.check_after:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute('SELECT 1')
+                if not conn.autocommit:
+                    conn.rollback()
+            except psycopg2.Error:
+                return False
+        return True
+
+    def _expired_idle(self, now):
+        """Pop idle connections above min_size unused for max_idle seconds."""
+        expired = []
+        while (
+            self._idle
+            and self._size - len(expired) > self.min_size
+            and now - self._idle[0][1] > self.max_idle
+        ):
+            expired.append(self._idle.popleft()[0])
+        return expired
+
+    def _discard(self, conn):
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+        with self._lock:
+            self._opened_at.pop(conn, None)
+            self._stats['connections_closed'] += 1
+            self._release_slot()
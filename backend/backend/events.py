@@ -0,0 +1,150 @@
+"""
+Publish/subscribe fan-out for server-sent events.
+
+Publishers (signal handlers, views) run in sync code on any thread and call
+`get_broker().publish(event, data)`. Each open event stream holds a
+`Subscription` whose bounded queue lives on the ASGI event loop.
+
+Backpressure: a subscriber that cannot keep up (its queue is full) has its
+backlog dropped and receives a single `resync` event instead, telling the
+client to refetch rather than replay. Publishers never block on a slow
+client.
+
+`InProcessBroker` only reaches streams served by the same process. With more
+than one worker set `EVENT_BROKER = 'backend.events.RedisBroker'`, which
+relays every event through a Redis pub/sub channel to all workers.
+"""
+import asyncio
+import itertools
+import json
+import logging
+import threading
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from backend import metrics
+
+logger = logging.getLogger(__name__)
+
+RESYNC_EVENT = 'resync'
+
+
+class Subscription:
+
+    def __init__(self, maxsize):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize)
+
+    def push(self, message):
+        """Queue `message` from any thread."""
+        try:
+            self.loop.call_soon_threadsafe(self._deliver, message)
+        except RuntimeError:
+            # the stream's event loop is already closed
+            pass
+
+    def _deliver(self, message):
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            message = {'id': message['id'], 'event': RESYNC_EVENT, 'data': {}}
+            metrics.incr('events.overflow')
+        self.queue.put_nowait(message)
+
+    async def get(self):
+        return await self.queue.get()
+
+
+class InProcessBroker:
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, maxsize=None):
+        """Call from the event loop that will consume the subscription."""
+        subscription = Subscription(maxsize or settings.EVENT_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    def publish(self, event, data):
+        self.fanout(event, data)
+
+    def fanout(self, event, data):
+        message = {'id': next(self._ids), 'event': event, 'data': data}
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscription in subscribers:
+            subscription.push(message)
+        metrics.incr('events.published')
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Relays events between workers through Redis pub/sub. Each process runs
+    one listener thread, started with its first subscriber.
+    """
+    channel = 'events'
+
+    def __init__(self):
+        super().__init__()
+        import redis
+
+        self._redis = redis.Redis.from_url(settings.EVENT_BROKER_URL)
+        self._listener = None
+
+    def has_subscribers(self):
+        # other workers may have listeners
+        return True
+
+    def subscribe(self, maxsize=None):
+        subscription = super().subscribe(maxsize)
+        with self._lock:
+            if self._listener is None or not self._listener.is_alive():
+                self._listener = threading.Thread(target=self._listen, name='event-listener', daemon=True)
+                self._listener.start()
+        return subscription
+
+    def publish(self, event, data):
+        try:
+            self._redis.publish(self.channel, json.dumps({'event': event, 'data': data}))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Could not publish %s event: %s", event, exc)
+
+    def _listen(self):
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self.channel)
+        try:
+            for message in pubsub.listen():
+                try:
+                    payload = json.loads(message['data'])
+                except (TypeError, ValueError):
+                    continue
+                self.fanout(payload['event'], payload['data'])
+        except Exception:  # noqa: BLE001
+            logger.exception("Event listener stopped")
+        finally:
+            pubsub.close()
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.EVENT_BROKER)()
+    return _broker
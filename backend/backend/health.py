@@ -0,0 +1,149 @@
+"""
+Liveness and readiness probes for the load balancer.
+
+    /health/live/   200 whenever the worker can answer at all
+    /health/ready/  200 when the database, cache and file storage answer,
+                    503 with the failing checks otherwise
+
+`HealthCheckMiddleware` sits first in MIDDLEWARE and answers both paths
+itself, so probes skip CORS, sessions, CSRF, authentication and host
+validation (load balancers probe by IP). Every middleware is async capable
+(see backend/tests.py), so under uvicorn liveness is answered on the event
+loop and never queues behind a slow request's thread.
+
+Readiness results are kept for `READINESS_CACHE_SECONDS`: one probe runs
+the checks while concurrent ones get the previous result, so a slow storage
+endpoint cannot pile up probes.
+"""
+import logging
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import connections
+from django.http import JsonResponse
+
+from backend import metrics
+
+logger = logging.getLogger(__name__)
+
+LIVE_PATH = '/health/live/'
+READY_PATH = '/health/ready/'
+
+
+def check_database():
+    for alias in connections:
+        with connections[alias].cursor() as cursor:
+            cursor.execute('SELECT 1')
+
+
+def check_cache():
+    cache.set('health:ping', 1, timeout=60)
+    if cache.get('health:ping') != 1:
+        raise RuntimeError("cache did not return the value just written")
+
+
+def check_storage():
+    # a missing key is fine; unreachable storage or bad credentials raise
+    default_storage.exists('health/ping')
+
+
+CHECKS = {
+    'database': check_database,
+    'cache': check_cache,
+    'storage': check_storage,
+}
+
+
+class Readiness:
+    """Runs the enabled checks at most once per `READINESS_CACHE_SECONDS`."""
+
+    def __init__(self):
+        self._result = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def result(self):
+        """(ready, {check: {status, ms[, error]}}), cached or freshly run."""
+        if self._result is not None and time.monotonic() - self._checked_at < settings.READINESS_CACHE_SECONDS:
+            return self._result
+        # the first probe in waits for the checks; later ones get the stale result
+        if not self._lock.acquire(blocking=self._result is None):
+            return self._result
+        try:
+            if self._result is None or time.monotonic() - self._checked_at >= settings.READINESS_CACHE_SECONDS:
+                self._result = self._run()
+                self._checked_at = time.monotonic()
+            return self._result
+        finally:
+            self._lock.release()
+
+    def _run(self):
+        results = {}
+        for name in settings.READINESS_CHECKS:
+            start = time.perf_counter()
+            try:
+                CHECKS[name]()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Readiness check %s failed: %s", name, exc)
+                results[name] = {'status': 'error', 'error': str(exc)}
+            else:
+                results[name] = {'status': 'ok'}
+            results[name]['ms'] = round((time.perf_counter() - start) * 1000, 1)
+        ready = all(check['status'] == 'ok' for check in results.values())
+        if not ready:
+            metrics.incr('health.not_ready')
+        return ready, results
+
+
+readiness = Readiness()
+metrics.register_collector('readiness', lambda: readiness._result and readiness._result[1])
+
+
+def _response(data, status=200):
+    response = JsonResponse(data, status=status)
+    response['Cache-Control'] = 'no-store'
+    return response
+
+
+def live(request):
+    return _response({'status': 'ok'})
+
+
+def ready(request):
+    # connections opened by the checks are released by request_finished,
+    # as for any other request
+    is_ready, checks = readiness.result()
+    return _response({'status': 'ok' if is_ready else 'unavailable', 'checks': checks}, status=200 if is_ready else 503)
+
+
+class HealthCheckMiddleware:
+    """Answer the health probes before any other middleware runs."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if request.path == LIVE_PATH:
+            return live(request)
+        if request.path == READY_PATH:
+            return ready(request)
+        return self.get_response(request)
+
+    async def __acall__(self, request):
+        if request.path == LIVE_PATH:
+            return live(request)
+        if request.path == READY_PATH:
+            # database connections are thread-bound: run where sync views run
+            return await sync_to_async(ready, thread_sensitive=True)(request)
+        return await self.get_response(request)
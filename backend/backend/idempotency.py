@@ -0,0 +1,152 @@
+"""
+`Idempotency-Key` support for retried writes.
+
+A client sends the same unique key (e.g. a UUID) with every retry of one
+logical request. The first request with a key does the work; its response
+(status and body, anything but a 5xx) is kept in the shared cache for
+`IDEMPOTENCY_TTL_SECONDS` and replayed, with `Idempotent-Replayed: true`,
+for every later request with that key from the same user (or, signed
+out, the same client IP) to the same endpoint. The key is checked before
+the view runs, so a replayed multipart upload is never stored again.
+Reusing a key with a different request body is a client error and gets a
+422 instead of someone else's response.
+
+A duplicate arriving while the first is still running waits up to
+`IDEMPOTENCY_WAIT_SECONDS` for its result. If it is still running after
+that, the duplicate gets a 409 and should retry later. A 5xx or crash stores
+nothing, so the next retry does the work again.
+"""
+import hashlib
+import hmac
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.uploadedfile import UploadedFile
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.throttling import BaseThrottle
+
+from backend import metrics
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+POLL_SECONDS = 0.1
+
+
+def _cache_key(request, key):
+    if request.user.is_authenticated:
+        scope = request.user.pk
+    else:
+        scope = 'anon-' + BaseThrottle().get_ident(request)
+    return f'idempotency:{scope}:{request.method}:{request.path}:{key}'
+
+
+def _fingerprint_value(value):
+    if isinstance(value, UploadedFile):
+        digest = hashlib.sha256()
+        for chunk in value.chunks():
+            digest.update(chunk)
+        value.seek(0)
+        return ['file', value.name, value.size, digest.hexdigest()]
+    return value
+
+
+def request_fingerprint(request):
+    """
+    Keyed hash of the parsed request body, so retries match however the
+    client encodes them (e.g. a new multipart boundary). Bodies carry
+    plaintext passwords (login, register), so the hash kept in the cache is
+    an HMAC under SECRET_KEY rather than one that can be brute-forced.
+    """
+    data = request.data
+    if hasattr(data, 'lists'):
+        data = {key: [_fingerprint_value(value) for value in values] for key, values in data.lists()}
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hmac.new(settings.SECRET_KEY.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+class IdempotencyMixin:
+    """
+    APIView mixin honouring `Idempotency-Key` on the methods listed in
+    `idempotent_methods`. Requests without the header are unaffected.
+    """
+    idempotent_methods = ('POST',)
+
+    def initial(self, request, *args, **kwargs):
+        # authentication, permissions and throttling run first
+        super().initial(request, *args, **kwargs)
+        self._idempotency_key = None
+
+        key = request.META.get(HEADER)
+        if not key or request.method not in self.idempotent_methods:
+            return
+        if len(key) > MAX_KEY_LENGTH:
+            raise ValidationError({'error': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters'})
+
+        cache_key = _cache_key(request, key)
+        fingerprint = request_fingerprint(request)
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+        while True:
+            stored = cache.get(cache_key)
+            if stored is not None:
+                if stored.get('fingerprint', fingerprint) != fingerprint:
+                    self._reject_mismatch(request)
+                    return
+                metrics.incr('idempotency.replayed')
+                response = Response(stored['data'], status=stored['status'])
+                response['Idempotent-Replayed'] = 'true'
+                self._respond_with(request, response)
+                return
+            if cache.add(cache_key + ':lock', fingerprint, timeout=settings.IDEMPOTENCY_LOCK_SECONDS):
+                self._idempotency_key = cache_key
+                self._idempotency_fingerprint = fingerprint
+                return
+            running = cache.get(cache_key + ':lock')
+            if running is not None and running != fingerprint:
+                self._reject_mismatch(request)
+                return
+            if time.monotonic() >= deadline:
+                metrics.incr('idempotency.conflicts')
+                response = Response(
+                    {'error': 'A request with this Idempotency-Key is still in progress'},
+                    status=status.HTTP_409_CONFLICT
+                )
+                response['Retry-After'] = str(max(settings.IDEMPOTENCY_WAIT_SECONDS, 1))
+                self._respond_with(request, response)
+                return
+            time.sleep(POLL_SECONDS)
+
+    def _reject_mismatch(self, request):
+        metrics.incr('idempotency.mismatched')
+        self._respond_with(request, Response(
+            {'error': 'This Idempotency-Key was already used with a different request body'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY
+        ))
+
+    def _respond_with(self, request, response):
+        # the view instance is per request: shadow the handler so the body is
+        # never parsed and the work is not repeated
+        setattr(self, request.method.lower(), lambda *args, **kwargs: response)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        cache_key = getattr(self, '_idempotency_key', None)
+        if cache_key is not None and response.status_code < 500:
+            cache.set(
+                cache_key,
+                {'status': response.status_code, 'data': response.data, 'fingerprint': self._idempotency_fingerprint},
+                timeout=settings.IDEMPOTENCY_TTL_SECONDS,
+            )
+        return response
+
+    def dispatch(self, request, *args, **kwargs):
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            cache_key = getattr(self, '_idempotency_key', None)
+            if cache_key is not None:
+                cache.delete(cache_key + ':lock')
+                self._idempotency_key = None
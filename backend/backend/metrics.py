@@ -0,0 +1,64 @@
+"""
+Lightweight application metrics.
+
+Counters live in the default cache so every worker adds to the same totals.
+Gauges that only make sense per process (pool sizes, in-flight requests, ...)
+are exposed through collectors registered with `register_collector`.
+"""
+import logging
+import threading
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'metrics:'
+NAMES_KEY = KEY_PREFIX + '__names__'
+
+_known_names = set()
+_collectors = {}
+_lock = threading.Lock()
+
+
+def _register_name(name):
+    """Remember a counter name so `snapshot` can find it later."""
+    if name in _known_names:
+        return
+    with _lock:
+        _known_names.add(name)
+        names = set(cache.get(NAMES_KEY) or ())
+        if name not in names:
+            names.add(name)
+            cache.set(NAMES_KEY, sorted(names), timeout=None)
+
+
+def incr(name, amount=1):
+    """Increment a shared counter. Never raises."""
+    key = KEY_PREFIX + name
+    try:
+        _register_name(name)
+        if not cache.add(key, amount, timeout=None):
+            cache.incr(key, amount)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("metrics: failed to increment %s: %s", name, exc)
+
+
+def register_collector(name, func):
+    """Register a callable returning a dict of per-process gauges."""
+    _collectors[name] = func
+
+
+def snapshot():
+    """Return all shared counters plus this process's collectors."""
+    names = cache.get(NAMES_KEY) or []
+    values = cache.get_many([KEY_PREFIX + name for name in names])
+    data = {
+        'counters': {name: values.get(KEY_PREFIX + name, 0) for name in names},
+        'gauges': {},
+    }
+    for name, func in _collectors.items():
+        try:
+            data['gauges'][name] = func()
+        except Exception as exc:  # noqa: BLE001
+            data['gauges'][name] = {'error': str(exc)}
+    return data
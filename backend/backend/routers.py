@@ -0,0 +1,80 @@
+"""
+Read-replica routing.
+
+Replicas are configured with `DATABASE_REPLICA_URLS` and become the
+`replica_0`, `replica_1`, ... aliases. Nothing is routed to them by default:
+a view opts in with `ReplicaReadMixin`, which sends the ORM reads of its
+GET/HEAD requests to a random replica.
+
+Read-your-writes: after a user's successful write through such a view, their
+reads stay on the primary for `DATABASE_REPLICA_STICKY_SECONDS`, long enough
+for replication to catch up. The marker lives in the shared cache so it
+holds across workers.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+from backend import metrics
+
+STICKY_KEY = 'db:sticky:{}'
+
+_read_alias = ContextVar('read_alias', default=None)
+
+
+class ReplicaRouter:
+    """Route reads to the replica chosen for the current request, if any."""
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # every alias holds the same data
+        return True
+
+
+def mark_sticky(user_id):
+    cache.set(STICKY_KEY.format(user_id), 1, timeout=settings.DATABASE_REPLICA_STICKY_SECONDS)
+
+
+def is_sticky(user_id):
+    return cache.get(STICKY_KEY.format(user_id)) is not None
+
+
+class ReplicaReadMixin:
+    """
+    APIView mixin: safe requests read from a replica unless the user wrote
+    recently; successful unsafe requests pin the user to the primary.
+    Authentication and permission checks always read from the primary.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._replica_token = None
+        if request.method not in SAFE_METHODS or not settings.DATABASE_REPLICAS:
+            return
+        if request.user.is_authenticated and is_sticky(request.user.pk):
+            metrics.incr('db.reads.sticky')
+            return
+        self._replica_token = _read_alias.set(random.choice(settings.DATABASE_REPLICAS))
+        metrics.incr('db.reads.replica')
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_replica_token', None)
+        if token is not None:
+            _read_alias.reset(token)
+            self._replica_token = None
+        elif (
+            request.method not in SAFE_METHODS
+            and settings.DATABASE_REPLICAS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            mark_sticky(request.user.pk)
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -12,7 +12,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 from datetime import timedelta
-from decouple import config
+from decouple import config, Csv
+from corsheaders.defaults import default_headers
 import os
 import dj_database_url
 from dotenv import load_dotenv
@@ -65,12 +66,22 @@ print(CORS_ALLOWED_ORIGINS)
 CORS_ALLOW_CREDENTIALS = config('CORS_ALLOW_CREDENTIALS', default=True)
 print(CORS_ALLOW_CREDENTIALS)
 
+# retried writes carry an Idempotency-Key (see backend/idempotency.py)
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key')
+CORS_EXPOSE_HEADERS = ['Idempotent-Replayed', 'Retry-After']
+
 CSRF_TRUSTED_ORIGINS = config('CSRF_TRUSTED_ORIGINS').split(',')
 print(CSRF_TRUSTED_ORIGINS)
                                                           
 MIDDLEWARE = [
+    # answers /health/live/ and /health/ready/ without the rest of the stack
+    'backend.health.HealthCheckMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    # after CORS so shed responses stay readable by the frontend
+    'backend.shedding.LoadSheddingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    # before anything else that reads or rewrites the response body
+    'backend.compression.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -82,11 +93,26 @@ MIDDLEWARE = [
 # REST Framework Settings
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # proxies in front of the app (Render's load balancer): client IPs for
+    # throttling come from the right-most untrusted X-Forwarded-For entry
+    'NUM_PROXIES': config('NUM_PROXIES', default=1, cast=int),
+    # picked by the Accept header; see backend/renderers.py
+    'DEFAULT_RENDERER_CLASSES': [
+        'backend.renderers.ORJSONRenderer',
+        'backend.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'backend.renderers.ORJSONParser',
+        'backend.renderers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
 ROOT_URLCONF = 'backend.urls'
@@ -112,17 +138,64 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# PostgreSQL connections come from a per-worker pool (backend/db) sized by
+# the URL's pool_min_size / pool_max_size / pool_timeout options; set
+# DATABASE_POOL=False for one persistent connection per thread instead
+DATABASE_POOL = config('DATABASE_POOL', default=True, cast=bool)
+
+
+def database_config(url):
+    database = dj_database_url.parse(url, conn_max_age=600, conn_health_checks=True)
+    if DATABASE_POOL and database['ENGINE'] == 'django.db.backends.postgresql':
+        # connections go back to the pool at the end of each request
+        database.update(ENGINE='backend.db', CONN_MAX_AGE=0, CONN_HEALTH_CHECKS=False)
+    elif 'OPTIONS' in database:
+        for option in [name for name in database['OPTIONS'] if name.startswith('pool_')]:
+            del database['OPTIONS'][option]
+    return database
+
+
 DATABASES = {
-    "default": dj_database_url.parse(
-        config("DATABASE_URL"),
-        conn_max_age=600,
-        conn_health_checks=True,
-    )
+    "default": database_config(config("DATABASE_URL"))
     # "default" : {
     #     "ENGINE": "django.db.backends.sqlite3",
     #     "NAME": BASE_DIR / "db.sqlite3",}
 }
 
+# Read replicas, as a comma separated list of database URLs. Views using
+# backend.routers.ReplicaReadMixin send their reads to them.
+DATABASE_REPLICAS = []
+for index, url in enumerate(config('DATABASE_REPLICA_URLS', default='', cast=Csv())):
+    alias = f'replica_{index}'
+    DATABASES[alias] = database_config(url)
+    DATABASES[alias]['TEST'] = {'MIRROR': 'default'}
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ['backend.routers.ReplicaRouter']
+
+# How long a user's reads stay on the primary after they write
+DATABASE_REPLICA_STICKY_SECONDS = config('DATABASE_REPLICA_STICKY_SECONDS', default=10, cast=int)
+
+# Cache
+# Throttle buckets and metrics must be shared by all workers, so production
+# should point CACHE_URL at Redis. Without it each process gets its own cache.
+
+CACHE_URL = config('CACHE_URL', default='')
+
+if CACHE_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': CACHE_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # # Smtp Email Configuration
 # EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
 # EMAIL_HOST = config('EMAIL_HOST', default='localhost')
@@ -156,6 +229,22 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# The first hasher is used for new hashes; on a successful login a password
+# stored with another hasher (or another work factor) is re-hashed with it.
+PASSWORD_HASHER = config('PASSWORD_HASHER', default='users.hashers.ConfigurablePBKDF2PasswordHasher')
+PASSWORD_HASH_ITERATIONS = config('PASSWORD_HASH_ITERATIONS', default=0, cast=int) or None
+
+PASSWORD_HASHERS = [PASSWORD_HASHER] + [
+    hasher for hasher in (
+        'users.hashers.ConfigurablePBKDF2PasswordHasher',
+        'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+        'django.contrib.auth.hashers.Argon2PasswordHasher',
+        'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+        'django.contrib.auth.hashers.ScryptPasswordHasher',
+    ) if hasher != PASSWORD_HASHER
+]
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
@@ -186,8 +275,121 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
     'AUTH_HEADER_TYPES': ('Bearer',),
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.RevocableTokenRefreshSerializer',
 }
 
+# Authenticated users are cached per access token (users/authentication.py)
+AUTH_USER_CACHE_SECONDS = config('AUTH_USER_CACHE_SECONDS', default=300, cast=int)
+
+# Revoked refresh tokens are checked against a per-process Bloom filter
+# (users/revocation.py) synced from the revoked_tokens table.
+REVOCATION_FILTER_CAPACITY = config('REVOCATION_FILTER_CAPACITY', default=200000, cast=int)
+REVOCATION_FILTER_ERROR_RATE = config('REVOCATION_FILTER_ERROR_RATE', default=0.001, cast=float)
+REVOCATION_SYNC_INTERVAL = config('REVOCATION_SYNC_INTERVAL', default=5, cast=int)
+REVOCATION_REBUILD_INTERVAL = config('REVOCATION_REBUILD_INTERVAL', default=3600, cast=int)
+
+# Token buckets for unauthenticated auth endpoints (see users/throttling.py).
+# Each scope is limited per client IP and per submitted email address.
+AUTH_THROTTLE_RATES = {
+    'login': {
+        'ip': config('LOGIN_THROTTLE_IP_RATE', default='30/min'),
+        'email': config('LOGIN_THROTTLE_EMAIL_RATE', default='5/min'),
+    },
+    'forgot_password': {
+        'ip': config('FORGOT_PASSWORD_THROTTLE_IP_RATE', default='10/min'),
+        'email': config('FORGOT_PASSWORD_THROTTLE_EMAIL_RATE', default='3/hour'),
+    },
+    'register': {
+        'ip': config('REGISTER_THROTTLE_IP_RATE', default='10/hour'),
+        'email': config('REGISTER_THROTTLE_EMAIL_RATE', default='3/hour'),
+    },
+}
+
+# Maximum number of ids accepted by applicants/batch/
+APPLICANT_BATCH_MAX_IDS = config('APPLICANT_BATCH_MAX_IDS', default=100, cast=int)
+
+# Maximum number of applicants changed by one applicants/bulk/ request
+APPLICANT_BULK_MAX_ITEMS = config('APPLICANT_BULK_MAX_ITEMS', default=1000, cast=int)
+
+# Minimum score (0-1) for a pair to be stored as a duplicate candidate
+DUPLICATE_SCORE_THRESHOLD = config('DUPLICATE_SCORE_THRESHOLD', default=0.55, cast=float)
+
+# Relative weights of the eligibility score components (see applicants.scoring)
+ELIGIBILITY_WEIGHTS = {
+    'overall': config('ELIGIBILITY_WEIGHT_OVERALL', default=0.4, cast=float),
+    'section_mean': config('ELIGIBILITY_WEIGHT_SECTION_MEAN', default=0.15, cast=float),
+    'section_min': config('ELIGIBILITY_WEIGHT_SECTION_MIN', default=0.15, cast=float),
+    'academic': config('ELIGIBILITY_WEIGHT_ACADEMIC', default=0.3, cast=float),
+}
+
+# Maximum k for applicants/top/
+APPLICANT_TOP_MAX = config('APPLICANT_TOP_MAX', default=500, cast=int)
+
+# applicants/changes/ page size and how long deletions stay visible to sync clients
+CHANGE_FEED_PAGE_SIZE = config('CHANGE_FEED_PAGE_SIZE', default=500, cast=int)
+CHANGE_FEED_MAX_PAGE_SIZE = config('CHANGE_FEED_MAX_PAGE_SIZE', default=2000, cast=int)
+CHANGE_FEED_TOMBSTONE_DAYS = config('CHANGE_FEED_TOMBSTONE_DAYS', default=30, cast=int)
+# rows changed more recently than this are held back until in-flight
+# transactions with an earlier updated_at have had time to commit
+CHANGE_FEED_SETTLE_SECONDS = config('CHANGE_FEED_SETTLE_SECONDS', default=2, cast=float)
+
+# Server-sent events (applicants/events/). Use backend.events.RedisBroker
+# when running more than one worker process.
+EVENT_BROKER = config('EVENT_BROKER', default='backend.events.InProcessBroker')
+EVENT_BROKER_URL = config('EVENT_BROKER_URL', default=CACHE_URL)
+# events buffered per client before it is told to resync
+EVENT_QUEUE_SIZE = config('EVENT_QUEUE_SIZE', default=100, cast=int)
+EVENT_HEARTBEAT_SECONDS = config('EVENT_HEARTBEAT_SECONDS', default=15, cast=float)
+EVENT_STREAM_MAX_SECONDS = config('EVENT_STREAM_MAX_SECONDS', default=300, cast=float)
+EVENT_RETRY_MS = config('EVENT_RETRY_MS', default=3000, cast=int)
+EVENT_ANALYTICS_DEBOUNCE = config('EVENT_ANALYTICS_DEBOUNCE', default=1.0, cast=float)
+
+# Applicants not updated for this many days are moved to the archive tables
+# by archive_applicants
+ARCHIVE_AFTER_DAYS = config('ARCHIVE_AFTER_DAYS', default=730, cast=int)
+
+# Applicant audit log (applicants.audit): queued entries are written once
+# this many are waiting or this many seconds after the first (0 = at commit)
+AUDIT_BATCH_SIZE = config('AUDIT_BATCH_SIZE', default=200, cast=int)
+AUDIT_FLUSH_SECONDS = config('AUDIT_FLUSH_SECONDS', default=2.0, cast=float)
+# entries older than this are deleted by prune_audit_log
+AUDIT_RETENTION_DAYS = config('AUDIT_RETENTION_DAYS', default=365, cast=int)
+
+# Idempotency-Key handling (backend.idempotency): how long results are
+# replayed, how long a duplicate waits for the in-flight request, and when an
+# abandoned in-flight marker expires
+IDEMPOTENCY_TTL_SECONDS = config('IDEMPOTENCY_TTL_SECONDS', default=86400, cast=int)
+IDEMPOTENCY_WAIT_SECONDS = config('IDEMPOTENCY_WAIT_SECONDS', default=10, cast=int)
+IDEMPOTENCY_LOCK_SECONDS = config('IDEMPOTENCY_LOCK_SECONDS', default=120, cast=int)
+
+# Response compression (backend.compression); brotli is used when installed
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_GZIP_LEVEL = config('COMPRESSION_GZIP_LEVEL', default=6, cast=int)
+COMPRESSION_BROTLI_QUALITY = config('COMPRESSION_BROTLI_QUALITY', default=4, cast=int)
+# types ending in '/' match the whole family; HTML (admin, browsable API)
+# carries CSRF tokens and stays uncompressed because of BREACH
+COMPRESSION_EXCLUDED_TYPES = config(
+    'COMPRESSION_EXCLUDED_TYPES',
+    default='text/html,application/pdf,application/zip,application/gzip,image/,audio/,video/',
+    cast=Csv(),
+)
+
+# How long a readiness result is reused, and what /health/ready/ checks
+READINESS_CACHE_SECONDS = config('READINESS_CACHE_SECONDS', default=5, cast=float)
+READINESS_CHECKS = config('READINESS_CHECKS', default='database,cache,storage', cast=Csv())
+
+# Load shedding (backend.shedding): per-worker in-flight limits by route
+# class (0 = no limit), and the upstream queueing latency above which
+# low-priority requests are refused
+LOAD_SHEDDING_ENABLED = config('LOAD_SHEDDING_ENABLED', default=True, cast=bool)
+LOAD_SHEDDING_LIMITS = {
+    'heavy': config('LOAD_SHEDDING_HEAVY_LIMIT', default=8, cast=int),
+    'upload': config('LOAD_SHEDDING_UPLOAD_LIMIT', default=4, cast=int),
+    'default': config('LOAD_SHEDDING_DEFAULT_LIMIT', default=64, cast=int),
+}
+LOAD_SHEDDING_QUEUE_TARGET_MS = config('LOAD_SHEDDING_QUEUE_TARGET_MS', default=500, cast=int)
+LOAD_SHEDDING_RETRY_AFTER = config('LOAD_SHEDDING_RETRY_AFTER', default=2, cast=int)
+
 FRONTEND_URL = config('FRONTEND_URL', default='http://localhost:3000')
 print(FRONTEND_URL)
 
@@ -206,10 +408,17 @@ AWS_SECRET_ACCESS_KEY = config("STORJ_SECRET_ACCESS_KEY")
 AWS_STORAGE_BUCKET_NAME = config("STORJ_BUCKET")
 AWS_S3_REGION_NAME = "us-1"
 AWS_DEFAULT_ACL = None
+# never reuse a key: the document cache, ETags and processing queue all
+# assume a stored name always holds the same bytes
+AWS_S3_FILE_OVERWRITE = False
 AWS_S3_OBJECT_PARAMETERS = {
     "CacheControl": "max-age=86400",
 }
 
+# Local LRU cache of documents served by applicants/<pk>/document/
+DOCUMENT_CACHE_DIR = config('DOCUMENT_CACHE_DIR', default=str(BASE_DIR / 'document_cache'))
+DOCUMENT_CACHE_MAX_BYTES = config('DOCUMENT_CACHE_MAX_BYTES', default=1024 * 1024 * 1024, cast=int)
+
 # logging
 import logging
 
@@ -0,0 +1,189 @@
+"""
+Load shedding: refuse expensive requests early instead of letting them
+queue until gunicorn times out.
+
+Each request is put in a route class (`ROUTE_CLASSES`):
+
+    critical  token refresh and health probes, always admitted
+    heavy     unpaginated applicant list, analytics, duplicates, PDF
+              documents and bulk writes (low priority)
+    upload    applicant create/update, which carry document uploads
+              (low priority)
+    default   everything else
+
+The worker tracks requests in flight per class. A request over its class's
+limit in `LOAD_SHEDDING_LIMITS` (per worker, 0 for none) gets a 503 with
+`Retry-After` before any other work is done. Low-priority classes are also
+shed while the smoothed queueing latency is above
+`LOAD_SHEDDING_QUEUE_TARGET_MS`; queueing latency is how long the request
+waited upstream, from the proxy's `X-Request-Start` header (e.g. nginx
+`proxy_set_header X-Request-Start "t=${msec}"`, which also overwrites any
+value sent by the client), so without that header only the in-flight
+limits apply.
+
+Per-class in-flight, admitted and shed counts and smoothed latencies are the
+`load_shedding` gauges; every shed request also counts
+`load_shedding.shed.<class>`.
+"""
+import re
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import JsonResponse
+
+from backend import metrics
+
+# (class, methods or None for any, path); the first match wins
+ROUTE_CLASSES = [
+    ('critical', None, re.compile(r'^/(api/token/refresh|health/live|health/ready)/$')),
+    ('heavy', {'GET'}, re.compile(r'^/applicants/((\d+/document|analytics|duplicates)/)?$')),
+    ('heavy', {'PATCH', 'DELETE'}, re.compile(r'^/applicants/bulk/$')),
+    ('upload', {'POST', 'PUT', 'PATCH'}, re.compile(r'^/applicants/(\d+/)?$')),
+]
+LOW_PRIORITY = {'heavy', 'upload'}
+
+# weight of the newest sample in the smoothed latencies
+SMOOTHING = 0.2
+# upstream delays above this are clock skew, not queueing
+MAX_QUEUE_SECONDS = 300
+
+
+def route_class(request):
+    for name, methods, pattern in ROUTE_CLASSES:
+        if (methods is None or request.method in methods) and pattern.match(request.path):
+            return name
+    return 'default'
+
+
+def queue_ms(request, now=None):
+    """Milliseconds since the proxy received the request, or None."""
+    header = request.META.get('HTTP_X_REQUEST_START', '')
+    try:
+        started = float(header.removeprefix('t='))
+    except ValueError:
+        return None
+    # seconds (nginx $msec), milliseconds or microseconds since the epoch
+    if started > 1e14:
+        started /= 1e6
+    elif started > 1e11:
+        started /= 1e3
+    waited = (now or time.time()) - started
+    if not 0 <= waited <= MAX_QUEUE_SECONDS:
+        return None
+    return waited * 1000
+
+
+def _smooth(average, sample):
+    return sample if average is None else average + SMOOTHING * (sample - average)
+
+
+class LoadShedder:
+    """Per-worker admission state shared by every request thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._classes = {}
+        self.queue_ms = None
+
+    def _stats(self, name):
+        if name not in self._classes:
+            self._classes[name] = {'in_flight': 0, 'admitted': 0, 'shed': 0, 'latency_ms': None, 'queue_ms': None}
+        return self._classes[name]
+
+    def admit(self, name, waited_ms=None):
+        """Count the request in and return None, or return why it is shed."""
+        with self._lock:
+            stats = self._stats(name)
+            if waited_ms is not None:
+                self.queue_ms = _smooth(self.queue_ms, waited_ms)
+                stats['queue_ms'] = _smooth(stats['queue_ms'], waited_ms)
+            reason = None
+            if name != 'critical':
+                limit = settings.LOAD_SHEDDING_LIMITS.get(name, 0)
+                if limit and stats['in_flight'] >= limit:
+                    reason = 'limit'
+                elif (
+                    name in LOW_PRIORITY and self.queue_ms is not None
+                    and self.queue_ms > settings.LOAD_SHEDDING_QUEUE_TARGET_MS
+                ):
+                    reason = 'queue'
+            if reason is not None:
+                stats['shed'] += 1
+                return reason
+            stats['in_flight'] += 1
+            stats['admitted'] += 1
+        return None
+
+    def release(self, name, elapsed_ms):
+        with self._lock:
+            stats = self._stats(name)
+            stats['in_flight'] -= 1
+            stats['latency_ms'] = _smooth(stats['latency_ms'], elapsed_ms)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'queue_ms': self.queue_ms,
+                'classes': {
+                    name: {**stats, 'limit': settings.LOAD_SHEDDING_LIMITS.get(name, 0)}
+                    for name, stats in self._classes.items()
+                },
+            }
+
+
+shedder = LoadShedder()
+metrics.register_collector('load_shedding', shedder.stats)
+
+
+def _shed_response(name, reason):
+    metrics.incr(f'load_shedding.shed.{name}')
+    response = JsonResponse(
+        {'error': 'The server is busy, please retry shortly'},
+        status=503,
+    )
+    response['Retry-After'] = str(settings.LOAD_SHEDDING_RETRY_AFTER)
+    response['X-Load-Shed'] = reason
+    return response
+
+
+class LoadSheddingMiddleware:
+    """Admit or shed each request by route class before the rest of the stack."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        if not settings.LOAD_SHEDDING_ENABLED:
+            return self.get_response(request)
+        name = route_class(request)
+        reason = shedder.admit(name, queue_ms(request))
+        if reason is not None:
+            return _shed_response(name, reason)
+        start = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            shedder.release(name, (time.perf_counter() - start) * 1000)
+
+    async def __acall__(self, request):
+        # decided on the event loop, before a thread is taken for the request
+        if not settings.LOAD_SHEDDING_ENABLED:
+            return await self.get_response(request)
+        name = route_class(request)
+        reason = shedder.admit(name, queue_ms(request))
+        if reason is not None:
+            return _shed_response(name, reason)
+        start = time.perf_counter()
+        try:
+            return await self.get_response(request)
+        finally:
+            shedder.release(name, (time.perf_counter() - start) * 1000)
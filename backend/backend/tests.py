@@ -0,0 +1,37 @@
+from django.core.handlers.asgi import ASGIHandler
+from django.test import AsyncClient, SimpleTestCase
+
+from backend.compression import CompressionMiddleware
+from backend.health import HealthCheckMiddleware
+from backend.shedding import LoadSheddingMiddleware
+
+
+def middleware_chain(handler):
+    """The middleware instances of a loaded handler, outermost first."""
+    chain = []
+    get_response = handler._middleware_chain
+    while True:
+        # convert_exception_to_response wraps each instance with functools.wraps
+        instance = getattr(get_response, '__wrapped__', get_response)
+        if not hasattr(instance, 'get_response'):
+            return chain
+        chain.append(instance)
+        get_response = instance.get_response
+
+
+class ASGIMiddlewareTests(SimpleTestCase):
+
+    def test_middleware_chain_runs_async(self):
+        with self.assertNoLogs('django.request', 'DEBUG'):
+            # Django logs every middleware it has to adapt to sync
+            chain = middleware_chain(ASGIHandler())
+
+        self.assertIsInstance(chain[0], HealthCheckMiddleware)
+        by_type = {type(instance): instance for instance in chain}
+        for middleware in (HealthCheckMiddleware, LoadSheddingMiddleware, CompressionMiddleware):
+            self.assertTrue(by_type[middleware].async_mode, middleware.__name__)
+
+    async def test_liveness_is_answered(self):
+        response = await AsyncClient().get('/health/live/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), {'status': 'ok'})
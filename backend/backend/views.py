@@ -0,0 +1,16 @@
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from backend import metrics
+
+
+class MetricsView(APIView):
+    """
+    GET: Shared counters and this worker's gauges (staff only)
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(metrics.snapshot(), status=status.HTTP_200_OK)
@@ -0,0 +1,83 @@
+"""
+Worker warm-up, run once per worker before it accepts traffic (see
+gunicorn.conf.py), so the first requests do not pay for imports, URL
+resolver setup, serializer field construction or database connects.
+"""
+import importlib
+import inspect
+import logging
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connections
+from django.urls import get_resolver
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+logger = logging.getLogger(__name__)
+
+WARM_MODULES = ('views', 'serializers', 'urls')
+
+
+def import_app_modules():
+    """Import the project apps' views, serializers and urls modules."""
+    modules = []
+    for app_config in apps.get_app_configs():
+        if not app_config.path.startswith(str(settings.BASE_DIR)):
+            continue
+        for name in WARM_MODULES:
+            try:
+                modules.append(importlib.import_module(f'{app_config.name}.{name}'))
+            except ModuleNotFoundError as exc:
+                if exc.name != f'{app_config.name}.{name}':
+                    raise
+    # builds the full resolver tree, importing every routed view
+    get_resolver().url_patterns
+    # renderer, parser and authentication classes are imported lazily
+    for name in ('DEFAULT_RENDERER_CLASSES', 'DEFAULT_PARSER_CLASSES', 'DEFAULT_AUTHENTICATION_CLASSES',
+                 'DEFAULT_PERMISSION_CLASSES', 'DEFAULT_THROTTLE_CLASSES'):
+        getattr(api_settings, name)
+    return modules
+
+
+def build_serializer_fields(modules):
+    """
+    Instantiate each serializer defined in `modules` and build its fields,
+    which loads model metadata and related-field caches.
+    """
+    built = 0
+    for module in modules:
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if not issubclass(cls, serializers.BaseSerializer) or cls.__module__ != module.__name__:
+                continue
+            try:
+                cls().fields
+            except Exception as exc:  # noqa: BLE001
+                logger.debug("Warm-up could not build %s: %s", cls.__qualname__, exc)
+                continue
+            built += 1
+    return built
+
+
+def open_connections():
+    """Fill each pooled database's connection pool up to its minimum size."""
+    for alias in connections:
+        connection = connections[alias]
+        if hasattr(connection, 'fill_pool'):
+            connection.fill_pool()
+
+
+def warm_up():
+    start = time.perf_counter()
+    modules = import_app_modules()
+    built = build_serializer_fields(modules)
+    try:
+        open_connections()
+    except Exception as exc:  # noqa: BLE001
+        # a database that is down should fail readiness, not the worker
+        logger.warning("Warm-up could not open database connections: %s", exc)
+    logger.info(
+        "Worker warmed up in %.0f ms: %d modules, %d serializers",
+        (time.perf_counter() - start) * 1000, len(modules), built,
+    )
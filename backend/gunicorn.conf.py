@@ -0,0 +1,7 @@
+# Read by gunicorn from the working directory (see render.yaml).
+
+
+def post_worker_init(worker):
+    # the app is loaded; the worker starts serving once this returns
+    from backend.warmup import warm_up
+    warm_up()
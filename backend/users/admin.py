@@ -7,22 +7,22 @@ User = get_user_model()
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
-    list_display = ('email', 'full_name', 'is_verified', 'is_staff', 'created_at')
-    list_filter = ('is_verified', 'is_staff', 'is_superuser', 'created_at')
+    list_display = ('email', 'full_name', 'role', 'is_verified', 'is_staff', 'created_at')
+    list_filter = ('role', 'is_verified', 'is_staff', 'is_superuser', 'created_at')
     search_fields = ('email', 'full_name', 'company_name', 'phone_no')
     ordering = ('-created_at',)
     
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
         ('Personal Info', {'fields': ('full_name', 'company_name', 'phone_no', )}),
-        ('Permissions', {'fields': ('is_active', 'is_staff', 'is_superuser', 'is_verified', 'groups', 'user_permissions')}),
+        ('Permissions', {'fields': ('role', 'is_active', 'is_staff', 'is_superuser', 'is_verified', 'groups', 'user_permissions')}),
         ('Important dates', {'fields': ('last_login', 'created_at', 'updated_at')}),
     )
     
     add_fieldsets = (
         (None, {
             'classes': ('wide',),
-            'fields': ('email', 'full_name', 'company_name', 'phone_no', 'password1', 'password2', 'is_staff', 'is_superuser'),
+            'fields': ('email', 'full_name', 'company_name', 'phone_no', 'password1', 'password2', 'role', 'is_staff', 'is_superuser'),
         }),
     )
     
@@ -0,0 +1,74 @@
+"""
+JWT authentication with the user cached per access token.
+
+`JWTAuthentication` loads the user row on every request. Here the fields
+authorization reads (`CACHED_FIELDS`: the role, used to scope applicant
+querysets, and the account flags) are cached under the token's jti until
+the token expires or `AUTH_USER_CACHE_SECONDS` passes, so an authenticated
+request normally makes no user query at all. The password hash and profile
+are never cached: a cached user has every other field deferred, loaded from
+the database on first access.
+
+Each user has a version number in the cache, bumped whenever the user is
+saved; cached entries from an older version are ignored, so role changes
+and deactivations take effect on the next request.
+"""
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import router
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from backend import metrics
+
+USER_KEY = 'auth:user_fields:{}'
+VERSION_KEY = 'auth:user_version:{}'
+
+CACHED_FIELDS = ('id', 'role', 'is_active', 'is_staff', 'is_superuser', 'is_verified')
+
+
+def invalidate_user(user_id):
+    """Make every cached entry for `user_id` stale."""
+    key = VERSION_KEY.format(user_id)
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def _cached_user(values):
+    """A user instance with only `values` loaded, the rest deferred."""
+    User = get_user_model()
+    names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(router.db_for_read(User), names, [values[name] for name in names])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+
+    def get_user(self, validated_token):
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if jti is None or user_id is None:
+            return super().get_user(validated_token)
+
+        user_key = USER_KEY.format(jti)
+        version_key = VERSION_KEY.format(user_id)
+        cached = cache.get_many([user_key, version_key])
+        version = cached.get(version_key, 0)
+
+        entry = cached.get(user_key)
+        if entry is not None and entry[0] == version:
+            metrics.incr('auth.user_cache.hit')
+            return _cached_user(entry[1])
+
+        metrics.incr('auth.user_cache.miss')
+        user = super().get_user(validated_token)
+
+        timeout = min(settings.AUTH_USER_CACHE_SECONDS, int(validated_token['exp'] - time.time()))
+        if timeout > 0:
+            cache.set(user_key, (version, {name: getattr(user, name) for name in CACHED_FIELDS}), timeout)
+        return user
@@ -0,0 +1,17 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class ConfigurablePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count taken from
+    `settings.PASSWORD_HASH_ITERATIONS`.
+
+    The algorithm name is unchanged, so existing hashes keep verifying. When
+    the configured count differs from a stored hash, `must_update` returns
+    True and Django re-hashes the password on the next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', None) or PBKDF2PasswordHasher.iterations
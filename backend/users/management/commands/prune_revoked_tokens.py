@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from users.models import RevokedToken
+
+
+class Command(BaseCommand):
+    help = "Delete revoked refresh tokens whose lifetime has already passed"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=10000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        now = timezone.now()
+        total = 0
+
+        while True:
+            ids = list(
+                RevokedToken.objects.filter(expires_at__lte=now)
+                .values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            deleted, _ = RevokedToken.objects.filter(id__in=ids).delete()
+            total += deleted
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {total} expired revoked tokens"))
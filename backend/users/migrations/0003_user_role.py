@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-19 06:23
+
+from django.db import migrations, models
+
+
+def promote_superusers(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    User.objects.filter(is_superuser=True).update(role='admin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='role',
+            field=models.CharField(choices=[('admin', 'Admin'), ('documentation_officer', 'Documentation Officer')], default='documentation_officer', max_length=32),
+        ),
+        migrations.RunPython(promote_superusers, migrations.RunPython.noop),
+    ]
@@ -16,6 +16,7 @@ class UserManager(BaseUserManager):
         extra_fields.setdefault('is_staff', True)
         extra_fields.setdefault('is_superuser', True)
         extra_fields.setdefault('is_verified', True)
+        extra_fields.setdefault('role', User.ADMIN)
         
         if extra_fields.get('is_staff') is not True:
             raise ValueError('Superuser must have is_staff=True')
@@ -26,12 +27,22 @@ class UserManager(BaseUserManager):
 
 
 class User(AbstractBaseUser, PermissionsMixin):
+    ADMIN = 'admin'
+    DOCUMENTATION_OFFICER = 'documentation_officer'
+
+    ROLE_CHOICES = [
+        (ADMIN, 'Admin'),
+        (DOCUMENTATION_OFFICER, 'Documentation Officer'),
+    ]
     
     email = models.EmailField(unique=True)
     full_name = models.CharField(max_length=255)
     company_name = models.CharField(max_length=255, blank=True, null=True)
     phone_no = models.CharField(max_length=32, blank=True, null=True)
     
+    # admins see every applicant, documentation officers only their own
+    role = models.CharField(max_length=32, choices=ROLE_CHOICES, default=DOCUMENTATION_OFFICER)
+
     is_verified = models.BooleanField(default=False)
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
@@ -46,8 +57,31 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return self.email
+
+    @property
+    def is_admin(self):
+        return self.role == self.ADMIN
     
     class Meta:
         db_table = 'users'
         verbose_name = 'User'
-        verbose_name_plural = 'Users'
\ No newline at end of file
+        verbose_name_plural = 'Users'
+
+class RevokedToken(models.Model):
+    """
+    A refresh token that may no longer be used (rotated out or logged out).
+
+    Rows are only needed until the token would have expired anyway; the
+    `prune_revoked_tokens` command removes them after that.
+    """
+    jti = models.CharField(max_length=255, unique=True)
+    expires_at = models.DateTimeField(db_index=True)
+    revoked_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return self.jti
+
+    class Meta:
+        db_table = 'revoked_tokens'
+        verbose_name = 'Revoked Token'
+        verbose_name_plural = 'Revoked Tokens'
@@ -0,0 +1,140 @@
+"""
+Revocation store for rotated refresh tokens.
+
+Each process keeps a Bloom filter of revoked JTIs, synced from the
+`RevokedToken` table every few seconds. A negative answer from the filter is
+definite, so the common case (a token that was never revoked) needs no query.
+A positive answer is confirmed against the database because Bloom filters
+allow false positives.
+"""
+import hashlib
+import logging
+import math
+import threading
+import time
+from datetime import datetime, timezone as dt_timezone
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from backend import metrics
+from .models import RevokedToken
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter over strings, stored in a bytearray."""
+
+    def __init__(self, capacity, error_rate):
+        capacity = max(capacity, 1)
+        self.size = int(-capacity * math.log(error_rate) / (math.log(2) ** 2)) or 8
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        # double hashing: h1 + i * h2 gives k independent-enough positions
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class RevocationStore:
+    """
+    Per-process view of the revoked token table.
+
+    New rows are pulled incrementally (by primary key) at most every
+    `REVOCATION_SYNC_INTERVAL` seconds. The filter is rebuilt from the live
+    rows every `REVOCATION_REBUILD_INTERVAL` seconds, or when it has grown
+    past its capacity, so pruned tokens eventually drop out of it.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._filter = None
+        self._last_id = 0
+        self._synced_at = 0
+        self._built_at = 0
+
+    @property
+    def capacity(self):
+        return settings.REVOCATION_FILTER_CAPACITY
+
+    def _rebuild(self):
+        bloom = BloomFilter(self.capacity, settings.REVOCATION_FILTER_ERROR_RATE)
+        last_id = 0
+        rows = RevokedToken.objects.filter(
+            expires_at__gt=timezone.now()
+        ).values_list('id', 'jti').order_by('id')
+        for pk, jti in rows.iterator(chunk_size=5000):
+            bloom.add(jti)
+            last_id = pk
+        self._filter = bloom
+        self._last_id = max(last_id, self._last_id)
+        self._built_at = time.monotonic()
+        logger.info("Rebuilt token revocation filter with %d entries", bloom.count)
+
+    def _pull(self):
+        rows = RevokedToken.objects.filter(id__gt=self._last_id).values_list('id', 'jti').order_by('id')
+        for pk, jti in rows.iterator(chunk_size=5000):
+            self._filter.add(jti)
+            self._last_id = pk
+
+    def sync(self, force=False):
+        now = time.monotonic()
+        if not force and self._filter is not None and now - self._synced_at < settings.REVOCATION_SYNC_INTERVAL:
+            return
+        with self._lock:
+            if (
+                force
+                or self._filter is None
+                or now - self._built_at > settings.REVOCATION_REBUILD_INTERVAL
+                or self._filter.count > self.capacity
+            ):
+                self._rebuild()
+            else:
+                self._pull()
+            self._synced_at = now
+
+    def is_revoked(self, jti):
+        self.sync()
+        if jti not in self._filter:
+            metrics.incr('revocation.filter_negative')
+            return False
+        metrics.incr('revocation.db_lookup')
+        return RevokedToken.objects.filter(jti=jti).exists()
+
+    def revoke(self, jti, exp):
+        """
+        Record `jti` as revoked until `exp` (a unix timestamp).
+
+        Returns False if it was already revoked, which makes a concurrent
+        replay of the same refresh token lose the race.
+        """
+        try:
+            with transaction.atomic():
+                RevokedToken.objects.create(
+                    jti=jti,
+                    expires_at=datetime.fromtimestamp(exp, tz=dt_timezone.utc),
+                )
+        except IntegrityError:
+            return False
+
+        if self._filter is not None:
+            with self._lock:
+                self._filter.add(jti)
+        return True
+
+
+revocation_store = RevocationStore()
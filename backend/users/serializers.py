@@ -1,6 +1,11 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+
+from .revocation import revocation_store
 
 User = get_user_model()
 
@@ -42,8 +47,8 @@ class UserLoginSerializer(serializers.Serializer):
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ('id', 'email', 'full_name', 'company_name', 'phone_no', 'is_verified', 'created_at')
-        read_only_fields = ('id', 'is_verified', 'created_at')
+        fields = ('id', 'email', 'full_name', 'company_name', 'phone_no', 'role', 'is_verified', 'created_at')
+        read_only_fields = ('id', 'role', 'is_verified', 'created_at')
 
 
 class ForgotPasswordSerializer(serializers.Serializer):
@@ -65,4 +70,30 @@ class ResetPasswordSerializer(serializers.Serializer):
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'email', 'full_name', 'is_verified']   # whatever you need
\ No newline at end of file
+        fields = ['id', 'email', 'full_name', 'role', 'is_verified']   # whatever you need
+        read_only_fields = ['id', 'role']
+
+
+class RevocableTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that rejects revoked refresh tokens and, when
+    rotation is on, revokes the presented token before issuing a new one.
+    """
+
+    def validate(self, attrs):
+        refresh = self.token_class(attrs['refresh'])
+        jti = refresh[api_settings.JTI_CLAIM]
+
+        if revocation_store.is_revoked(jti):
+            raise TokenError('Token is blacklisted')
+
+        if api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION:
+            # the unique insert also catches a replay that raced past the filter
+            if not revocation_store.revoke(jti, refresh['exp']):
+                raise TokenError('Token is blacklisted')
+
+        return super().validate(attrs)
+
+
+class LogoutSerializer(serializers.Serializer):
+    refresh = serializers.CharField(required=True)
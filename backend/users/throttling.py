@@ -0,0 +1,166 @@
+"""
+Token bucket throttles for the unauthenticated auth endpoints.
+
+Every bucket lives in the shared cache so all workers see the same state.
+Throttles run in `APIView.initial()`, i.e. before the view calls
+`authenticate()`, so rejected attempts never pay for a password hash.
+"""
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.redis import RedisCache
+from rest_framework.throttling import BaseThrottle
+
+from backend import metrics
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """
+    Parse a DRF style rate such as '5/min' into (capacity, refill per second).
+    """
+    num, period = rate.split('/')
+    capacity = int(num)
+    return capacity, capacity / PERIODS[period[0]]
+
+
+# Refill and take in one step on the Redis server. Returns {allowed, wait}
+# with wait as a string, since Lua numbers come back truncated to integers.
+CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local available = tonumber(state[1]) or capacity
+local updated_at = tonumber(state[2]) or now
+available = math.min(capacity, available + math.max(0, now - updated_at) * rate)
+local allowed = 0
+local wait = 0
+if available >= requested then
+    available = available - requested
+    allowed = 1
+else
+    wait = (requested - available) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(available), 'updated_at', tostring(now))
+redis.call('EXPIRE', KEYS[1], ARGV[5])
+return {allowed, tostring(wait)}
+"""
+
+_script = None
+# the local-memory cache is per process, so a process lock makes it atomic
+_local_lock = threading.Lock()
+
+
+class TokenBucket:
+    """
+    A token bucket stored in the cache as (tokens, last refill timestamp).
+
+    With Redis the refill and take run as one Lua script, so concurrent
+    attempts from every worker are counted exactly; the per-process
+    local-memory cache is updated under a lock.
+    """
+
+    def __init__(self, key, rate):
+        self.key = key
+        self.capacity, self.refill_rate = parse_rate(rate)
+        self.timeout = int(self.capacity / self.refill_rate) + 1
+
+    def consume(self, tokens=1):
+        """Take tokens from the bucket. Returns (allowed, seconds to wait)."""
+        if isinstance(caches['default'], RedisCache):
+            return self._consume_redis(tokens)
+        with _local_lock:
+            return self._consume_local(tokens)
+
+    def _consume_redis(self, tokens):
+        global _script
+        redis_cache = caches['default']
+        client = redis_cache._cache.get_client(write=True)
+        if _script is None:
+            _script = client.register_script(CONSUME_SCRIPT)
+        allowed, wait = _script(
+            keys=[redis_cache.make_and_validate_key(self.key)],
+            args=[self.capacity, self.refill_rate, time.time(), tokens, self.timeout],
+            client=client,
+        )
+        return bool(allowed), float(wait)
+
+    def _consume_local(self, tokens):
+        now = time.time()
+        available, updated_at = cache.get(self.key, (self.capacity, now))
+        available = min(self.capacity, available + (now - updated_at) * self.refill_rate)
+
+        if available < tokens:
+            wait = (tokens - available) / self.refill_rate
+            cache.set(self.key, (available, now), timeout=self.timeout)
+            return False, wait
+
+        cache.set(self.key, (available - tokens, now), timeout=self.timeout)
+        return True, 0
+
+
+class AuthRateThrottle(BaseThrottle):
+    """
+    Throttle an auth endpoint per client IP and per submitted email.
+
+    Rates come from `settings.AUTH_THROTTLE_RATES[scope]`, e.g.
+    {'ip': '20/min', 'email': '5/min'}.
+    """
+    scope = None
+
+    def __init__(self):
+        self.wait_seconds = None
+
+    def get_rates(self):
+        return settings.AUTH_THROTTLE_RATES.get(self.scope, {})
+
+    def get_buckets(self, request):
+        rates = self.get_rates()
+        buckets = []
+
+        if rates.get('ip'):
+            ident = self.get_ident(request)
+            buckets.append(('ip', TokenBucket(f'throttle:{self.scope}:ip:{ident}', rates['ip'])))
+
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if rates.get('email') and isinstance(email, str) and email.strip():
+            email = email.strip().lower()
+            buckets.append(('email', TokenBucket(f'throttle:{self.scope}:email:{email}', rates['email'])))
+
+        return buckets
+
+    def allow_request(self, request, view):
+        for kind, bucket in self.get_buckets(request):
+            allowed, wait = bucket.consume()
+            if not allowed:
+                self.wait_seconds = wait
+                metrics.incr(f'throttle.{self.scope}.{kind}.rejected')
+                logger.warning(
+                    "Throttled %s attempt by %s (retry in %.0fs)",
+                    self.scope, kind, wait,
+                )
+                return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class LoginRateThrottle(AuthRateThrottle):
+    scope = 'login'
+
+
+class ForgotPasswordRateThrottle(AuthRateThrottle):
+    scope = 'forgot_password'
+
+
+class RegisterRateThrottle(AuthRateThrottle):
+    scope = 'register'
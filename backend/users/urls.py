@@ -5,6 +5,7 @@ from .views import (ForgotPasswordView,
                     UpdateUserProfileView, 
                     VerifyEmailView, 
                     LoginView,
+                    LogoutView,
                     CurrentUserView,
                     ChangePasswordView,
                     )
@@ -13,6 +14,7 @@ urlpatterns = [
     path('register/', RegisterView.as_view(), name='register'),
     path('verify-email/<str:uidb64>/<str:token>/', VerifyEmailView.as_view(), name='verify-email'),
     path('login/', LoginView.as_view(), name='login'),
+    path('logout/', LogoutView.as_view(), name='logout'),
     path('forgot-password/', ForgotPasswordView.as_view(), name='forgot-password'),
     path('reset-password/<str:uidb64>/<str:token>/', ResetPasswordView.as_view(), name='reset-password'),
     path('update-profile/', UpdateUserProfileView.as_view(), name='update-profile'),
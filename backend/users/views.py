@@ -9,23 +9,33 @@ from django.contrib.auth.tokens import default_token_generator
 from django.core.mail import send_mail
 from django.conf import settings
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
 from users.utils import send_sendgrid_mail  
+from backend.idempotency import IdempotencyMixin
+from users.throttling import (
+    LoginRateThrottle,
+    ForgotPasswordRateThrottle,
+    RegisterRateThrottle,
+)
 
 from .serializers import (
     UserRegistrationSerializer, 
     UserLoginSerializer,
     UserSerializer,
     ForgotPasswordSerializer,
-    ResetPasswordSerializer
+    ResetPasswordSerializer,
+    LogoutSerializer,
 )
+from .revocation import revocation_store
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.generics import RetrieveAPIView
 
 User = get_user_model()
 
 
-class RegisterView(APIView):
+class RegisterView(IdempotencyMixin, APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [RegisterRateThrottle]
     
     def post(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
@@ -79,8 +89,9 @@ class UpdateUserProfileView(APIView):
     permission_classes = [IsAuthenticated]
     
     def put(self, request):
+        # the authenticated user only has its authorization fields loaded
         serializer = UserSerializer(
-            request.user,
+            User.objects.get(pk=request.user.pk),
             data=request.data,
             partial=True
         )
@@ -133,6 +144,8 @@ class VerifyEmailView(APIView):
 
 class LoginView(APIView):
     permission_classes = [AllowAny]
+    # rejects bursts before authenticate() pays for a password hash
+    throttle_classes = [LoginRateThrottle]
     
     def post(self, request):
         serializer = UserLoginSerializer(data=request.data)
@@ -170,8 +183,34 @@ class LoginView(APIView):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
 
+class LogoutView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = LogoutSerializer(data=request.data)
+
+        if serializer.is_valid():
+            try:
+                refresh = RefreshToken(serializer.validated_data['refresh'])
+            except TokenError:
+                return Response(
+                    {'error': 'Invalid or expired refresh token'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            revocation_store.revoke(refresh['jti'], refresh['exp'])
+
+            return Response(
+                {'message': 'Logged out successfully'},
+                status=status.HTTP_200_OK
+            )
+
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+
 class ForgotPasswordView(APIView):
     permission_classes = [AllowAny]
+    throttle_classes = [ForgotPasswordRateThrottle]
     
     def post(self, request):
         serializer = ForgotPasswordSerializer(data=request.data)
@@ -292,14 +331,14 @@ class CurrentUserView(RetrieveAPIView):
 
     def get_object(self):
         """Return the user attached to the incoming token."""
-        return self.request.user
+        return User.objects.get(pk=self.request.user.pk)
     
 
 class ChangePasswordView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        user = request.user
+        user = User.objects.get(pk=request.user.pk)
         current_password = request.data.get('current_password')
         new_password = request.data.get('new_password')
         confirm_password = request.data.get('confirm_password')
@@ -1,11 +1,11 @@
 "use client";
 
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { useForm } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import * as z from 'zod';
 import Link from 'next/link';
-import { authAPI } from '@/lib/api';
+import { authAPI, shouldRenewIdempotencyKey } from '@/lib/api';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
@@ -34,6 +34,8 @@ export default function RegisterPage() {
   const [registered, setRegistered] = useState(false);
   const [showPassword, setShowPassword] = useState(false);
   const [showConfirmPassword, setShowConfirmPassword] = useState(false);
+  // reused when a submission is retried after a network error or timeout
+  const idempotencyKey = useRef(crypto.randomUUID());
 
   const { register, handleSubmit, formState: { errors }, setValue, watch } = useForm<RegisterForm>({
     resolver: zodResolver(registerSchema),
@@ -42,10 +44,13 @@ export default function RegisterPage() {
   const onSubmit = async (data: RegisterForm) => {
     setLoading(true);
     try {
-      await authAPI.register(data);
+      await authAPI.register(data, idempotencyKey.current);
       setRegistered(true);
       toast.success('Registration successful!');
     } catch (error: any) {
+      if (shouldRenewIdempotencyKey(error)) {
+        idempotencyKey.current = crypto.randomUUID();
+      }
       const message = error.response?.data?.message || error.response?.data?.email?.[0] || 'Registration failed. Please try again.';
       toast.error(message);
     } finally {
@@ -1,11 +1,11 @@
 "use client";
 
-import { useState } from 'react';
+import { useRef, useState } from 'react';
 import { useForm, useFieldArray } from 'react-hook-form';
 import { zodResolver } from '@hookform/resolvers/zod';
 import * as z from 'zod';
 import { useRouter } from 'next/navigation';
-import { applicantAPI } from '@/lib/api';
+import { applicantAPI, shouldRenewIdempotencyKey } from '@/lib/api';
 import { Button } from '@/components/ui/button';
 import { Input } from '@/components/ui/input';
 import { Label } from '@/components/ui/label';
@@ -65,6 +65,9 @@ export default function AddApplicantPage() {
   const [currentStep, setCurrentStep] = useState(1);
   const [loading, setLoading] = useState(false);
   const [document, setDocument] = useState<File | null>(null);
+  // reused when a submission is retried after a network error or timeout,
+  // so the upload is not processed twice
+  const idempotencyKey = useRef(crypto.randomUUID());
 
   const { register, handleSubmit, formState: { errors }, control, setValue, watch, trigger } = useForm<ApplicantForm>({
     resolver: zodResolver(applicantSchema),
@@ -150,11 +153,14 @@ export default function AddApplicantPage() {
       // Append document
       formData.append('document', document);
 
-      await applicantAPI.create(formData);
+      await applicantAPI.create(formData, idempotencyKey.current);
       toast.success('Applicant added successfully!');
       router.push('/dashboard/applicants');
     } catch (error: any) {
-      const emailError = error.response.data.email[0];
+      if (shouldRenewIdempotencyKey(error)) {
+        idempotencyKey.current = crypto.randomUUID();
+      }
+      const emailError = error.response?.data?.email?.[0];
       const message = emailError || error.response?.data?.message || 'Failed to add applicant. Please try again.';
       toast.error(message);
     } finally {
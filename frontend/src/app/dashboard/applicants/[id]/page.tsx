@@ -162,6 +162,18 @@ export default function ApplicantDetailPage() {
     }
   };
 
+  const handleDownload = async () => {
+    try {
+      const response = await applicantAPI.getDocument(params.id as string);
+      const url = URL.createObjectURL(response.data);
+      window.open(url, '_blank', 'noopener,noreferrer');
+      setTimeout(() => URL.revokeObjectURL(url), 60000);
+    } catch (error) {
+      toast.error('Failed to download document');
+      console.error('Failed to download document:', error);
+    }
+  };
+
   const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
     const file = e.target.files?.[0];
     if (file) {
@@ -649,12 +661,10 @@ export default function ApplicantDetailPage() {
                       <p className="text-sm text-muted-foreground">PDF Document</p>
                     </div>
                   </div>
-                  <a href={applicant.document_url} target="_blank" rel="noopener noreferrer">
-                    <Button variant="outline">
-                      <Download className="h-4 w-4 mr-2" />
-                      Download
-                    </Button>
-                  </a>
+                  <Button variant="outline" onClick={handleDownload}>
+                    <Download className="h-4 w-4 mr-2" />
+                    Download
+                  </Button>
                 </div>
               ) : (
                 <p className="text-muted-foreground">No document uploaded</p>
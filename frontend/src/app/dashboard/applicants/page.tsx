@@ -1,8 +1,9 @@
 "use client";
 
-import { useEffect, useState } from 'react';
+import { useEffect, useRef, useState } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { applicantAPI } from '@/lib/api';
+import { useApplicantEvents } from '@/lib/hooks/use-applicant-events';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
@@ -47,6 +48,20 @@ export default function ApplicantsPage() {
     fetchApplicants();
   }, []);
 
+  // refetch (at most once a second) when applicants change elsewhere
+  const refetchTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
+  useApplicantEvents(({ event, data }) => {
+    if (event === 'applicant.deleted') {
+      setApplicants((current) => current.filter((a) => String(a.id) !== String(data.id)));
+    } else if (event.startsWith('applicant.') || event === 'resync') {
+      if (refetchTimer.current) return;
+      refetchTimer.current = setTimeout(() => {
+        refetchTimer.current = null;
+        fetchApplicants();
+      }, 1000);
+    }
+  });
+
   useEffect(() => {
     if (searchQuery.trim() === '') {
       setFilteredApplicants(applicants);
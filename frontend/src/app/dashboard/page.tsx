@@ -3,6 +3,7 @@
 import { useEffect, useState } from 'react';
 import { useAuth } from '@/contexts/AuthContext';
 import { applicantAPI } from '@/lib/api';
+import { useApplicantEvents } from '@/lib/hooks/use-applicant-events';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Users, FileCheck, Clock, TrendingUp } from 'lucide-react';
 import { Skeleton } from '@/components/ui/skeleton';
@@ -36,6 +37,14 @@ export default function DashboardPage() {
     fetchAnalytics();
   }, []);
 
+  // live counters pushed by the server
+  useApplicantEvents(({ event, data }) => {
+    if (event === 'analytics') {
+      setAnalytics(data);
+      setLoading(false);
+    }
+  });
+
   const stats = [
     {
       title: 'Total Applicants',
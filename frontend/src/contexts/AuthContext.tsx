@@ -11,6 +11,7 @@ interface User {
   email: string;
   company_name: string;
   phone_no: string;
+  role: 'admin' | 'documentation_officer';
   is_verified: boolean;
 }
 
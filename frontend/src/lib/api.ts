@@ -1,7 +1,7 @@
 import axios from 'axios';
 import { toast } from 'sonner';
 
-const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
+export const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
 // an instance of axios with interceptors for handling auth tokens
 const api = axios.create({
@@ -69,9 +69,22 @@ api.interceptors.response.use(
   }
 );
 
+// Retries of one logical write send the same key, so the server replays the
+// first result instead of doing the work twice (see backend/idempotency.py)
+const idempotencyHeaders = (key?: string) => (key ? { 'Idempotency-Key': key } : {});
+
+// A key must be replaced once the server has given a final answer for it;
+// keep it only when the request may not have gone through
+export const shouldRenewIdempotencyKey = (error: any) => {
+  const status = error?.response?.status;
+  return status !== undefined && status < 500 && status !== 409;
+};
+
 // Auth API
 export const authAPI = {
-  register: (data: any) => api.post('/api/user/register/', data),
+  register: (data: any, idempotencyKey?: string) => api.post('/api/user/register/', data, {
+    headers: idempotencyHeaders(idempotencyKey),
+  }),
   login: (data: any) => api.post('/api/user/login/', data),
   verifyEmail: (token: string) => api.get(`/api/user/verify-email/${token}/`),
   forgotPassword: (email: string) => api.post('/api/user/forgot-password/', { email }),
@@ -84,18 +97,26 @@ export const authAPI = {
 export const applicantAPI = {
 
   // create applicant with multipart/form-data
-  create: (data: FormData) => api.post('/applicants/', data, {
-    headers: { 'Content-Type': 'multipart/form-data' },
+  create: (data: FormData, idempotencyKey?: string) => api.post('/applicants/', data, {
+    headers: { 'Content-Type': 'multipart/form-data', ...idempotencyHeaders(idempotencyKey) },
   }),
 
   // fetch all applicants with optional query params
   getAll: (params?: any) => api.get('/applicants/', { params }),
   
   getById: (id: string) => api.get(`/applicants/${id}/`),
+
+  // fetch several applicants in one request, results keep the order of ids
+  getBatch: (ids: string[], params?: any) => api.get('/applicants/batch/', {
+    params: { ...params, ids: ids.join(',') },
+  }),
   update: (id: string, data: FormData) => api.put(`/applicants/${id}/`, data, {
     headers: { 'Content-Type': 'multipart/form-data' },
   }),
   delete: (id: string) => api.delete(`/applicants/${id}/`),
+
+  // download the applicant's document through the API (needs the auth header)
+  getDocument: (id: string) => api.get(`/applicants/${id}/document/`, { responseType: 'blob' }),
   getAnalytics: () => api.get('/applicants/analytics/'),
 };
 
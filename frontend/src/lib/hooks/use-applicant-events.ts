@@ -0,0 +1,63 @@
+import * as React from 'react';
+import { API_BASE_URL } from '@/lib/api';
+
+export interface ApplicantEvent {
+  event: string;
+  data: any;
+}
+
+// Subscribes to the server-sent event stream at /applicants/events/.
+// EventSource cannot send the Authorization header, so the stream is read
+// with fetch; it reconnects after the server's retry delay when it ends.
+export function useApplicantEvents(onEvent: (event: ApplicantEvent) => void) {
+  const handler = React.useRef(onEvent);
+  handler.current = onEvent;
+
+  React.useEffect(() => {
+    const controller = new AbortController();
+    let retryMs = 3000;
+
+    const dispatch = (block: string) => {
+      let event = 'message';
+      const data: string[] = [];
+      for (const line of block.split('\n')) {
+        if (line.startsWith('event:')) event = line.slice(6).trim();
+        else if (line.startsWith('data:')) data.push(line.slice(5).trim());
+        else if (line.startsWith('retry:')) retryMs = Number(line.slice(6)) || retryMs;
+      }
+      if (data.length) handler.current({ event, data: JSON.parse(data.join('\n')) });
+    };
+
+    const connect = async () => {
+      while (!controller.signal.aborted) {
+        try {
+          const response = await fetch(`${API_BASE_URL}/applicants/events/`, {
+            headers: { Authorization: `Bearer ${localStorage.getItem('access_token')}` },
+            signal: controller.signal,
+          });
+          if (response.ok && response.body) {
+            const reader = response.body.getReader();
+            const decoder = new TextDecoder();
+            let buffer = '';
+            for (;;) {
+              const { value, done } = await reader.read();
+              if (done) break;
+              buffer += decoder.decode(value, { stream: true });
+              let end;
+              while ((end = buffer.indexOf('\n\n')) !== -1) {
+                dispatch(buffer.slice(0, end));
+                buffer = buffer.slice(end + 2);
+              }
+            }
+          }
+        } catch (error) {
+          if (controller.signal.aborted) return;
+        }
+        await new Promise((resolve) => setTimeout(resolve, retryMs));
+      }
+    };
+
+    connect();
+    return () => controller.abort();
+  }, []);
+}